@@ -8,12 +8,16 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import argparse
 import os
+import sys
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from results_store import read_results
+
 
 def load_results(csv_path: str) -> pd.DataFrame:
-    """Load results CSV."""
-    df = pd.read_csv(csv_path)
+    """Load results CSV (or results store)."""
+    df = read_results(csv_path)
     return df
 
 
@@ -191,7 +195,7 @@ def plot_runtime_comparison(df: pd.DataFrame, output_dir: str):
 
 def main():
     parser = argparse.ArgumentParser(description="Analyze MCLP experimental results")
-    parser.add_argument('--input', type=str, required=True, help='Path to results CSV')
+    parser.add_argument('--input', type=str, required=True, help='Path to results CSV or .db store')
     parser.add_argument('--output', type=str, default='tables', help='Output directory')
     parser.add_argument('--figures', type=str, default='figures', help='Figures directory')
     args = parser.parse_args()
@@ -5,11 +5,14 @@ import argparse
 import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from results_store import read_results
+
 def generate_assets(csv_path):
     # Setup
     print(f"Reading results from: {csv_path}")
     try:
-        df = pd.read_csv(csv_path)
+        df = read_results(csv_path)
     except FileNotFoundError:
         print(f"Error: Could not find file {csv_path}")
         return
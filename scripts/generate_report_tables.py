@@ -7,6 +7,10 @@ import pandas as pd
 import numpy as np
 import argparse
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from results_store import read_results
 
 
 def format_table_latex(df: pd.DataFrame, caption: str, label: str) -> str:
@@ -223,7 +227,7 @@ def generate_table5_full_comparison(df: pd.DataFrame, output_dir: str):
 
 def main():
     parser = argparse.ArgumentParser(description="Generate formatted report tables")
-    parser.add_argument('--input', type=str, required=True, help='Results CSV file')
+    parser.add_argument('--input', type=str, required=True, help='Results CSV file or .db store')
     parser.add_argument('--output', type=str, default='tables', help='Output directory')
     args = parser.parse_args()
     
@@ -234,7 +238,7 @@ def main():
     print("="*70)
     
     # Load results
-    df = pd.read_csv(args.input)
+    df = read_results(args.input)
     
     # Generate all tables
     generate_table1_greedy_vs_cn(df, args.output)
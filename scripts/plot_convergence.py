@@ -8,50 +8,67 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import argparse
 import os
+import re
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from results_store import read_results
 
-def plot_convergence_ts(results_csv: str, output_dir: str):
+
+def load_traces(trace_dir: str) -> dict:
     """
-    Plot 1: Convergence curves for Tabu Search.
-    Shows iteration vs best objective for 2 instances.
+    Load TS iteration traces written by `run_mclp.py --trace-dir`.
+    Returns: {instance_name: {seed: DataFrame}}
     """
-    # Note: This requires storing iteration history
-    # For now, create a placeholder showing final results
+    pattern = re.compile(r'^(?P<instance>.+)_ts_seed(?P<seed>\d+)\.(?P<ext>csv|parquet)$')
+    traces = {}
     
-    df = pd.read_csv(results_csv)
-    df_ts = df[df['algorithm'] == 'tabu_search'].copy()
+    if not trace_dir or not os.path.isdir(trace_dir):
+        return traces
     
-    if len(df_ts) == 0:
-        print("[WARN]  No TS results found for convergence plot")
-        return
+    for filename in sorted(os.listdir(trace_dir)):
+        match = pattern.match(filename)
+        if not match:
+            continue
+        
+        path = os.path.join(trace_dir, filename)
+        if match.group('ext') == 'parquet':
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path)
+        
+        traces.setdefault(match.group('instance'), {})[int(match.group('seed'))] = df
+    
+    return traces
+
+
+def plot_convergence_ts(trace_dir: str, output_dir: str):
+    """
+    Plot 1: Convergence curves for Tabu Search.
+    Shows iteration vs best objective (one curve per seed) for 2 instances.
+    """
+    traces = load_traces(trace_dir)
     
-    # Group by instance
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    if len(traces) == 0:
+        print(f"[WARN]  No TS traces found in {trace_dir} for convergence plot")
+        print("    (Run: python src/run_mclp.py ... --algorithm ts --trace-dir <dir>)")
+        return
     
-    instances = df_ts['instance'].unique()[:2]  # Take first 2 instances
+    instances = sorted(traces)[:2]  # Take first 2 instances
+    fig, axes = plt.subplots(1, len(instances), figsize=(7 * len(instances), 5), squeeze=False)
     
     for idx, instance in enumerate(instances):
-        ax = axes[idx]
-        
-        df_inst = df_ts[df_ts['instance'] == instance]
-        
-        # Plot objective distribution across seeds
-        seeds = df_inst['seed'].values
-        objectives = df_inst['objective'].values
+        ax = axes[0][idx]
         
-        ax.plot(range(len(seeds)), objectives, marker='o', linewidth=2, markersize=6)
-        ax.axhline(y=objectives.mean(), color='r', linestyle='--', 
-                   label=f'Mean: {objectives.mean():.1f}', alpha=0.7)
-        ax.fill_between(range(len(seeds)), 
-                        objectives.mean() - objectives.std(),
-                        objectives.mean() + objectives.std(),
-                        alpha=0.2, color='red')
+        for seed, df in sorted(traces[instance].items()):
+            ax.step(df['iteration'], df['best_obj'], where='post',
+                    linewidth=1.5, alpha=0.8, label=f'Seed {seed}')
         
-        ax.set_xlabel('Run Index', fontsize=11)
+        ax.set_xlabel('Iteration', fontsize=11)
         ax.set_ylabel('Best Objective', fontsize=11)
         ax.set_title(f'TS Convergence: {os.path.basename(instance)}', 
                      fontsize=12, fontweight='bold')
-        ax.legend()
+        ax.legend(fontsize=8)
         ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
@@ -65,7 +82,7 @@ def plot_runtime_scaling(results_csv: str, output_dir: str):
     """
     Plot 2: Runtime scaling (|I|×|J| vs time) for all algorithms.
     """
-    df = pd.read_csv(results_csv)
+    df = read_results(results_csv)
     
     # Extract instance sizes from names
     def extract_size(instance_name):
@@ -127,8 +144,7 @@ def plot_coverage_vs_budget(results_csv: str, output_dir: str):
     """
     Plot 3: Coverage % vs Budget Utilization scatter for TS solutions.
     """
-    df = pd.read_csv(results_csv)
-    df_ts = df[df['algorithm'] == 'tabu_search'].copy()
+    df_ts = read_results(results_csv, algorithm='tabu_search').copy()
     
     if len(df_ts) == 0:
         print("[WARN]  No TS results for coverage plot")
@@ -169,8 +185,7 @@ def plot_parameter_sensitivity_heatmap(results_csv: str, output_dir: str):
     """
     Plot 4: Heatmap showing TS parameter sensitivity (tenure × intensification_freq).
     """
-    df = pd.read_csv(results_csv)
-    df_ts = df[df['algorithm'] == 'tabu_search'].copy()
+    df_ts = read_results(results_csv, algorithm='tabu_search').copy()
     
     # Try to identify parameter sweep runs
     # This requires parsing instance names or adding metadata
@@ -182,8 +197,10 @@ def plot_parameter_sensitivity_heatmap(results_csv: str, output_dir: str):
 
 def main():
     parser = argparse.ArgumentParser(description="Generate convergence and analysis plots")
-    parser.add_argument('--input', type=str, required=True, help='Results CSV file')
+    parser.add_argument('--input', type=str, required=True, help='Results CSV file or .db store')
     parser.add_argument('--output', type=str, default='figures', help='Output directory')
+    parser.add_argument('--traces', type=str, default='results/traces',
+                        help='Directory of TS iteration traces (from run_mclp.py --trace-dir)')
     args = parser.parse_args()
     
     # Create output directory
@@ -193,7 +210,7 @@ def main():
     print("="*70)
     
     # Generate plots
-    plot_convergence_ts(args.input, args.output)
+    plot_convergence_ts(args.traces, args.output)
     plot_runtime_scaling(args.input, args.output)
     plot_coverage_vs_budget(args.input, args.output)
     plot_parameter_sensitivity_heatmap(args.input, args.output)
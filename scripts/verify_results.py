@@ -1,10 +1,14 @@
 import pandas as pd
+import os
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+from results_store import read_results
+
 def verify(csv_path):
     print(f"🔎 Verifying: {csv_path}")
     try:
-        df = pd.read_csv(csv_path)
+        df = read_results(csv_path)
     except Exception as e:
         print(f"❌ CRITICAL: Could not read CSV. {e}")
         sys.exit(1)
@@ -53,8 +57,47 @@ def verify(csv_path):
     else:
         print("⚠️ WARNING: TS standard deviation is 0.0 everywhere. Did seeds work?")
 
+    # 4. Optimality Gaps (upper bounds from bounds.py / Lagrangian / MIP solvers)
+    if 'upper_bound' in df.columns and df['upper_bound'].notna().any():
+        print("\n📐 Bound Check:")
+        bounded = df[df['upper_bound'].notna()]
+        violations = bounded[bounded['objective'] > bounded['upper_bound'] + 1e-6]
+        if len(violations):
+            print("❌ CRITICAL: Objectives above their upper bound (invalid bound or solution):")
+            print(violations[['instance', 'algorithm', 'seed', 'objective', 'upper_bound']])
+        else:
+            print("✅ Logic Check: All objectives are within their upper bounds.")
+
+        # Tightest bound per instance, shared by all algorithms
+        tightest = bounded.groupby('instance')['upper_bound'].min()
+        best = df.groupby(['instance', 'algorithm'])['objective'].mean().unstack()
+        gaps = (1 - best.div(tightest, axis=0)).clip(lower=0) * 100
+        print("\nMean gap to the tightest bound per instance (%):")
+        print(gaps.round(3))
+
+    # 5. Ground Truth (certified optima from exact solvers run to completion)
+    exact = df[df['algorithm'].isin(['branch_and_bound', 'compact', 'benders'])]
+    if 'stop_reason' in df.columns:
+        exact = exact[exact['stop_reason'] == 'completed']
+    if len(exact):
+        print("\n🏁 Ground Truth Check:")
+        optimum = exact.groupby('instance')['objective'].max()
+        disagree = exact.groupby('instance')['objective'].nunique() > 1
+        if disagree.any():
+            print(f"❌ CRITICAL: Exact solvers disagree on: {disagree[disagree].index.tolist()}")
+        above = df[df['objective'] > df['instance'].map(optimum) + 1e-6]
+        if len(above):
+            print("❌ CRITICAL: Objectives above the certified optimum:")
+            print(above[['instance', 'algorithm', 'seed', 'objective']])
+        else:
+            print("✅ Logic Check: No objective exceeds the certified optimum.")
+        solved = df[df['instance'].isin(optimum.index)]
+        hit_rate = (solved['objective'] >= solved['instance'].map(optimum) - 1e-6).groupby(solved['algorithm']).mean() * 100
+        print("\nRuns reaching the optimum per algorithm (%):")
+        print(hit_rate.round(1))
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python scripts/verify_results.py <path_to_csv>")
+        print("Usage: python scripts/verify_results.py <path_to_csv_or_db>")
     else:
         verify(sys.argv[1])
\ No newline at end of file
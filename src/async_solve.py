@@ -0,0 +1,162 @@
+"""
+asyncio API for the solvers.
+
+solve() runs run_algorithm in an executor (threads by default) and yields
+events as an async iterator: one 'improvement' event per new best reported
+to the run's Termination (objective and incumbent facilities), then a final
+'result' event with the result dictionary. Setting the cancel event stops
+the run cooperatively; its result event then carries the best-so-far with
+stop_reason 'cancelled'. Closing the iterator (or cancelling its task)
+sets the event and waits for the solver to return, which happens at its
+next termination check (a running CBC solve finishes first). One event
+loop can drive many solves at once, each with its own time limit or
+absolute deadline:
+
+    async for event in solve(instance, 'ts', config, seed=42, time_limit=10):
+        if event['type'] == 'improvement':
+            print(event['elapsed'], event['objective'], event['facilities'])
+        else:
+            result = event['result']
+
+The solvers hold the GIL, so concurrent solves in threads share one core
+unless they use process pools themselves (ls workers, ts_islands). A
+ThreadPoolExecutor passed as `executor` bounds how many run at once (the
+progress callback cannot cross to a process pool). Greedy and CN report no
+improvements, only a result.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from typing import AsyncIterator, Callable, List, Optional
+
+from instance_loader import MCLPInstance
+from run_mclp import run_algorithm
+from experiment_runner import merge_config
+
+
+async def solve(
+    instance: MCLPInstance,
+    algorithm: str,
+    config: Optional[dict] = None,
+    seed: int = 42,
+    params: Optional[dict] = None,
+    time_limit: Optional[float] = None,
+    deadline: Optional[float] = None,
+    cancel: Optional[threading.Event] = None,
+    executor=None
+) -> AsyncIterator[dict]:
+    """
+    Run one algorithm and stream its progress.
+    
+    Args:
+        instance: Problem instance
+        algorithm: run_mclp algorithm name ('ts', 'ls', 'bnb', ...)
+        config: Base configuration (config.yaml; None = defaults)
+        seed: Random seed
+        params: Config sections merged over config (e.g. {'ts_params': {...}})
+        time_limit: Wall-clock seconds for the run
+        deadline: Absolute time.time() deadline (combined with time_limit)
+        cancel: threading.Event; once set the run stops with its best-so-far
+        executor: concurrent.futures executor (None = the loop's default)
+    
+    Yields:
+        {'type': 'improvement', 'objective', 'facilities', 'elapsed'} for
+        each new best (facilities sorted; None if the solver did not report them),
+        then {'type': 'result', 'result', 'elapsed'}. Solver exceptions are
+        raised from the iterator; closing it early waits for the solver to
+        stop.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = time.time()
+    if cancel is None:
+        cancel = threading.Event()
+    
+    run_config = merge_config(config or {}, params or {})
+    if deadline is not None:
+        remaining = max(0.0, deadline - start_time)
+        time_limit = remaining if time_limit is None else min(time_limit, remaining)
+    if time_limit is not None:
+        run_config['termination'] = dict(run_config.get('termination') or {}, time_limit=time_limit)
+    
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def on_improvement(objective: float, facilities: Optional[List[int]]):
+        # Called in the solver thread; hand the event to the loop
+        event = {
+            'type': 'improvement', 'objective': objective, 'facilities': facilities,
+            'elapsed': time.time() - start_time
+        }
+        loop.call_soon_threadsafe(events.put_nowait, event)
+    
+    future = loop.run_in_executor(executor, functools.partial(
+        run_algorithm, algorithm, instance, run_config, seed,
+        cancel_event=cancel, on_improvement=on_improvement
+    ))
+    
+    getter = None
+    try:
+        while not future.done():
+            getter = asyncio.ensure_future(events.get())
+            await asyncio.wait({getter, future}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        # Improvements were scheduled on the loop before the completion
+        while not events.empty():
+            yield events.get_nowait()
+        yield {'type': 'result', 'result': future.result(), 'elapsed': time.time() - start_time}
+    finally:
+        if getter is not None:
+            getter.cancel()
+        if not future.done():
+            # Iterator closed or task cancelled early: stop the solver and
+            # wait for it, so nothing keeps running after close
+            cancel.set()
+            await asyncio.wait({future})
+            if not future.cancelled():
+                future.exception()  # Retrieved: the caller is no longer listening
+
+
+async def solve_result(
+    *args,
+    on_event: Optional[Callable[[dict], None]] = None,
+    **kwargs
+) -> dict:
+    """Run solve() to the end and return its result (on_event sees the improvements)."""
+    async for event in solve(*args, **kwargs):
+        if event['type'] == 'result':
+            return event['result']
+        if on_event is not None:
+            on_event(event)
+
+
+if __name__ == "__main__":
+    import argparse
+    from run_mclp import load_config
+    
+    parser = argparse.ArgumentParser(description="Concurrent async solves with progress streaming")
+    parser.add_argument("--instance", type=str, default="data/S1.json")
+    parser.add_argument("--algorithms", type=str, nargs='+', default=['ts', 'ls'])
+    parser.add_argument("--seeds", type=int, nargs='+', default=[42, 43])
+    parser.add_argument("--time-limit", type=float, default=10.0)
+    parser.add_argument("--config", type=str, default="config.yaml")
+    args = parser.parse_args()
+    
+    instance = MCLPInstance(args.instance)
+    config = load_config(args.config)
+    
+    async def main():
+        async def run(algorithm, seed):
+            def show(event):
+                print(f"  {algorithm} seed={seed}: {event['objective']:.2f} at {event['elapsed']:.2f}s")
+            result = await solve_result(
+                instance, algorithm, config, seed, time_limit=args.time_limit, on_event=show
+            )
+            print(f"[DONE] {algorithm} seed={seed}: {result['objective']:.2f} ({result['stop_reason']})")
+        
+        await asyncio.gather(*(run(a, s) for a in args.algorithms for s in args.seeds))
+    
+    asyncio.run(main())
@@ -0,0 +1,290 @@
+"""
+Benders decomposition for MCLP (Cordeau, Furini & Ljubic, 2016).
+
+The customer variables y_j are projected out of the compact model. For a
+facility vector x, customer j's subproblem max {d_j y_j : y_j <= 1,
+y_j <= sum_{i in I_j} x_i} has the closed-form dual solution
+
+    theta_j <= d_j                          if sum_{i in I_j} x_i >= 1
+    theta_j <= d_j * sum_{i in I_j} x_i     otherwise
+
+so all subproblems are evaluated at once with the CSR coverage arrays.
+Customers are aggregated into `cut_groups` groups, each with one theta
+variable in the facility-only master (1 = single-cut, |J| = multi-cut;
+multi-cut needs far fewer master solves on the bundled instances).
+
+The master is re-solved with CBC (or Gurobi) after adding violated cuts:
+first its LP relaxation (cheap cuts at fractional points), then as a MILP
+until its bound meets the best integer solution.
+"""
+
+import time
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+import pulp
+from instance_loader import MCLPInstance
+from compact_model import available_solver, solver_backend
+from termination import Termination
+from bounds import upper_bound, optimality_gap
+
+
+class BendersMaster:
+    def __init__(self, instance: MCLPInstance, cut_groups: Optional[int] = None):
+        """
+        Args:
+            instance: Problem instance
+            cut_groups: Number of customer groups with their own theta
+                (customers are assigned round-robin in ID order;
+                None = one per customer)
+        """
+        self.instance = instance
+        arr = instance.arrays
+        self.arrays = arr
+        n_J = len(arr.customer_ids)
+        self.n_groups = n_J if cut_groups is None else max(1, min(cut_groups, n_J))
+        self.group = np.arange(n_J) % self.n_groups
+        
+        # Coverage nonzeros as (facility position, customer position) pairs
+        self._nz_fac = arr.cust_fac
+        self._nz_cust = np.repeat(np.arange(n_J), np.diff(arr.cust_ptr))
+        
+        group_demand = np.bincount(self.group, weights=arr.d, minlength=self.n_groups)
+        
+        self.problem = pulp.LpProblem(f"MCLP_Benders_{instance.name}", pulp.LpMaximize)
+        self.x = [pulp.LpVariable(f"x_{i}", cat='Binary') for i in arr.facility_ids.tolist()]
+        self.theta = [
+            pulp.LpVariable(f"theta_{g}", lowBound=0, upBound=float(group_demand[g]))
+            for g in range(self.n_groups)
+        ]
+        self.problem += pulp.lpSum(self.theta), "covered_demand"
+        self.problem += pulp.LpAffineExpression(zip(self.x, arr.f.tolist())) <= instance.B, "budget"
+        self.num_cuts = 0
+    
+    def coverage(self, x_val: np.ndarray) -> np.ndarray:
+        """sum_{i in I_j} x_i for every customer position j."""
+        return np.bincount(self._nz_cust, weights=x_val[self._nz_fac], minlength=len(self.arrays.customer_ids))
+    
+    def subproblem(self, x_val: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+        """
+        Solve all customer subproblems at x_val in closed form.
+        
+        Returns:
+            constant: (n_groups,) demand of customers already covered by x_val
+            coef: (n_groups, n_I) cut coefficients on x for the others
+            value: Covered demand at x_val (its objective if x_val is integer)
+        """
+        arr = self.arrays
+        s = self.coverage(x_val)
+        covered = s >= 1 - 1e-9
+        
+        constant = np.bincount(self.group, weights=arr.d * covered, minlength=self.n_groups)
+        w = (arr.d * ~covered)[self._nz_cust]
+        coef = np.bincount(
+            self.group[self._nz_cust] * len(arr.facility_ids) + self._nz_fac,
+            weights=w, minlength=self.n_groups * len(arr.facility_ids)
+        ).reshape(self.n_groups, len(arr.facility_ids))
+        value = float(np.dot(arr.d, np.minimum(s, 1.0)))
+        return constant, coef, value
+    
+    def add_cuts(self, x_val: np.ndarray, theta_val: Optional[np.ndarray] = None, tol: float = 1e-6) -> int:
+        """
+        Add the cuts of x_val that the master point (x_val, theta_val)
+        violates (all cuts if theta_val is None). Returns the number added.
+        """
+        constant, coef, _ = self.subproblem(x_val)
+        rhs = constant + coef @ x_val
+        added = 0
+        for g in range(self.n_groups):
+            if theta_val is not None and theta_val[g] <= rhs[g] + tol * max(1.0, rhs[g]):
+                continue
+            nz = np.flatnonzero(coef[g])
+            expr = pulp.LpAffineExpression([(self.x[p], -float(coef[g, p])) for p in nz.tolist()])
+            expr.addterm(self.theta[g], 1)
+            self.problem += expr <= float(constant[g]), f"cut_{self.num_cuts}"
+            self.num_cuts += 1
+            added += 1
+        return added
+    
+    def to_vector(self, K: Set[int]) -> np.ndarray:
+        """0/1 facility vector (facility_ids order) of a facility set."""
+        return np.array([1.0 if i in K else 0.0 for i in self.arrays.facility_ids.tolist()])
+    
+    def values(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Current master solution (x, theta)."""
+        x_val = np.array([v.varValue or 0.0 for v in self.x])
+        theta_val = np.array([v.varValue or 0.0 for v in self.theta])
+        return x_val, theta_val
+    
+    def set_start(self, K: Set[int]):
+        """MIP start from a facility set (theta at its covered demand)."""
+        x_val = self.to_vector(K)
+        for v, value in zip(self.x, x_val.tolist()):
+            v.setInitialValue(value)
+        constant, coef, _ = self.subproblem(x_val)
+        for v, value in zip(self.theta, (constant + coef @ x_val).tolist()):
+            v.setInitialValue(min(value, v.upBound))
+    
+    def solve(self, mip: bool, solver: str, time_limit: Optional[float], threads: Optional[int]) -> int:
+        """Solve the master (LP relaxation if not mip); returns PuLP's sol_status."""
+        backend = solver_backend(
+            solver, time_limit, warm_start=mip, threads=threads, mip=mip
+        )
+        self.problem.solve(backend)
+        return self.problem.sol_status
+
+
+def solve_benders(
+    instance: MCLPInstance,
+    warm_start: Optional[Set[int]] = None,
+    cut_groups: Optional[int] = None,
+    lp_rounds: int = 50,
+    gap_tolerance: float = 1e-6,
+    time_limit: Optional[float] = None,
+    solver: str = 'auto',
+    threads: Optional[int] = None,
+    verbose: bool = False,
+    termination: Optional[Termination] = None
+) -> Tuple[Set[int], float, Dict]:
+    """
+    Benders cut loop for MCLP.
+    
+    Args:
+        instance: Problem instance
+        warm_start: Heuristic incumbent (greedy/TS); seeds cuts, lower
+            bound and the master's MIP start
+        cut_groups: Theta variables in the master (1 = aggregated single-cut,
+            None = one per customer)
+        lp_rounds: Maximum cut rounds on the LP relaxation of the master
+        gap_tolerance: Stop once (UB - LB) / UB is below this
+        time_limit: Wall-clock seconds (ignored if termination is given)
+        solver: 'cbc', 'gurobi' or 'auto'
+        threads: Solver threads (None = solver default)
+        verbose: Print one line per round
+        termination: Shared termination criteria
+    
+    Returns:
+        best_facilities: Best integer solution found
+        best_objective: Its covered demand
+        info: status ('optimal', 'time_limit', ...), upper_bound, rounds,
+              cuts, runtime
+    """
+    start_time = time.time()
+    if termination is None:
+        termination = Termination(time_limit, upper_bound=upper_bound(instance))
+    if solver == 'auto':
+        solver = available_solver()
+    
+    master = BendersMaster(instance, cut_groups)
+    best_K: Set[int] = set()
+    best_obj = 0.0
+    bound = upper_bound(instance)
+    
+    def remaining() -> Optional[float]:
+        if termination.deadline is None:
+            return None
+        return max(1.0, termination.deadline - time.time())
+    
+    def offer(x_val: np.ndarray) -> bool:
+        """Record an integer master point as incumbent if it is better."""
+        nonlocal best_K, best_obj
+        K = {i for i, v in zip(instance.arrays.facility_ids.tolist(), x_val.tolist()) if v > 0.5}
+        obj = instance.compute_coverage(K)[0]
+        termination.update(obj, K)
+        if obj > best_obj:
+            best_K, best_obj = K, obj
+            return True
+        return False
+    
+    if warm_start:
+        master.add_cuts(master.to_vector(warm_start))
+        offer(master.to_vector(warm_start))
+    
+    rounds = 0
+    status = None
+    
+    with termination.handle_sigint():
+        # Phase 1: cuts at fractional points of the LP relaxation
+        for _ in range(lp_rounds):
+            if termination.should_stop():
+                break
+            if master.solve(False, solver, remaining(), threads) != pulp.LpSolutionOptimal:
+                break
+            rounds += 1
+            x_val, theta_val = master.values()
+            bound = min(bound, float(theta_val.sum()))
+            added = master.add_cuts(x_val, theta_val)
+            if verbose:
+                print(f"  LP round {rounds}: bound={bound:.2f}, cuts added={added}")
+            if added == 0:
+                break
+        
+        # Phase 2: integer master; every solution is checked and cut off
+        while not termination.should_stop():
+            if optimality_gap(best_obj, bound) <= gap_tolerance:
+                status = 'optimal'
+                break
+            
+            if best_K:
+                master.set_start(best_K)
+            sol_status = master.solve(True, solver, remaining(), threads)
+            if sol_status not in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+                break
+            rounds += 1
+            x_val, theta_val = master.values()
+            if sol_status == pulp.LpSolutionOptimal:
+                bound = min(bound, float(theta_val.sum()))
+            
+            improved = offer(np.round(x_val))
+            added = master.add_cuts(np.round(x_val), theta_val)
+            if verbose:
+                print(f"  MIP round {rounds}: LB={best_obj:.2f}, UB={bound:.2f}, "
+                      f"cuts added={added}{' (new incumbent)' if improved else ''}")
+            if sol_status != pulp.LpSolutionOptimal or added == 0:
+                # Time limit, or the master point is exact (then UB = LB)
+                break
+    
+    if status is None:
+        if optimality_gap(best_obj, bound) <= gap_tolerance:
+            status = 'optimal'
+        else:
+            status = termination.reason or 'time_limit'
+    
+    info = {
+        'status': status,
+        'solver': solver,
+        'upper_bound': bound,
+        'rounds': rounds,
+        'cuts': master.num_cuts,
+        'runtime': time.time() - start_time
+    }
+    return best_K, best_obj, info
+
+
+if __name__ == "__main__":
+    import argparse
+    from heuristic_cache import cached_greedy
+    
+    parser = argparse.ArgumentParser(description="Benders decomposition for MCLP")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--cut-groups", type=int, default=None)
+    parser.add_argument("--lp-rounds", type=int, default=50)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--solver", type=str, default='auto', choices=['auto', 'cbc', 'gurobi'])
+    parser.add_argument("--no-warm-start", action="store_true")
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    warm_start = None if args.no_warm_start else cached_greedy(instance)[0]
+    K, obj, info = solve_benders(
+        instance, warm_start=warm_start, cut_groups=args.cut_groups,
+        lp_rounds=args.lp_rounds, time_limit=args.time_limit,
+        solver=args.solver, verbose=True
+    )
+    
+    print(f"\nStatus: {info['status']} ({info['rounds']} rounds, {info['cuts']} cuts, "
+          f"{info['runtime']:.2f}s)")
+    print(f"Objective: {obj:.2f}")
+    print(f"Upper bound: {info['upper_bound']:.2f} (gap {optimality_gap(obj, info['upper_bound']):.2%})")
+    print(f"Facilities: {sorted(K)}")
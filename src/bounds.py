@@ -0,0 +1,77 @@
+"""
+Cheap upper bounds for MCLP.
+Used to prove optimality of an incumbent early and to report optimality gaps.
+"""
+
+import weakref
+from typing import Dict, Optional
+from instance_loader import MCLPInstance
+
+# Bounds are computed once per loaded instance
+_bound_cache: "weakref.WeakKeyDictionary[MCLPInstance, Dict[str, float]]" = weakref.WeakKeyDictionary()
+
+
+def compute_upper_bounds(instance: MCLPInstance) -> Dict[str, float]:
+    """
+    Compute valid upper bounds on the covered demand.
+    
+    - total_demand: every customer covered
+    - reachable_demand: customers with at least one covering facility
+      that fits in the budget on its own
+    - knapsack: fractional knapsack over facilities with value = demand of
+      J_i and weight = f_i (valid because coverage is subadditive)
+    - best: minimum of the above
+    """
+    cached = _bound_cache.get(instance)
+    if cached is not None:
+        return cached
+    
+    B = instance.B
+    affordable = {i for i in instance.I if instance.f[i] <= B}
+    
+    reachable_demand = sum(
+        instance.d[j] for j in instance.J
+        if any(i in affordable for i in instance.I_j[j])
+    )
+    
+    # Fractional knapsack: fill by value/cost ratio, last item fractional
+    items = []
+    for i in affordable:
+        value = sum(instance.d[j] for j in instance.J_i[i])
+        ratio = value / instance.f[i] if instance.f[i] > 0 else float('inf')
+        items.append((ratio, value, instance.f[i]))
+    items.sort(key=lambda x: x[0], reverse=True)
+    
+    knapsack = 0.0
+    remaining = B
+    for ratio, value, cost in items:
+        if cost <= remaining:
+            knapsack += value
+            remaining -= cost
+        else:
+            knapsack += ratio * remaining
+            break
+    
+    bounds = {
+        'total_demand': instance.total_demand,
+        'reachable_demand': reachable_demand,
+        'knapsack': knapsack,
+    }
+    bounds['best'] = min(bounds.values())
+    
+    _bound_cache[instance] = bounds
+    return bounds
+
+
+def upper_bound(instance: MCLPInstance) -> float:
+    """Best (lowest) cheap upper bound for the instance."""
+    return compute_upper_bounds(instance)['best']
+
+
+def optimality_gap(objective: Optional[float], bound: Optional[float]) -> Optional[float]:
+    """Relative gap (bound - objective) / bound, or None if unavailable."""
+    if objective is None or bound is None:
+        return None
+    if bound <= 0:
+        return 0.0
+    return max(0.0, (bound - objective) / bound)
@@ -0,0 +1,191 @@
+"""
+Pure Python/NumPy branch-and-bound for small MCLP instances.
+
+Customer sets are Python int bitsets. Each node branches on the undecided
+facility with the best marginal coverage per cost (open first, so the
+first dive is the greedy solution) and is bounded by a fractional
+knapsack over the marginal coverages, which is valid because coverage is
+submodular. Closing facility j also closes every undecided facility whose
+remaining coverage is a subset of j's at no lower cost (dominance: swapping
+it for j never hurts, and that solution lies in the open-j branch).
+"""
+
+import time
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from instance_loader import MCLPInstance
+from termination import Termination
+
+
+class CoverageBitsets:
+    def __init__(self, instance: MCLPInstance):
+        """Bitset of covered customer positions per facility, and byte lookup tables for demand sums."""
+        arr = instance.arrays
+        self.facility_ids = arr.facility_ids.tolist()
+        self.costs = arr.f.tolist()
+        self.masks = []
+        for p in range(len(self.facility_ids)):
+            mask = 0
+            for q in arr.fac_cust[arr.fac_ptr[p]:arr.fac_ptr[p + 1]].tolist():
+                mask |= 1 << q
+            self.masks.append(mask)
+        
+        # tables[k, b] = demand of the customers set in byte value b of byte k
+        self.n_bytes = (len(arr.customer_ids) + 7) // 8
+        d = np.zeros(self.n_bytes * 8)
+        d[:len(arr.d)] = arr.d
+        bits = (np.arange(256)[:, None] >> np.arange(8)[None, :]) & 1
+        self.tables = d.reshape(self.n_bytes, 8) @ bits.T
+        self._rows = np.arange(self.n_bytes)
+    
+    def values(self, masks: List[int]) -> np.ndarray:
+        """Covered demand of each customer bitset."""
+        if not masks:
+            return np.zeros(0)
+        raw = b''.join(m.to_bytes(self.n_bytes, 'little') for m in masks)
+        table_idx = np.frombuffer(raw, dtype=np.uint8).reshape(len(masks), self.n_bytes)
+        return self.tables[self._rows, table_idx].sum(axis=1)
+
+
+def knapsack_bound(gains: np.ndarray, costs: np.ndarray, budget: float) -> float:
+    """Fractional knapsack value of items sorted by gain/cost (descending)."""
+    cumulative = np.cumsum(costs)
+    n_full = int(np.searchsorted(cumulative, budget, side='right'))
+    bound = float(gains[:n_full].sum())
+    if n_full < len(gains):
+        used = cumulative[n_full - 1] if n_full else 0.0
+        bound += gains[n_full] * (budget - used) / costs[n_full]
+    return bound
+
+
+def branch_and_bound(
+    instance: MCLPInstance,
+    incumbent: Optional[Set[int]] = None,
+    node_limit: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    verbose: bool = False
+) -> Tuple[Set[int], float, Dict]:
+    """
+    Solve MCLP exactly by depth-first branch-and-bound.
+    
+    Args:
+        instance: Problem instance
+        incumbent: Initial feasible solution (e.g. greedy)
+        node_limit: Stop after this many nodes (None = no limit)
+        time_limit: Wall-clock seconds (ignored if termination is given)
+        termination: Shared termination criteria
+        verbose: Print progress every 10000 nodes
+    
+    Returns:
+        best_facilities: Optimal solution (best found if stopped early)
+        best_objective: Its covered demand
+        info: status ('optimal', 'node_limit', or the termination reason),
+              upper_bound, nodes, runtime
+    """
+    start_time = time.time()
+    if termination is None:
+        termination = Termination(time_limit)
+    
+    bits = CoverageBitsets(instance)
+    costs = np.array(bits.costs)
+    eps = 1e-9
+    
+    best_K: Set[int] = set()
+    best_obj = 0.0
+    if incumbent:
+        best_K = set(incumbent)
+        best_obj = instance.compute_coverage(best_K)[0]
+        termination.update(best_obj, best_K)
+    
+    # Node: (bound, covered mask, budget left, undecided positions, open positions)
+    stack = [(float('inf'), 0, instance.B, tuple(range(len(costs))), ())]
+    nodes = 0
+    status = 'optimal'
+    
+    with termination.handle_sigint():
+        while stack:
+            if node_limit is not None and nodes >= node_limit:
+                status = 'node_limit'
+                break
+            if nodes % 1000 == 0 and termination.should_stop():
+                status = termination.reason
+                break
+            
+            parent_bound, covered, budget, undecided, opened = stack.pop()
+            if parent_bound <= best_obj + eps:
+                continue
+            nodes += 1
+            
+            covered_value = float(bits.values([covered])[0])
+            if covered_value > best_obj + eps:
+                best_obj = covered_value
+                best_K = {bits.facility_ids[p] for p in opened}
+                termination.update(best_obj, best_K)
+            
+            # Marginal coverage of affordable undecided facilities
+            candidates = [p for p in undecided if costs[p] <= budget + eps]
+            remaining = [bits.masks[p] & ~covered for p in candidates]
+            gains = bits.values(remaining)
+            keep = np.flatnonzero(gains > 0)
+            if len(keep) == 0:
+                continue
+            
+            order = keep[np.lexsort((keep, -gains[keep] / np.maximum(costs[candidates][keep], 1e-12)))]
+            bound = covered_value + knapsack_bound(gains[order], costs[candidates][order], budget)
+            if bound <= best_obj + eps:
+                continue
+            
+            candidates = [candidates[k] for k in order.tolist()]
+            remaining = [remaining[k] for k in order.tolist()]
+            branch, branch_mask = candidates[0], remaining[0]
+            
+            # Close the branching facility and the facilities it dominates
+            closed = tuple(
+                p for p, mask in zip(candidates[1:], remaining[1:])
+                if not (mask & ~branch_mask == 0 and costs[p] >= costs[branch])
+            )
+            stack.append((bound, covered, budget, closed, opened))
+            stack.append((
+                bound, covered | bits.masks[branch], budget - costs[branch],
+                tuple(candidates[1:]), opened + (branch,)
+            ))
+            
+            if verbose and nodes % 10000 == 0:
+                print(f"  {nodes} nodes: best={best_obj:.2f}, open nodes={len(stack)}")
+    
+    if status == 'optimal':
+        upper = best_obj
+    else:
+        upper = max([best_obj] + [node[0] for node in stack])
+    
+    info = {
+        'status': status,
+        'upper_bound': upper,
+        'nodes': nodes,
+        'runtime': time.time() - start_time
+    }
+    return best_K, best_obj, info
+
+
+if __name__ == "__main__":
+    import argparse
+    from heuristic_cache import cached_greedy
+    
+    parser = argparse.ArgumentParser(description="Bitset branch-and-bound for MCLP")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--node-limit", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    K, obj, info = branch_and_bound(
+        instance, incumbent=cached_greedy(instance)[0],
+        node_limit=args.node_limit, time_limit=args.time_limit, verbose=True
+    )
+    
+    print(f"\nStatus: {info['status']} ({info['nodes']} nodes, {info['runtime']:.2f}s)")
+    print(f"Objective: {obj:.2f} (upper bound {info['upper_bound']:.2f})")
+    print(f"Facilities: {sorted(K)}")
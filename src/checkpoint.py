@@ -0,0 +1,44 @@
+"""
+Checkpoint files for long tabu/multi-start runs.
+Checkpoints are pickles written atomically (temp file + rename), so a run
+killed while writing keeps its previous checkpoint.
+"""
+
+import os
+import pickle
+from typing import Optional
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, kind: str, fingerprint: str, payload: dict):
+    """Atomically write a checkpoint of the given kind for an instance."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    data = dict(payload, version=CHECKPOINT_VERSION, kind=kind, fingerprint=fingerprint)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str, kind: str, fingerprint: str) -> Optional[dict]:
+    """
+    Load a checkpoint, or None if the file does not exist. Raises
+    ValueError if it belongs to another solver, instance or format version.
+    """
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, 'rb') as f:
+        data = pickle.load(f)
+
+    if data.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}: {data.get('version')}")
+    if data.get('kind') != kind:
+        raise ValueError(f"Checkpoint {path} is for '{data.get('kind')}', not '{kind}'")
+    if data.get('fingerprint') != fingerprint:
+        raise ValueError(f"Checkpoint {path} was written for a different instance")
+    return data
@@ -22,13 +22,11 @@ def closest_neighbor_heuristic(
     Args:
         distances: Optional distance matrix {(i,j): distance}. 
                    If None, uses coverage set cardinality as proxy.
+        seed: Unused (deterministic); kept for a uniform algorithm interface.
     
     Returns:
         open_facilities, objective, covered_customers
     """
-    import random
-    random.seed(seed)
-    
     K = set()  # Open facilities
     covered = set()  # Covered customers
     budget_used = 0.0
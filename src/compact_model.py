@@ -0,0 +1,213 @@
+"""
+Compact MILP formulation of MCLP solved with PuLP.
+
+    max  sum_j d_j y_j
+    s.t. sum_i f_i x_i <= B
+         y_j <= sum_{i in I_j} x_i      for all j
+         x_i in {0, 1}, 0 <= y_j <= 1
+
+Uses the bundled CBC solver (Gurobi through gurobipy when available) and
+can take a heuristic incumbent as MIP start.
+"""
+
+import os
+import re
+import tempfile
+import time
+from typing import Dict, Optional, Set, Tuple
+import pulp
+from instance_loader import MCLPInstance
+
+
+def build_model(instance: MCLPInstance) -> Tuple[pulp.LpProblem, list, list]:
+    """
+    Build the compact model from the instance's CSR coverage arrays.
+    
+    Returns:
+        problem: PuLP problem
+        x: Facility variables (in facility_ids order)
+        y: Coverage variables (in customer_ids order)
+    """
+    arr = instance.arrays
+    problem = pulp.LpProblem(f"MCLP_{instance.name}", pulp.LpMaximize)
+    x = [pulp.LpVariable(f"x_{i}", cat='Binary') for i in arr.facility_ids.tolist()]
+    y = [pulp.LpVariable(f"y_{j}", lowBound=0, upBound=1) for j in arr.customer_ids.tolist()]
+    
+    problem += pulp.LpAffineExpression(zip(y, arr.d.tolist())), "covered_demand"
+    problem += pulp.LpAffineExpression(zip(x, arr.f.tolist())) <= instance.B, "budget"
+    
+    # One coverage row per customer, read off the customer -> facility CSR
+    ptr = arr.cust_ptr.tolist()
+    cust_fac = arr.cust_fac.tolist()
+    for p, y_j in enumerate(y):
+        row = [(y_j, 1)] + [(x[q], -1) for q in cust_fac[ptr[p]:ptr[p + 1]]]
+        problem += pulp.LpAffineExpression(row) <= 0, f"cover_{p}"
+    
+    return problem, x, y
+
+
+def set_mip_start(instance: MCLPInstance, x: list, y: list, K: Set[int]):
+    """Set initial values of all variables to the solution K."""
+    arr = instance.arrays
+    for x_i, i in zip(x, arr.facility_ids.tolist()):
+        x_i.setInitialValue(1 if i in K else 0)
+    for y_j, j in zip(y, arr.customer_ids.tolist()):
+        y_j.setInitialValue(1 if instance.I_j[j] & K else 0)
+
+
+def available_solver() -> str:
+    """'gurobi' if gurobipy is usable through PuLP, otherwise 'cbc'."""
+    return 'gurobi' if 'GUROBI' in pulp.listSolvers(onlyAvailable=True) else 'cbc'
+
+
+def solver_backend(
+    solver: str,
+    time_limit: Optional[float] = None,
+    warm_start: bool = False,
+    threads: Optional[int] = None,
+    verbose: bool = False,
+    log_path: Optional[str] = None,
+    mip: bool = True
+):
+    """PuLP solver object for 'cbc' or 'gurobi' ('auto' picks one)."""
+    if solver == 'auto':
+        solver = available_solver()
+    if solver == 'gurobi':
+        return pulp.GUROBI(
+            mip=mip, msg=verbose, timeLimit=time_limit, warmStart=warm_start,
+            **({'Threads': threads} if threads else {})
+        )
+    if solver == 'cbc':
+        return pulp.PULP_CBC_CMD(
+            mip=mip, msg=verbose, timeLimit=time_limit, warmStart=warm_start,
+            threads=threads, logPath=log_path
+        )
+    raise ValueError(f"Unknown solver: {solver}")
+
+
+def _cbc_bound(log_path: str) -> Optional[float]:
+    """Best bound from CBC's final summary (only printed when not optimal)."""
+    try:
+        with open(log_path, 'r') as f:
+            log = f.read()
+    except OSError:
+        return None
+    match = re.search(r"^Upper bound:\s*([-+0-9.eE]+)", log, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def solve_compact(
+    instance: MCLPInstance,
+    time_limit: Optional[float] = None,
+    warm_start: Optional[Set[int]] = None,
+    solver: str = 'auto',
+    threads: Optional[int] = None,
+    verbose: bool = False
+) -> Tuple[Set[int], Optional[float], Dict]:
+    """
+    Solve the compact model.
+    
+    Args:
+        instance: Problem instance
+        time_limit: Solver time limit in seconds (None = solve to optimality)
+        warm_start: Feasible solution passed as MIP start
+        solver: 'cbc', 'gurobi' or 'auto' (Gurobi if available)
+        threads: Solver threads (None = solver default)
+        verbose: Show the solver log
+    
+    Returns:
+        best_facilities: Best integer solution found (empty if none)
+        best_objective: Its objective (None if no solution was found)
+        info: status ('optimal', 'time_limit', 'infeasible', ...),
+              upper_bound (proven bound), runtime, build_time
+    """
+    start_time = time.time()
+    problem, x, y = build_model(instance)
+    build_time = time.time() - start_time
+    
+    if warm_start:
+        set_mip_start(instance, x, y, warm_start)
+    
+    if solver == 'auto':
+        solver = available_solver()
+    
+    log_path = None
+    if solver == 'cbc':
+        fd, log_path = tempfile.mkstemp(suffix='.log', prefix='cbc_')
+        os.close(fd)
+    backend = solver_backend(
+        solver, time_limit, bool(warm_start), threads, verbose, log_path
+    )
+    
+    try:
+        problem.solve(backend)
+        bound = None
+        if solver == 'gurobi':
+            bound = problem.solverModel.ObjBound
+        elif log_path is not None:
+            bound = _cbc_bound(log_path)
+    finally:
+        if log_path is not None and os.path.exists(log_path):
+            os.remove(log_path)
+    
+    # sol_status distinguishes a proven optimum from a feasible solution
+    # cut off by the time limit (status is "Optimal" for both with CBC)
+    if problem.sol_status == pulp.LpSolutionOptimal:
+        status = 'optimal'
+    elif problem.sol_status == pulp.LpSolutionIntegerFeasible:
+        status = 'time_limit'
+    elif problem.sol_status == pulp.LpSolutionInfeasible:
+        status = 'infeasible'
+    else:
+        status = 'no_solution'
+    
+    if status in ('optimal', 'time_limit'):
+        arr = instance.arrays
+        K = {i for x_i, i in zip(x, arr.facility_ids.tolist()) if x_i.varValue is not None and x_i.varValue > 0.5}
+        # Recompute from K: y values are only bounded above by coverage
+        obj = instance.compute_coverage(K)[0]
+    else:
+        K, obj = set(), None
+    
+    if status == 'optimal':
+        bound = obj
+    
+    info = {
+        'status': status,
+        'solver': solver,
+        'upper_bound': bound,
+        'runtime': time.time() - start_time,
+        'build_time': build_time
+    }
+    return K, obj, info
+
+
+if __name__ == "__main__":
+    import argparse
+    from heuristic_cache import cached_greedy
+    from bounds import optimality_gap
+    
+    parser = argparse.ArgumentParser(description="Compact MILP model for MCLP")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--solver", type=str, default='auto', choices=['auto', 'cbc', 'gurobi'])
+    parser.add_argument("--no-warm-start", action="store_true")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    warm_start = None if args.no_warm_start else cached_greedy(instance)[0]
+    K, obj, info = solve_compact(
+        instance, time_limit=args.time_limit, warm_start=warm_start,
+        solver=args.solver, verbose=args.verbose
+    )
+    
+    print(f"\nStatus: {info['status']} ({info['solver']}, {info['runtime']:.2f}s, "
+          f"model built in {info['build_time']:.2f}s)")
+    if obj is not None:
+        print(f"Objective: {obj:.2f}")
+        if info['upper_bound'] is not None:
+            print(f"Upper bound: {info['upper_bound']:.2f} (gap {optimality_gap(obj, info['upper_bound']):.2%})")
+        print(f"Facilities: {sorted(K)}")
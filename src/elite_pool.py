@@ -0,0 +1,86 @@
+"""
+Elite pool of diverse high-quality solutions for Tabu Search.
+Solutions are stored as integer bitmasks over facility IDs, so the
+Hamming distance (size of the symmetric difference) between two solutions
+is one XOR and a popcount.
+"""
+
+import random
+from typing import Iterable, List, Optional, Set, Tuple
+
+
+def to_mask(K: Iterable[int]) -> int:
+    """Bitmask with bit i set for every open facility i."""
+    mask = 0
+    for i in K:
+        mask |= 1 << i
+    return mask
+
+
+def from_mask(mask: int) -> Set[int]:
+    """Facility set of a bitmask."""
+    K = set()
+    while mask:
+        low = mask & -mask
+        K.add(low.bit_length() - 1)
+        mask ^= low
+    return K
+
+
+def distance(mask_a: int, mask_b: int) -> int:
+    """Number of facilities open in exactly one of the two solutions."""
+    return bin(mask_a ^ mask_b).count('1')
+
+
+class ElitePool:
+    def __init__(self, capacity: int = 10, min_distance: int = 2):
+        """
+        Args:
+            capacity: Maximum number of elite solutions
+            min_distance: Solutions closer than this to an elite only
+                replace that elite (if better) instead of entering the pool
+        """
+        self.capacity = capacity
+        self.min_distance = min_distance
+        self.entries: List[Tuple[float, int]] = []  # (objective, mask)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def add(self, K: Set[int], obj: float) -> bool:
+        """
+        Offer a solution. Near-duplicates compete with their closest elite;
+        otherwise a full pool evicts its worst member if the newcomer is
+        better. Returns True if the pool changed.
+        """
+        mask = to_mask(K)
+        if self.entries:
+            nearest = min(range(len(self.entries)), key=lambda k: distance(mask, self.entries[k][1]))
+            if distance(mask, self.entries[nearest][1]) < self.min_distance:
+                if obj > self.entries[nearest][0]:
+                    self.entries[nearest] = (obj, mask)
+                    return True
+                return False
+        
+        if len(self.entries) < self.capacity:
+            self.entries.append((obj, mask))
+            return True
+        
+        worst = min(range(len(self.entries)), key=lambda k: self.entries[k][0])
+        if obj > self.entries[worst][0]:
+            self.entries[worst] = (obj, mask)
+            return True
+        return False
+    
+    def select_guide(self, K: Set[int], rng: random.Random, min_distance: int = 2) -> Optional[Set[int]]:
+        """
+        Pick a guiding elite for path relinking from K: a random one among
+        the better half (by objective) of the elites at least min_distance
+        away. Returns None if no elite is far enough.
+        """
+        mask = to_mask(K)
+        far = [e for e in self.entries if distance(mask, e[1]) >= min_distance]
+        if not far:
+            return None
+        far.sort(key=lambda e: (-e[0], e[1]))
+        return from_mask(rng.choice(far[:max(1, len(far) // 2)])[1])
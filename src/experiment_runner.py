@@ -0,0 +1,275 @@
+"""
+Grid experiment runner.
+
+Expands a grid spec (instances x algorithms x seeds x parameter sets, see
+experiments.yaml) into jobs and runs them on a process pool instead of one
+interpreter launch per run. Each worker loads an instance once and keeps it
+for all its later jobs on that instance; jobs are submitted longest first
+(estimated from instance size and algorithm) so short runs fill in at the
+end. Rows are the same as run_mclp.py writes and are appended to the CSV in
+one write, in grid order, or added to a results store as they finish
+(jobs already in the store are skipped, so an interrupted grid resumes).
+"""
+
+import concurrent.futures
+import copy
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from instance_loader import MCLPInstance
+from run_mclp import load_config, run_algorithm, result_row, write_rows
+from results_store import ResultsStore, config_hash
+
+# Relative cost of one run per byte of instance file (for scheduling only)
+ALGORITHM_WEIGHTS = {
+    'greedy': 1,
+    'cn': 1,
+    'lagrangian': 5,
+    'ls': 20,
+    'bnb': 30,
+    'compact': 30,
+    'benders': 30,
+    'ts': 50,
+    'ts_islands': 50
+}
+
+
+class Job(NamedTuple):
+    index: int  # position in the grid (output order)
+    experiment: str
+    instance_path: str
+    algorithm: str
+    seed: int
+    overrides: dict  # merged over the base config
+
+
+def merge_config(base: dict, overrides: dict) -> dict:
+    """Deep copy of base with overrides merged in (nested dicts merged key by key)."""
+    merged = copy.deepcopy(base)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def expand_grid(spec: dict) -> List[Job]:
+    """
+    Jobs of all experiments in a grid spec, in grid order (experiment,
+    instance, parameter set, seed, algorithm).
+    
+    Each experiment has a name, instances (paths), algorithms, seeds and
+    an optional list of params override dicts (default: one empty set).
+    """
+    jobs = []
+    for experiment in spec['experiments']:
+        for instance_path in experiment['instances']:
+            for overrides in experiment.get('params') or [{}]:
+                for seed in experiment['seeds']:
+                    for algorithm in experiment['algorithms']:
+                        jobs.append(Job(
+                            len(jobs), experiment.get('name', ''), instance_path,
+                            algorithm, seed, overrides or {}
+                        ))
+    return jobs
+
+
+def estimated_cost(job: Job) -> float:
+    """Scheduling estimate: instance file size times the algorithm weight."""
+    return os.path.getsize(job.instance_path) * ALGORITHM_WEIGHTS.get(job.algorithm, 10)
+
+
+# Worker-process state: instances loaded so far, by path
+_worker_instances: Dict[str, MCLPInstance] = {}
+
+
+def _init_worker(quiet: bool):
+    """
+    Pool initializer. Ctrl+C is left to the parent except while a run is
+    inside its own SIGINT handler, which stops it with its best-so-far.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if quiet:
+        sys.stdout = open(os.devnull, 'w')
+
+
+def _run_job(job: Job, config: dict, trace_dir: Optional[str]) -> dict:
+    """Run one job on the worker's cached instance; returns its CSV row or error."""
+    try:
+        instance = _worker_instances.get(job.instance_path)
+        if instance is None:
+            instance = _worker_instances[job.instance_path] = MCLPInstance(job.instance_path)
+        
+        result = run_algorithm(job.algorithm, instance, merge_config(config, job.overrides), job.seed)
+        
+        if trace_dir and result.get('trace') is not None:
+            os.makedirs(trace_dir, exist_ok=True)
+            suffix = f"_{job.experiment}{job.index}" if job.overrides else ''
+            trace_path = os.path.join(
+                trace_dir, f"{instance.name}_{job.algorithm}_seed{job.seed}{suffix}.csv"
+            )
+            result['trace'].save(trace_path)
+        
+        return {'row': result_row(result, instance.name, job.seed)}
+    except Exception:
+        return {'error': traceback.format_exc()}
+
+
+def _pool_context():
+    """Prefer 'fork' so workers start without re-importing the solvers."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def run_grid(
+    jobs: List[Job],
+    config: dict,
+    workers: Optional[int] = None,
+    trace_dir: Optional[str] = None,
+    quiet: bool = True,
+    verbose: bool = True,
+    on_result: Optional[Callable[[Job, dict], None]] = None
+) -> List[dict]:
+    """
+    Run jobs on a process pool, longest first.
+    
+    Args:
+        jobs: Jobs from expand_grid
+        config: Base configuration (config.yaml)
+        workers: Worker processes (None = CPU count)
+        trace_dir: Directory for TS convergence traces (None = no traces)
+        quiet: Silence the runs' own output in the workers
+        verbose: Print one line per finished job
+        on_result: Called with (job, row) as each job succeeds
+    
+    Returns:
+        CSV rows of the successful jobs in grid order (failed jobs are
+        reported and skipped; after Ctrl+C, the jobs finished so far)
+    """
+    workers = workers or os.cpu_count() or 1
+    rows: Dict[int, dict] = {}
+    done = 0
+    
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=_pool_context(),
+        initializer=_init_worker, initargs=(quiet,)
+    ) as pool:
+        futures = {
+            pool.submit(_run_job, job, config, trace_dir): job
+            for job in sorted(jobs, key=estimated_cost, reverse=True)
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                job = futures[future]
+                outcome = future.result()
+                done += 1
+                if 'row' in outcome:
+                    rows[job.index] = outcome['row']
+                    if on_result is not None:
+                        on_result(job, outcome['row'])
+                if verbose:
+                    label = f"{job.experiment} {os.path.basename(job.instance_path)} {job.algorithm} seed={job.seed}"
+                    if job.overrides:
+                        label += f" {job.overrides}"
+                    if 'row' in outcome:
+                        row = outcome['row']
+                        objective = f"{row['objective']:.2f}" if row['objective'] not in ('', None) else 'no solution'
+                        print(f"[{done}/{len(jobs)}] {label}: {objective} ({row['runtime_sec']:.2f}s)")
+                    else:
+                        print(f"[{done}/{len(jobs)}] {label}: ERROR\n{outcome['error']}")
+        except KeyboardInterrupt:
+            # Running jobs stop with their best-so-far; pending ones are dropped
+            print("\nInterrupted: waiting for running jobs, skipping the rest")
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future, job in futures.items():
+                if future.done() and not future.cancelled() and job.index not in rows:
+                    outcome = future.result()
+                    if 'row' in outcome:
+                        rows[job.index] = outcome['row']
+                        if on_result is not None:
+                            on_result(job, outcome['row'])
+    
+    return [rows[index] for index in sorted(rows)]
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run an MCLP experiment grid on a process pool")
+    parser.add_argument('--grid', type=str, default='experiments.yaml', help='Grid spec YAML')
+    parser.add_argument('--config', type=str, default='config.yaml', help='Base configuration')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--output', type=str, default=None, help='Output CSV (default: output_csv of the grid)')
+    parser.add_argument('--store', type=str, default=None,
+                       help='SQLite results store used instead of the CSV; jobs already stored are skipped')
+    parser.add_argument('--experiments', type=str, nargs='+', default=None,
+                       help='Only run the experiments with these names')
+    parser.add_argument('--show-output', action='store_true', help="Show the runs' own output")
+    args = parser.parse_args()
+    
+    spec = load_config(args.grid)
+    config = load_config(args.config)
+    if args.experiments:
+        spec['experiments'] = [e for e in spec['experiments'] if e.get('name') in args.experiments]
+    
+    output_path = args.output or spec.get('output_csv') or config['results']['output_csv']
+    workers = args.workers or spec.get('workers')
+    trace_dir = spec.get('trace_dir', config.get('results', {}).get('trace_dir'))
+    store_path = args.store or spec.get('store') or config.get('results', {}).get('store')
+    
+    jobs = expand_grid(spec)
+    missing = sorted({job.instance_path for job in jobs if not os.path.exists(job.instance_path)})
+    if missing:
+        parser.error(f"Instance files not found: {', '.join(missing)}")
+    
+    store = ResultsStore(store_path) if store_path else None
+    keys = {}
+    if store:
+        fingerprints = {path: MCLPInstance(path).fingerprint for path in {job.instance_path for job in jobs}}
+        for job in jobs:
+            job_config = merge_config(config, job.overrides)
+            keys[job.index] = (
+                fingerprints[job.instance_path], job.algorithm, job.seed,
+                config_hash(job_config, job.algorithm)
+            )
+        # Skip stored runs, and runs whose parameter set does not affect their algorithm
+        seen = store.completed_keys()
+        pending = []
+        for job in jobs:
+            if keys[job.index] not in seen:
+                seen.add(keys[job.index])
+                pending.append(job)
+        print(f"Skipping {len(jobs) - len(pending)} jobs already in {store_path} or repeated in the grid")
+        jobs = pending
+    
+    def add_to_store(job: Job, row: dict):
+        store.add(keys[job.index], row, merge_config(config, job.overrides))
+    
+    print(f"Running {len(jobs)} jobs from {args.grid} on {workers or os.cpu_count()} workers")
+    print("=" * 70)
+    start_time = time.time()
+    try:
+        rows = run_grid(
+            jobs, config, workers, trace_dir, quiet=not args.show_output,
+            on_result=add_to_store if store else None
+        )
+    finally:
+        if store:
+            store.close()
+    if not store:
+        write_rows(rows, output_path)
+    
+    print("=" * 70)
+    print(f"{len(rows)}/{len(jobs)} runs in {time.time() - start_time:.1f}s")
+    print(f"Results saved to: {store_path or output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,15 +11,14 @@ from typing import Set, Tuple
 def greedy_heuristic(instance: MCLPInstance, seed: int = 42) -> Tuple[Set[int], float, Set[int]]:
     """
     Greedy heuristic: select facilities by max (coverage_gain / cost).
+    Fully deterministic (ties broken by lowest ID); `seed` is accepted for
+    interface compatibility with the stochastic algorithms and is unused.
     
     Returns:
         open_facilities: Set of facility IDs
         objective: Total covered demand
         covered_customers: Set of covered customer IDs
     """
-    import random
-    random.seed(seed)
-    
     K = set()  # Open facilities
     covered = set()  # Covered customers
     budget_used = 0.0
@@ -0,0 +1,63 @@
+"""
+Per-process memoization of the deterministic constructive heuristics.
+Greedy and Closest-Neighbor do not depend on their seed, so they run once
+per instance (keyed by content fingerprint) and later calls get copies.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Set, Tuple
+from instance_loader import MCLPInstance
+from greedy import greedy_heuristic
+from closest_neighbor import closest_neighbor_heuristic
+
+MAX_ENTRIES = 64
+
+_cache: "OrderedDict[tuple, Tuple[frozenset, float, frozenset]]" = OrderedDict()
+_lock = threading.Lock()
+stats = {'hits': 0, 'misses': 0}
+
+
+def _memoized(key: tuple, compute) -> Tuple[Set[int], float, Set[int]]:
+    """Look up key (LRU), computing and storing the result on a miss."""
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+            stats['hits'] += 1
+    
+    if entry is None:
+        K, obj, covered = compute()
+        entry = (frozenset(K), obj, frozenset(covered))
+        with _lock:
+            stats['misses'] += 1
+            _cache[key] = entry
+            while len(_cache) > MAX_ENTRIES:
+                _cache.popitem(last=False)
+    
+    # Callers mutate the returned sets, so hand out fresh copies
+    K, obj, covered = entry
+    return set(K), obj, set(covered)
+
+
+def cached_greedy(instance: MCLPInstance) -> Tuple[Set[int], float, Set[int]]:
+    """Memoized greedy_heuristic: (open_facilities, objective, covered_customers)."""
+    return _memoized(
+        ('greedy', instance.fingerprint),
+        lambda: greedy_heuristic(instance)
+    )
+
+
+def cached_closest_neighbor(instance: MCLPInstance) -> Tuple[Set[int], float, Set[int]]:
+    """Memoized closest_neighbor_heuristic (cost-proxy distances)."""
+    return _memoized(
+        ('closest_neighbor', instance.fingerprint),
+        lambda: closest_neighbor_heuristic(instance)
+    )
+
+
+def clear_cache():
+    """Drop all memoized solutions."""
+    with _lock:
+        _cache.clear()
+        stats['hits'] = stats['misses'] = 0
@@ -3,9 +3,27 @@ Instance loader for MCLP problems.
 Loads JSON format and validates coverage sets.
 """
 
+import hashlib
 import json
 import numpy as np
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Tuple, Set, NamedTuple
+
+
+class CoverageArrays(NamedTuple):
+    """
+    NumPy view of an instance. Facilities and customers are addressed by
+    position in the sorted ID arrays; coverage is stored in CSR form in both
+    directions (facility -> customers and customer -> facilities).
+    """
+    facility_ids: np.ndarray   # (n_I,) sorted facility IDs
+    customer_ids: np.ndarray   # (n_J,) sorted customer IDs
+    f: np.ndarray              # (n_I,) facility costs
+    d: np.ndarray              # (n_J,) customer demands
+    fac_ptr: np.ndarray        # (n_I + 1,) CSR row pointers of J_i
+    fac_cust: np.ndarray       # (nnz,) customer positions of J_i
+    cust_ptr: np.ndarray       # (n_J + 1,) CSR row pointers of I_j
+    cust_fac: np.ndarray       # (nnz,) facility positions of I_j
+
 
 class MCLPInstance:
     def __init__(self, filepath: str):
@@ -31,6 +49,10 @@ class MCLPInstance:
         # Precompute total demand
         self.total_demand = sum(self.d.values())
         
+        # Content hash and NumPy view, computed on first use
+        self._fingerprint = None
+        self._arrays = None
+        
         # Validate instance
         self._validate()
     
@@ -57,6 +79,45 @@ class MCLPInstance:
         print(f"  - Total demand: {self.total_demand:.2f}")
         print(f"  - Coverage density: {coverage_sum_1 / (len(self.I) * len(self.J)):.2%}")
     
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 of the instance content (independent of name and file layout)."""
+        if self._fingerprint is None:
+            payload = json.dumps({
+                'I': sorted(self.I),
+                'J': sorted(self.J),
+                'f': sorted(self.f.items()),
+                'd': sorted(self.d.items()),
+                'I_j': sorted((j, sorted(fs)) for j, fs in self.I_j.items()),
+                'B': self.B
+            })
+            self._fingerprint = hashlib.sha256(payload.encode()).hexdigest()
+        return self._fingerprint
+    
+    @property
+    def arrays(self) -> CoverageArrays:
+        """CSR/NumPy representation for vectorized solvers (built once)."""
+        if self._arrays is None:
+            facility_ids = np.array(sorted(self.I), dtype=np.int64)
+            customer_ids = np.array(sorted(self.J), dtype=np.int64)
+            fac_pos = {i: p for p, i in enumerate(facility_ids.tolist())}
+            cust_pos = {j: p for p, j in enumerate(customer_ids.tolist())}
+            
+            fac_rows = [sorted(cust_pos[j] for j in self.J_i[i]) for i in facility_ids.tolist()]
+            cust_rows = [sorted(fac_pos[i] for i in self.I_j[j]) for j in customer_ids.tolist()]
+            
+            self._arrays = CoverageArrays(
+                facility_ids=facility_ids,
+                customer_ids=customer_ids,
+                f=np.array([self.f[i] for i in facility_ids.tolist()], dtype=np.float64),
+                d=np.array([self.d[j] for j in customer_ids.tolist()], dtype=np.float64),
+                fac_ptr=np.cumsum([0] + [len(r) for r in fac_rows], dtype=np.int64),
+                fac_cust=np.array([c for r in fac_rows for c in r], dtype=np.int64),
+                cust_ptr=np.cumsum([0] + [len(r) for r in cust_rows], dtype=np.int64),
+                cust_fac=np.array([i for r in cust_rows for i in r], dtype=np.int64),
+            )
+        return self._arrays
+    
     def compute_coverage(self, open_facilities: Set[int]) -> Tuple[float, Set[int]]:
         """
         Compute total covered demand for a given facility set.
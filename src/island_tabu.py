@@ -0,0 +1,247 @@
+"""
+Island-model parallel Tabu Search for MCLP.
+N TabuSearch islands with different seeds and tenures run in separate
+processes on one shared instance and pass their best solution around a
+ring every `migration_interval` iterations.
+"""
+
+import multiprocessing
+import multiprocessing.connection
+import signal
+from typing import Set, Tuple, List, Optional
+from instance_loader import MCLPInstance
+from tabu_search import TabuSearch, initial_solution
+from termination import Termination
+from bounds import upper_bound
+
+
+def island_tenures(n_islands: int, tenure: int) -> List[int]:
+    """Spread tenures from 0.5x to 1.5x the base tenure across islands."""
+    if n_islands == 1:
+        return [tenure]
+    return [
+        max(2, round(tenure * (0.5 + k / (n_islands - 1))))
+        for k in range(n_islands)
+    ]
+
+
+def _island_worker(
+    island: int,
+    instance: MCLPInstance,
+    ts_kwargs: dict,
+    migration_interval: int,
+    send_conn,
+    recv_conn,
+    result_conn,
+    deadline: Optional[float],
+    target_objective: Optional[float],
+    no_improvement_time: Optional[float],
+    bound: Optional[float],
+    cancel_event
+):
+    """
+    Run one island. Every island goes through the same number of epochs
+    (search segment, send best to the next island, receive from the
+    previous one), even after its own search has ended, so the ring never
+    blocks and migration is deterministic.
+    """
+    # The parent handles Ctrl+C and cancels islands through the event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    termination = Termination(
+        target_objective=target_objective, no_improvement_time=no_improvement_time,
+        deadline=deadline, upper_bound=bound, cancel_event=cancel_event
+    )
+    ts = TabuSearch(instance, termination=termination, **ts_kwargs)
+    ts.initialize_solution(initial_solution(instance, ts.seed))
+    
+    max_iterations = ts.max_iterations
+    n_epochs = -(-max_iterations // migration_interval)
+    active = True
+    migrations = 0
+    
+    for epoch in range(n_epochs):
+        if active:
+            first = epoch * migration_interval
+            active = ts.run_segment(first, min(first + migration_interval, max_iterations))
+        
+        send_conn.send((sorted(ts.best_K), ts.best_obj))
+        K, obj = recv_conn.recv()
+        if active and ts.accept_migrant(set(K), obj):
+            migrations += 1
+    
+    result_conn.send({
+        'island': island,
+        'seed': ts.seed,
+        'tenure': ts.tenure,
+        'best_obj': ts.best_obj,
+        'facilities': sorted(ts.best_K),
+        'iterations': ts.history.iterations,
+        'migrations_accepted': migrations,
+        'stop_reason': termination.reason or 'completed',
+        'trace': ts.history
+    })
+
+
+def _pool_context():
+    """Prefer 'fork' so islands inherit the instance without pickling."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def run_island_tabu_search(
+    instance: MCLPInstance,
+    n_islands: int = 4,
+    migration_interval: int = 100,
+    tenure: int = 10,
+    tenures: Optional[List[int]] = None,
+    candidate_list_size: int = 20,
+    max_iterations: int = 500,
+    stagnation_limit: int = 100,
+    intensification_freq: int = 50,
+    seed: int = 42,
+    verbose: bool = True,
+    trace_sample_every: int = 1,
+    time_limit: Optional[float] = None,
+    target_objective: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    neighborhood_workers: Optional[int] = None,
+    elite_size: int = 0,
+    visited_size: int = 0,
+    frequency_shake: bool = False
+) -> Tuple[Set[int], float, List[dict]]:
+    """
+    Island-model Tabu Search.
+    
+    Island k uses seed + k and tenures[k] (default: spread around `tenure`).
+    Every `migration_interval` iterations each island sends its best
+    solution to island k+1 (ring) and adopts the one it receives if that
+    beats its own best. Migration is synchronous, so results do not depend
+    on process timing. A target/upper bound reached on one island spreads
+    to all islands with the next migration. no_improvement_time applies to
+    each island separately.
+    
+    Returns:
+        best_facilities: Best solution over all islands
+        best_objective: Its objective
+        history: Per-island summaries (including each island's trace)
+    """
+    if termination is None:
+        termination = Termination(
+            time_limit, target_objective, upper_bound=upper_bound(instance)
+        )
+    if tenures is None:
+        tenures = island_tenures(n_islands, tenure)
+    if len(tenures) != n_islands:
+        raise ValueError(f"Expected {n_islands} tenures, got {len(tenures)}")
+    
+    if verbose:
+        print(f"Island Tabu Search: {n_islands} islands, migration every {migration_interval} iterations")
+        print(f"  Tenures: {tenures}")
+        print("="*70)
+    
+    ctx = _pool_context()
+    cancel_event = ctx.Event()
+    
+    # Ring channels: island k sends on ring[(k + 1) % n] and receives on ring[k]
+    ring = [ctx.Pipe(duplex=False) for _ in range(n_islands)]
+    results = [ctx.Pipe(duplex=False) for _ in range(n_islands)]
+    
+    processes = []
+    for k in range(n_islands):
+        ts_kwargs = {
+            'tenure': tenures[k],
+            'candidate_list_size': candidate_list_size,
+            'max_iterations': max_iterations,
+            'stagnation_limit': stagnation_limit,
+            'intensification_freq': intensification_freq,
+            'seed': seed + k,
+            'trace_sample_every': trace_sample_every,
+            'neighborhood_workers': neighborhood_workers,
+            'elite_size': elite_size,
+            'visited_size': visited_size,
+            'frequency_shake': frequency_shake,
+        }
+        process = ctx.Process(
+            target=_island_worker,
+            args=(
+                k, instance, ts_kwargs, migration_interval,
+                ring[(k + 1) % n_islands][1], ring[k][0], results[k][1],
+                termination.deadline, termination.target_objective,
+                termination.no_improvement_time, termination.upper_bound, cancel_event
+            ),
+            daemon=True
+        )
+        process.start()
+        processes.append(process)
+    
+    history: List[Optional[dict]] = [None] * n_islands
+    pending = {results[k][0]: k for k in range(n_islands)}
+    
+    try:
+        with termination.handle_sigint():
+            while pending:
+                for conn in multiprocessing.connection.wait(list(pending), timeout=0.1):
+                    history[pending.pop(conn)] = conn.recv()
+                
+                # Time/target criteria are checked by the islands themselves;
+                # the parent only forwards Ctrl+C and external cancellation
+                external = termination.cancel_event
+                if termination.reason is not None or (external is not None and external.is_set()):
+                    cancel_event.set()  # Islands finish their epochs without searching
+                if any(p.exitcode not in (None, 0) for p in processes):
+                    raise RuntimeError("An island process failed")
+    finally:
+        for process in processes:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.terminate()
+    
+    best = max(history, key=lambda h: (h['best_obj'], -h['island']))
+    for h in history:
+        termination.update(h['best_obj'], h['facilities'])
+    
+    if verbose:
+        for h in history:
+            print(f"Island {h['island']} (seed={h['seed']}, tenure={h['tenure']}): "
+                  f"best={h['best_obj']:.2f}, iterations={h['iterations']}, "
+                  f"migrations accepted={h['migrations_accepted']}, stop={h['stop_reason']}")
+        print("="*70)
+        print(f"Best solution found: obj={best['best_obj']:.2f} (island {best['island']})")
+    
+    return set(best['facilities']), best['best_obj'], history
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Island-model parallel Tabu Search for MCLP")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--islands", type=int, default=4)
+    parser.add_argument("--migration-interval", type=int, default=100)
+    parser.add_argument("--tenure", type=int, default=10)
+    parser.add_argument("--max-iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    start_time = time.time()
+    best_K, best_obj, history = run_island_tabu_search(
+        instance,
+        n_islands=args.islands,
+        migration_interval=args.migration_interval,
+        tenure=args.tenure,
+        max_iterations=args.max_iterations,
+        seed=args.seed,
+        time_limit=args.time_limit
+    )
+    runtime = time.time() - start_time
+    
+    print(f"\nTotal runtime: {runtime:.2f} seconds")
+    print(f"Best facilities: {sorted(best_K)}")
+    print(f"Budget used: {sum(instance.f[i] for i in best_K):.2f} / {instance.B:.2f}")
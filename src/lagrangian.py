@@ -0,0 +1,229 @@
+"""
+Lagrangian relaxation of the MCLP coverage constraints.
+
+Relaxing y_j <= sum_{i in I_j} x_i with multipliers 0 <= lambda_j <= d_j
+splits the problem into
+
+    L(lambda) = sum_j max(0, d_j - lambda_j)
+              + max {sum_i x_i sum_{j in J_i} lambda_j : sum_i f_i x_i <= B}
+
+whose knapsack part is solved as a fractional knapsack, so every L(lambda)
+is a valid upper bound. Subgradient steps (Polyak step size) start from
+lambda = 0, where L is the total demand. The knapsack solutions are
+repaired into feasible covers by a greedy fill (Lagrangian heuristic).
+All steps are vectorized over the CSR coverage arrays.
+"""
+
+import time
+import weakref
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+from instance_loader import MCLPInstance
+from termination import Termination
+
+# Bound of the default relaxation, computed once per loaded instance
+_bound_cache: "weakref.WeakKeyDictionary[MCLPInstance, float]" = weakref.WeakKeyDictionary()
+
+
+class LagrangianRelaxation:
+    def __init__(self, instance: MCLPInstance):
+        """Precompute the CSR index arrays of the instance."""
+        self.instance = instance
+        arr = instance.arrays
+        self.arrays = arr
+        self.n_I = len(arr.facility_ids)
+        self.n_J = len(arr.customer_ids)
+        # Nonzeros of the facility -> customer CSR as (facility, customer) positions
+        self._nz_fac = np.repeat(np.arange(self.n_I), np.diff(arr.fac_ptr))
+        self._nz_cust = arr.fac_cust
+        
+        # Zero-cost facilities rank first in the knapsack
+        self._cost = np.maximum(arr.f, 1e-12)
+    
+    def facility_value(self, w: np.ndarray) -> np.ndarray:
+        """sum_{j in J_i} w_j for every facility position i."""
+        return np.bincount(self._nz_fac, weights=w[self._nz_cust], minlength=self.n_I)
+    
+    def coverage(self, x: np.ndarray) -> np.ndarray:
+        """sum_{i in I_j} x_i for every customer position j."""
+        return np.bincount(self._nz_cust, weights=x[self._nz_fac], minlength=self.n_J)
+    
+    def knapsack(self, value: np.ndarray) -> np.ndarray:
+        """Optimal fractional knapsack x (last item fractional) for facility values."""
+        arr = self.arrays
+        x = np.zeros(self.n_I)
+        take = np.flatnonzero((value > 0) & (arr.f <= self.instance.B))
+        order = take[np.lexsort((take, -value[take] / self._cost[take]))]
+        
+        cumulative = np.cumsum(arr.f[order])
+        n_full = int(np.searchsorted(cumulative, self.instance.B, side='right'))
+        x[order[:n_full]] = 1.0
+        if n_full < len(order):
+            used = cumulative[n_full - 1] if n_full else 0.0
+            x[order[n_full]] = (self.instance.B - used) / self._cost[order[n_full]]
+        return x
+    
+    def evaluate(self, lam: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray]:
+        """
+        Solve the relaxation at lambda.
+        
+        Returns:
+            bound: L(lambda)
+            x: Knapsack solution (at most one fractional facility)
+            subgradient: dL/dlambda_j = coverage_j(x) - y_j
+        """
+        reduced = self.arrays.d - lam
+        y = (reduced > 0).astype(np.float64)
+        value = self.facility_value(lam)
+        x = self.knapsack(value)
+        bound = float(np.sum(np.maximum(reduced, 0.0)) + np.dot(value, x))
+        return bound, x, self.coverage(x) - y
+    
+    def repair(self, x: np.ndarray) -> Tuple[Set[int], float]:
+        """
+        Lagrangian heuristic: keep the integral facilities of x and fill
+        the remaining budget greedily by uncovered demand per cost.
+        """
+        arr = self.arrays
+        is_open = x >= 1.0 - 1e-9
+        budget_left = self.instance.B - float(arr.f[is_open].sum())
+        uncovered = self.coverage(is_open.astype(np.float64)) < 0.5
+        
+        while True:
+            gain = self.facility_value(arr.d * uncovered)
+            ratio = np.where(~is_open & (arr.f <= budget_left + 1e-9) & (gain > 0), gain / self._cost, -1.0)
+            best = int(np.argmax(ratio))
+            if ratio[best] <= 0:
+                break
+            is_open[best] = True
+            budget_left -= arr.f[best]
+            start, end = arr.fac_ptr[best], arr.fac_ptr[best + 1]
+            uncovered[arr.fac_cust[start:end]] = False
+        
+        K = set(arr.facility_ids[is_open].tolist())
+        return K, float(np.dot(arr.d, ~uncovered))
+
+
+def solve_lagrangian(
+    instance: MCLPInstance,
+    max_iterations: int = 1000,
+    alpha: float = 2.0,
+    stagnation: int = 20,
+    min_alpha: float = 1e-4,
+    heuristic_every: int = 10,
+    gap_tolerance: float = 1e-6,
+    time_limit: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    verbose: bool = False
+) -> Tuple[Set[int], float, Dict]:
+    """
+    Subgradient optimization of the Lagrangian dual with a Lagrangian heuristic.
+    
+    Args:
+        instance: Problem instance
+        max_iterations: Subgradient iterations
+        alpha: Initial Polyak step factor (halved after `stagnation`
+            iterations without a better bound)
+        stagnation: Iterations without bound improvement before halving alpha
+        min_alpha: Stop once alpha drops below this
+        heuristic_every: Repair the relaxed solution every k iterations
+        gap_tolerance: Stop once (UB - LB) / UB is below this
+        time_limit: Wall-clock seconds (ignored if termination is given)
+        termination: Shared termination criteria
+        verbose: Print progress
+    
+    Returns:
+        best_facilities: Best repaired solution
+        best_objective: Its covered demand (lower bound)
+        info: upper_bound (best L(lambda)), iterations, status, runtime
+    """
+    start_time = time.time()
+    if termination is None:
+        termination = Termination(time_limit)
+    
+    relaxation = LagrangianRelaxation(instance)
+    lam = np.zeros(relaxation.n_J)
+    
+    best_bound = float('inf')
+    best_K: Set[int] = set()
+    best_obj = 0.0
+    since_improvement = 0
+    iteration = 0
+    status = 'completed'
+    
+    with termination.handle_sigint():
+        for iteration in range(1, max_iterations + 1):
+            bound, x, subgradient = relaxation.evaluate(lam)
+            if bound < best_bound - 1e-9:
+                best_bound = bound
+                since_improvement = 0
+            else:
+                since_improvement += 1
+                if since_improvement >= stagnation:
+                    alpha /= 2
+                    since_improvement = 0
+            
+            if iteration == 1 or iteration % heuristic_every == 0:
+                K, obj = relaxation.repair(x)
+                termination.update(obj, K)
+                if obj > best_obj:
+                    best_K, best_obj = K, obj
+            
+            if verbose and iteration % 100 == 0:
+                print(f"  Iter {iteration}: UB={best_bound:.2f}, LB={best_obj:.2f}, alpha={alpha:.4f}")
+            
+            if best_bound - best_obj <= gap_tolerance * best_bound:
+                status = 'optimal'
+                break
+            if alpha < min_alpha:
+                break
+            if termination.should_stop():
+                status = termination.reason
+                break
+            
+            norm = float(np.dot(subgradient, subgradient))
+            if norm == 0:
+                break  # lambda is optimal for the dual
+            step = alpha * (bound - best_obj) / norm
+            lam = np.clip(lam - step * subgradient, 0.0, relaxation.arrays.d)
+    
+    info = {
+        'status': status,
+        'upper_bound': best_bound,
+        'iterations': iteration,
+        'runtime': time.time() - start_time
+    }
+    return best_K, best_obj, info
+
+
+def lagrangian_upper_bound(instance: MCLPInstance) -> float:
+    """Lagrangian bound with default settings (cached per instance)."""
+    bound = _bound_cache.get(instance)
+    if bound is None:
+        _, _, info = solve_lagrangian(instance)
+        bound = _bound_cache[instance] = info['upper_bound']
+    return bound
+
+
+if __name__ == "__main__":
+    import argparse
+    from bounds import upper_bound, optimality_gap
+    
+    parser = argparse.ArgumentParser(description="Lagrangian relaxation bound and heuristic for MCLP")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--max-iterations", type=int, default=1000)
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    K, obj, info = solve_lagrangian(
+        instance, max_iterations=args.max_iterations, time_limit=args.time_limit, verbose=True
+    )
+    
+    print(f"\nStatus: {info['status']} ({info['iterations']} iterations, {info['runtime']:.2f}s)")
+    print(f"Lagrangian heuristic: {obj:.2f}")
+    print(f"Lagrangian bound: {info['upper_bound']:.2f} (knapsack bound {upper_bound(instance):.2f})")
+    print(f"Gap: {optimality_gap(obj, info['upper_bound']):.2%}")
+    print(f"Facilities: {sorted(K)}")
@@ -7,13 +7,15 @@ import random
 import time
 from typing import Set, Tuple, Dict, Optional
 from instance_loader import MCLPInstance
+from termination import Termination
+from solution_hash import SolutionArchive
 
 
 class LocalSearch:
     def __init__(self, instance: MCLPInstance, seed: int = 42):
         self.instance = instance
         self.seed = seed
-        random.seed(seed)
+        self.rng = random.Random(seed)  # Private RNG: safe to run many searches concurrently
         
         # Current solution state
         self.K: Set[int] = set()  # Open facilities
@@ -25,6 +27,11 @@ class LocalSearch:
         self.covered_by_count: Dict[int, int] = {}  # How many facilities cover each customer
         self.move_count = 0
         self.revalidation_interval = 50
+        
+        # Zobrist hash of K, maintained only while running against an archive
+        self.zobrist_keys = None
+        self.solution_hash = 0
+        self.archive_hit = False  # Descent merged into an archived state
     
     def initialize_solution(self, initial_facilities: Set[int]):
         """Initialize from a given facility set."""
@@ -131,6 +138,9 @@ class LocalSearch:
                 self.covered.discard(j)
                 self.objective -= self.instance.d[j]
         
+        if self.zobrist_keys is not None:
+            self.solution_hash ^= self.zobrist_keys[i]
+        
         self.move_count += 1
     
     def apply_open(self, i: int):
@@ -147,6 +157,9 @@ class LocalSearch:
                 self.objective += self.instance.d[j]
             self.covered_by_count[j] += 1
         
+        if self.zobrist_keys is not None:
+            self.solution_hash ^= self.zobrist_keys[i]
+        
         self.move_count += 1
     
     def apply_swap(self, i_out: int, j_in: int):
@@ -162,8 +175,8 @@ class LocalSearch:
         # Randomize exploration order for diversification
         facilities_open = list(self.K)
         facilities_closed = list(set(self.instance.I) - self.K)
-        random.shuffle(facilities_open)
-        random.shuffle(facilities_closed)
+        self.rng.shuffle(facilities_open)
+        self.rng.shuffle(facilities_closed)
         
         best_move = None
         best_delta = 0.0
@@ -207,24 +220,58 @@ class LocalSearch:
         
         return False
     
-    def run(self, max_moves: int = 200, verbose: bool = False) -> Tuple[Set[int], float]:
+    def run(
+        self,
+        max_moves: int = 200,
+        verbose: bool = False,
+        termination: Optional[Termination] = None,
+        archive: Optional[SolutionArchive] = None
+    ) -> Tuple[Set[int], float]:
         """
-        Run local search until no improving move or max_moves reached.
+        Run local search until no improving move, max_moves reached, or
+        a termination criterion fires (the current solution is returned).
+        
+        With an archive, every state reached is recorded; the descent stops
+        as soon as it enters an already-archived state (its continuation has
+        been explored before) and sets self.archive_hit.
         Returns: (best_facilities, best_objective)
         """
+        if termination is None:
+            termination = Termination()
+        
+        if archive is not None:
+            self.zobrist_keys = archive.zobrist.keys
+            self.solution_hash = archive.zobrist.hash(self.K)
+        
         if verbose:
             print(f"Initial objective: {self.objective:.2f}")
         
-        for iteration in range(max_moves):
-            improved = self.first_improvement_step()
-            
-            if not improved:
-                if verbose:
-                    print(f"Local optimum reached at iteration {iteration}")
-                break
-            
-            if verbose and (iteration + 1) % 10 == 0:
-                print(f"  Iteration {iteration + 1}: obj={self.objective:.2f}, moves={self.move_count}")
+        termination.update(self.objective, self.K)
+        
+        with termination.handle_sigint():
+            for iteration in range(max_moves):
+                if termination.should_stop():
+                    if verbose:
+                        print(f"Stopped ({termination.reason}) at iteration {iteration}")
+                    break
+                
+                improved = self.first_improvement_step()
+                
+                if not improved:
+                    if verbose:
+                        print(f"Local optimum reached at iteration {iteration}")
+                    break
+                
+                termination.update(self.objective, self.K)
+                
+                if archive is not None and archive.check(self.solution_hash):
+                    self.archive_hit = True
+                    if verbose:
+                        print(f"Reached an archived state at iteration {iteration}, stopping")
+                    break
+                
+                if verbose and (iteration + 1) % 10 == 0:
+                    print(f"  Iteration {iteration + 1}: obj={self.objective:.2f}, moves={self.move_count}")
         
         if verbose:
             print(f"Final objective: {self.objective:.2f} (total moves: {self.move_count})")
@@ -237,16 +284,26 @@ def run_local_search(
     initial_facilities: Set[int],
     max_moves: int = 200,
     seed: int = 42,
-    verbose: bool = True
+    verbose: bool = True,
+    time_limit: Optional[float] = None,
+    target_objective: Optional[float] = None,
+    no_improvement_time: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    archive: Optional[SolutionArchive] = None
 ) -> Tuple[Set[int], float, int]:
     """
     Convenience wrapper for running local search.
+    A shared `termination` takes precedence over the individual criteria;
+    see LocalSearch.run for the optional solution archive.
     Returns: (facilities, objective, num_moves)
     """
+    if termination is None:
+        termination = Termination(time_limit, target_objective, no_improvement_time)
+    
     ls = LocalSearch(instance, seed=seed)
     ls.initialize_solution(initial_facilities)
     
-    K, obj = ls.run(max_moves=max_moves, verbose=verbose)
+    K, obj = ls.run(max_moves=max_moves, verbose=verbose, termination=termination, archive=archive)
     return K, obj, ls.move_count
 
 
@@ -258,6 +315,7 @@ if __name__ == "__main__":
     parser.add_argument("--instance", type=str, default="data/test_tiny.json")
     parser.add_argument("--seed", type=int, default=42)
     parser.add_argument("--max-moves", type=int, default=200)
+    parser.add_argument("--time-limit", type=float, default=None)
     args = parser.parse_args()
     
     # Load instance
@@ -276,7 +334,8 @@ if __name__ == "__main__":
     print("Step 2: Running Local Search...")
     print("="*60)
     K_final, obj_final, num_moves = run_local_search(
-        instance, K_init, max_moves=args.max_moves, seed=args.seed, verbose=True
+        instance, K_init, max_moves=args.max_moves, seed=args.seed, verbose=True,
+        time_limit=args.time_limit
     )
     
     # Summary
@@ -3,12 +3,20 @@ Multi-start wrapper for Local Search.
 Generates diverse initial solutions and tracks global best.
 """
 
+import concurrent.futures
+import math
+import multiprocessing
 import random
-from typing import Set, Tuple, List, Callable
+import signal
+from contextlib import contextmanager
+from typing import Set, Tuple, List, Dict, Callable, Optional
 from instance_loader import MCLPInstance
-from greedy import greedy_heuristic
-from closest_neighbor import closest_neighbor_heuristic
+from heuristic_cache import cached_greedy, cached_closest_neighbor
 from local_search import run_local_search
+from termination import Termination
+from solution_hash import ZobristTable, SolutionArchive
+from checkpoint import save_checkpoint, load_checkpoint
+from bounds import upper_bound
 
 
 def generate_perturbed_greedy(
@@ -18,24 +26,24 @@ def generate_perturbed_greedy(
 ) -> Set[int]:
     """
     Generate perturbed greedy solution:
-    1. Run greedy to get K
+    1. Take the (memoized) greedy solution K
     2. Remove random facilities (perturbation_rate fraction)
     3. Add different facilities within budget
     """
-    random.seed(seed)
-    K, _, _ = greedy_heuristic(instance, seed=seed)
+    rng = random.Random(seed)
+    K, _, _ = cached_greedy(instance)
     
     # Perturb: remove some facilities
     num_remove = max(1, int(len(K) * perturbation_rate))
     K_list = list(K)
-    random.shuffle(K_list)
+    rng.shuffle(K_list)
     to_remove = set(K_list[:num_remove])
     K = K - to_remove
     
     # Try to add different facilities
     budget_used = sum(instance.f[i] for i in K)
     candidates = list(set(instance.I) - K)
-    random.shuffle(candidates)
+    rng.shuffle(candidates)
     
     for i in candidates:
         if budget_used + instance.f[i] <= instance.B:
@@ -50,12 +58,12 @@ def generate_random_solution(instance: MCLPInstance, seed: int) -> Set[int]:
     Generate random feasible solution:
     Randomly add facilities until budget exhausted.
     """
-    random.seed(seed)
+    rng = random.Random(seed)
     K = set()
     budget_used = 0.0
     
     candidates = list(instance.I)
-    random.shuffle(candidates)
+    rng.shuffle(candidates)
     
     for i in candidates:
         if budget_used + instance.f[i] <= instance.B:
@@ -65,22 +73,516 @@ def generate_random_solution(instance: MCLPInstance, seed: int) -> Set[int]:
     return K
 
 
+def build_start(
+    instance: MCLPInstance,
+    start_idx: int,
+    n_starts: int,
+    base_seed: int
+) -> Tuple[str, Set[int], float]:
+    """
+    Initial solution of one start, depending only on (start_idx, n_starts,
+    base_seed). Returns: (method, K_init, obj_init)
+    """
+    seed = base_seed + start_idx
+    
+    # Determine initialization method
+    if start_idx == 0:
+        method = "Greedy"
+        K_init, obj_init, _ = cached_greedy(instance)
+    elif start_idx == 1:
+        method = "Closest-Neighbor"
+        K_init, obj_init, _ = cached_closest_neighbor(instance)
+    elif start_idx < n_starts // 2 + 1:
+        method = f"Perturbed-Greedy-{start_idx-2}"
+        K_init = generate_perturbed_greedy(instance, seed=seed)
+        obj_init, _ = instance.compute_coverage(K_init)
+    else:
+        method = f"Random-{start_idx - n_starts//2 - 1}"
+        K_init = generate_random_solution(instance, seed=seed)
+        obj_init, _ = instance.compute_coverage(K_init)
+    
+    return method, K_init, obj_init
+
+
+def descend_from(
+    instance: MCLPInstance,
+    start_idx: int,
+    method: str,
+    K_init: Set[int],
+    obj_init: float,
+    max_moves: int,
+    base_seed: int,
+    termination: Optional[Termination] = None,
+    archive: Optional[SolutionArchive] = None
+) -> dict:
+    """
+    Run local search from a built start and return the start's history record.
+    With an archive, the descent stops on entering an already-explored state
+    (record['archive_hit'] == 'descent').
+    """
+    seed = base_seed + start_idx
+    hits_before = archive.hits if archive is not None else 0
+    
+    K_final, obj_final, num_moves = run_local_search(
+        instance, K_init, max_moves=max_moves, seed=seed, verbose=False,
+        termination=termination, archive=archive
+    )
+    
+    record = _start_record(start_idx, method, seed, K_init, obj_init)
+    record.update({
+        'final_obj': obj_final,
+        'improvement': obj_final - obj_init,
+        'num_moves': num_moves,
+        'facilities': K_final,
+        'archive_hit': 'descent' if archive is not None and archive.hits > hits_before else None
+    })
+    return record
+
+
+def _start_record(start_idx: int, method: str, seed: int, K_init: Set[int], obj_init: float) -> dict:
+    """History record of a start before its descent (skipped starts keep K_init)."""
+    return {
+        'start_idx': start_idx,
+        'method': method,
+        'seed': seed,
+        'initial_obj': obj_init,
+        'initial_facilities': sorted(K_init),
+        'final_obj': obj_init,
+        'improvement': 0.0,
+        'num_moves': 0,
+        'facilities': set(K_init),
+        'archive_hit': 'start',
+        'allocation': None  # Racing decision that chose this start (adaptive mode)
+    }
+
+
+def run_start(
+    instance: MCLPInstance,
+    start_idx: int,
+    n_starts: int,
+    max_moves: int,
+    base_seed: int,
+    termination: Optional[Termination] = None,
+    archive: Optional[SolutionArchive] = None
+) -> dict:
+    """
+    Build the initial solution for one start and descend from it.
+    Without an archive the result depends only on (start_idx, n_starts,
+    base_seed), not on other starts, so starts can run in any order or
+    process with identical results. With an archive, a start equal to an
+    archived solution is skipped (record['archive_hit'] == 'start').
+    Returns the start's history record.
+    """
+    method, K_init, obj_init = build_start(instance, start_idx, n_starts, base_seed)
+    return _run_built_start(
+        instance, start_idx, method, K_init, obj_init, max_moves, base_seed,
+        termination, archive
+    )
+
+
+def _run_built_start(
+    instance: MCLPInstance,
+    start_idx: int,
+    method: str,
+    K_init: Set[int],
+    obj_init: float,
+    max_moves: int,
+    base_seed: int,
+    termination: Optional[Termination],
+    archive: Optional[SolutionArchive]
+) -> dict:
+    """Skip a start already in the archive, otherwise descend from it."""
+    if archive is not None and archive.check(archive.zobrist.hash(K_init)):
+        return _start_record(start_idx, method, base_seed + start_idx, K_init, obj_init)
+    
+    return descend_from(
+        instance, start_idx, method, K_init, obj_init, max_moves, base_seed,
+        termination=termination, archive=archive
+    )
+
+
+# Randomized initialization methods raced against each other in adaptive mode
+RANDOMIZED_METHODS: Dict[str, Callable[[MCLPInstance, int], Set[int]]] = {
+    'Perturbed-Greedy': lambda instance, seed: generate_perturbed_greedy(instance, seed=seed),
+    'Random': lambda instance, seed: generate_random_solution(instance, seed=seed),
+}
+
+
+class MethodRace:
+    def __init__(self, methods: List[str], exploration: float = 0.5):
+        """
+        UCB1 race between initialization methods.
+        
+        A method's reward is the final objective of its starts, min-max
+        normalized over all local optima seen so far (so it is in [0, 1]
+        whatever the instance scale); a start skipped as a duplicate earns 0.
+        Pulls are counted when a method is
+        chosen, so a batch of parallel decisions spreads across methods.
+        """
+        self.methods = list(methods)
+        self.exploration = exploration
+        self.pulls = {m: 0 for m in self.methods}
+        self.results: Dict[str, List[Optional[float]]] = {m: [] for m in self.methods}
+    
+    def scores(self, observed: List[float]) -> Dict[str, float]:
+        """UCB score per method given all final objectives observed so far."""
+        lo = min(observed, default=0.0)
+        hi = max(observed, default=0.0)
+        total = sum(self.pulls.values())
+        
+        scores = {}
+        for m in self.methods:
+            if self.pulls[m] == 0:
+                scores[m] = float('inf')  # Try every method once
+                continue
+            if self.results[m]:
+                rewards = [
+                    0.0 if obj is None else (obj - lo) / (hi - lo) if hi > lo else 1.0
+                    for obj in self.results[m]
+                ]
+                mean = sum(rewards) / len(rewards)
+            else:
+                mean = 1.0  # Only pending starts: optimistic
+            scores[m] = mean + self.exploration * math.sqrt(2 * math.log(total) / self.pulls[m])
+        return scores
+    
+    def choose(self, observed: List[float]) -> Tuple[str, Dict[str, float]]:
+        """Pick the method with the highest score (ties: declaration order)."""
+        scores = self.scores(observed)
+        method = max(self.methods, key=lambda m: scores[m])
+        self.pulls[method] += 1
+        return method, scores
+    
+    def update(self, method: str, final_obj: Optional[float]):
+        """Report the local optimum reached by a start of `method` (None: duplicate start)."""
+        self.results[method].append(final_obj)
+
+
+# Worker-process state for parallel multistart
+_worker_instance: Optional[MCLPInstance] = None
+_worker_cancel = None
+
+
+def _init_worker(instance: MCLPInstance, cancel_event):
+    """
+    Pool initializer. Under the 'fork' start method the instance is
+    inherited from the parent without pickling (shared copy-on-write);
+    under 'spawn' it is transferred once per worker, not once per start.
+    """
+    global _worker_instance, _worker_cancel
+    _worker_instance = instance
+    _worker_cancel = cancel_event
+    # The parent handles Ctrl+C and cancels workers through the event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _run_start_in_worker(
+    start_idx: int,
+    n_starts: int,
+    max_moves: int,
+    base_seed: int,
+    deadline: Optional[float],
+    target_objective: Optional[float],
+    bound: Optional[float],
+    start: Optional[Tuple[str, Set[int], float]] = None
+) -> dict:
+    """Run one start (optionally prebuilt by the parent) on the worker's shared instance."""
+    termination = Termination(
+        target_objective=target_objective, deadline=deadline,
+        upper_bound=bound, cancel_event=_worker_cancel
+    )
+    if start is None:
+        return run_start(
+            _worker_instance, start_idx, n_starts, max_moves, base_seed,
+            termination=termination
+        )
+    method, K_init, obj_init = start
+    return descend_from(
+        _worker_instance, start_idx, method, K_init, obj_init, max_moves, base_seed,
+        termination=termination
+    )
+
+
+def _pool_context():
+    """Prefer 'fork' (zero-copy instance sharing) where the platform supports it."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+@contextmanager
+def _start_pool(instance: MCLPInstance, workers: int):
+    """
+    Process pool sharing the instance, with the event that cancels its
+    starts. On exit running starts are signalled to return early and
+    pending ones are dropped.
+    """
+    ctx = _pool_context()
+    cancel_event = ctx.Event()
+    
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, mp_context=ctx,
+        initializer=_init_worker, initargs=(instance, cancel_event)
+    ) as pool:
+        try:
+            yield pool, cancel_event
+        finally:
+            cancel_event.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _race_result(record: dict) -> Optional[float]:
+    """Local optimum a start contributes to the race (None: duplicate start)."""
+    return None if record['archive_hit'] == 'start' else record['final_obj']
+
+
+@contextmanager
+def _no_pool():
+    """Stand-in for _start_pool in serial mode."""
+    yield None, None
+
+
+def _await_record(future, termination: Termination) -> Optional[dict]:
+    """
+    Wait for a start's record, polling so Ctrl+C / deadline in the parent
+    are noticed while waiting. Returns None if the search should stop.
+    """
+    if isinstance(future, dict):  # Duplicate start, skipped in the parent
+        return future
+    while True:
+        try:
+            return future.result(timeout=0.1)
+        except concurrent.futures.TimeoutError:
+            if termination.should_stop():
+                return None
+
+
+def _collect_best(futures: list, cancel_event) -> Optional[dict]:
+    """
+    After the parent stopped: drop pending starts, signal running ones to
+    return their incumbents, and return the best record among them (None
+    if no start had begun).
+    """
+    cancel_event.set()
+    for future in futures:
+        if not isinstance(future, dict):
+            future.cancel()
+    best = None
+    for future in futures:
+        if isinstance(future, dict):
+            record = future
+        elif future.cancelled():
+            continue
+        else:
+            record = future.result()
+        if best is None or record['final_obj'] > best['final_obj']:
+            best = record
+    return best
+
+
+def _iter_parallel_starts(
+    instance: MCLPInstance,
+    n_starts: int,
+    max_moves: int,
+    base_seed: int,
+    termination: Termination,
+    workers: int,
+    archive: Optional[SolutionArchive] = None,
+    first_start: int = 0
+):
+    """
+    Yield start records in start_idx order (from first_start) while a
+    process pool computes them. Stopping the generator cancels pending starts and signals
+    running ones to return early. When the termination fires while waiting,
+    the starts already running return their incumbents and the best of them
+    is yielded last.
+    
+    With an archive, starts are built in the parent and duplicates are
+    skipped without being submitted; descents run without the archive.
+    """
+    with _start_pool(instance, workers) as (pool, cancel_event):
+        futures = []
+        for start_idx in range(first_start, n_starts):
+            start = None
+            if archive is not None:
+                start = build_start(instance, start_idx, n_starts, base_seed)
+                if archive.check(archive.zobrist.hash(start[1])):
+                    futures.append(_start_record(start_idx, start[0], base_seed + start_idx, start[1], start[2]))
+                    continue
+            futures.append(pool.submit(
+                _run_start_in_worker, start_idx, n_starts, max_moves, base_seed,
+                termination.deadline, termination.target_objective, termination.upper_bound,
+                start
+            ))
+        
+        for position, future in enumerate(futures):
+            record = _await_record(future, termination)
+            if record is None:
+                record = _collect_best(futures[position:], cancel_event)
+                if record is not None:
+                    yield record
+                return
+            yield record
+
+
+def _iter_adaptive_starts(
+    instance: MCLPInstance,
+    n_starts: int,
+    max_moves: int,
+    base_seed: int,
+    termination: Termination,
+    workers: int,
+    archive: Optional[SolutionArchive] = None,
+    completed: List[dict] = ()
+):
+    """
+    Yield start records while racing the randomized initialization methods.
+    
+    Greedy and Closest-Neighbor run once as starts 0 and 1; every further
+    start goes to the method chosen by a MethodRace over the local optima
+    reached so far. With workers > 1 decisions are made in batches of
+    `workers` starts, each batch seeing all earlier results, so the outcome
+    depends on the worker count but not on timing.
+    
+    `completed` records (a resumed run) are replayed into the race and
+    continued from; they must end on a batch boundary.
+    """
+    race = MethodRace(list(RANDOMIZED_METHODS))
+    observed: List[float] = []
+    
+    for record in completed:
+        final_obj = _race_result(record)
+        if final_obj is not None:
+            observed.append(final_obj)
+        if record['allocation'] is not None:
+            race.pulls[record['allocation']['method']] += 1
+            race.update(record['allocation']['method'], final_obj)
+    
+    with (_start_pool(instance, workers) if workers > 1 else _no_pool()) as (pool, cancel_event):
+        batch_start = len(completed)
+        while batch_start < n_starts:
+            batch_end = min(batch_start + workers, n_starts)
+            
+            batch = []
+            for start_idx in range(batch_start, batch_end):
+                if start_idx < 2:
+                    method, K_init, obj_init = build_start(instance, start_idx, n_starts, base_seed)
+                    decision = None
+                else:
+                    arm, scores = race.choose(observed)
+                    method = f"{arm}-{race.pulls[arm] - 1}"
+                    K_init = RANDOMIZED_METHODS[arm](instance, base_seed + start_idx)
+                    obj_init, _ = instance.compute_coverage(K_init)
+                    decision = {'method': arm, 'scores': scores}
+                
+                if pool is None:
+                    future = None  # Run lazily below so a stop skips later starts
+                elif archive is not None and archive.check(archive.zobrist.hash(K_init)):
+                    future = _start_record(start_idx, method, base_seed + start_idx, K_init, obj_init)
+                else:
+                    future = pool.submit(
+                        _run_start_in_worker, start_idx, n_starts, max_moves, base_seed,
+                        termination.deadline, termination.target_objective,
+                        termination.upper_bound, (method, K_init, obj_init)
+                    )
+                batch.append((start_idx, method, K_init, obj_init, decision, future))
+            
+            for position, (start_idx, method, K_init, obj_init, decision, future) in enumerate(batch):
+                if pool is None:
+                    record = _run_built_start(
+                        instance, start_idx, method, K_init, obj_init, max_moves,
+                        base_seed, termination, archive
+                    )
+                else:
+                    record = _await_record(future, termination)
+                    if record is None:
+                        record = _collect_best([entry[-1] for entry in batch[position:]], cancel_event)
+                        if record is not None:
+                            yield record
+                        return
+                
+                record['allocation'] = decision
+                final_obj = _race_result(record)
+                if final_obj is not None:
+                    observed.append(final_obj)
+                if decision is not None:
+                    race.update(decision['method'], final_obj)
+                yield record
+            
+            batch_start = batch_end
+
+
+def _print_start(record: dict, n_starts: int):
+    """Verbose per-start report."""
+    print(f"\nStart {record['start_idx'] + 1}/{n_starts} ({record['method']})")
+    print(f"  Initial: obj={record['initial_obj']:.2f}, facilities={record['initial_facilities']}")
+    if record['allocation'] is not None:
+        scores = ", ".join(f"{m}={s:.3f}" for m, s in record['allocation']['scores'].items())
+        print(f"  Allocated by race: {scores}")
+    if record['archive_hit'] == 'start':
+        print("  Duplicate start, skipped")
+        return
+    print(f"  Final:   obj={record['final_obj']:.2f}, improvement={record['improvement']:+.2f}, "
+          f"moves={record['num_moves']}")
+    if record['archive_hit'] == 'descent':
+        print("  Descent reached an explored state, terminated")
+
+
 def multistart_local_search(
     instance: MCLPInstance,
     n_starts: int = 10,
     max_moves: int = 200,
     base_seed: int = 42,
-    verbose: bool = True
+    verbose: bool = True,
+    time_limit: Optional[float] = None,
+    target_objective: Optional[float] = None,
+    no_improvement_time: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    workers: int = 1,
+    dedupe: bool = False,
+    allocation: str = 'fixed',
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 1,
+    resume: bool = False
 ) -> Tuple[Set[int], float, List[dict]]:
     """
     Multi-start local search with diverse initialization.
     
-    Initialization strategy:
+    Initialization strategy (allocation='fixed'):
     - 1x deterministic Greedy
     - 1x deterministic Closest-Neighbor
     - (n_starts - 2) / 2 perturbed Greedy
     - (n_starts - 2) / 2 random solutions
     
+    With allocation='adaptive', the starts after Greedy and Closest-Neighbor
+    are raced (UCB1) between the perturbed-greedy and random methods, so the
+    remaining budget goes to whichever method yields the better local
+    optima. Each record's 'allocation' logs the decision and method scores.
+    
+    Termination criteria are global across all starts; when one fires the
+    running descent stops and the best solution so far is returned. Search
+    also stops once a start matches a cheap upper bound (proven optimal).
+    A shared `termination` takes precedence over the individual criteria.
+    
+    With workers > 1 starts run on a process pool. Each start's seed is
+    base_seed + start_idx and results are merged in start order, so the
+    outcome is identical to serial mode for any worker count (time-based
+    criteria aside, which are only checked between starts in the parent
+    for no_improvement_time). Workers share the run's deadline; when a
+    criterion fires, the starts still running return their incumbents and
+    the best of them is kept.
+    
+    With dedupe=True, start solutions and every state visited during the
+    descents are kept in a hashed archive. A duplicate start is skipped and
+    a descent that enters an explored state is terminated; each record's
+    'archive_hit' is 'start', 'descent' or None. In parallel mode only
+    duplicate starts are detected (workers do not share the archive).
+    
+    With checkpoint_path, completed start records (and the archive) are
+    saved every checkpoint_every starts; resume=True skips the starts of an
+    existing checkpoint, giving the same result as an uninterrupted run.
+    A start cut short by Ctrl+C is not saved and reruns on resume.
+    
     Returns:
         best_facilities: Best solution found
         best_objective: Best objective value
@@ -90,65 +592,127 @@ def multistart_local_search(
         print(f"Multi-Start Local Search: {n_starts} starts")
         print("="*70)
     
+    if termination is None:
+        termination = Termination(
+            time_limit, target_objective, no_improvement_time,
+            upper_bound=upper_bound(instance)
+        )
+    
     global_best_K = None
     global_best_obj = -float('inf')
     history = []
     
-    for start_idx in range(n_starts):
-        seed = base_seed + start_idx
-        
-        # Determine initialization method
-        if start_idx == 0:
-            method = "Greedy"
-            K_init, obj_init, _ = greedy_heuristic(instance, seed=seed)
-        elif start_idx == 1:
-            method = "Closest-Neighbor"
-            K_init, obj_init, _ = closest_neighbor_heuristic(instance, seed=seed)
-        elif start_idx < n_starts // 2 + 1:
-            method = f"Perturbed-Greedy-{start_idx-2}"
-            K_init = generate_perturbed_greedy(instance, seed=seed)
-            obj_init, _ = instance.compute_coverage(K_init)
-        else:
-            method = f"Random-{start_idx - n_starts//2 - 1}"
-            K_init = generate_random_solution(instance, seed=seed)
-            obj_init, _ = instance.compute_coverage(K_init)
-        
-        if verbose:
-            print(f"\nStart {start_idx + 1}/{n_starts} ({method})")
-            print(f"  Initial: obj={obj_init:.2f}, facilities={sorted(K_init)}")
-        
-        # Run Local Search
-        K_final, obj_final, num_moves = run_local_search(
-            instance, K_init, max_moves=max_moves, seed=seed, verbose=False
-        )
-        
-        if verbose:
-            improvement = obj_final - obj_init
-            print(f"  Final:   obj={obj_final:.2f}, improvement={improvement:+.2f}, moves={num_moves}")
-        
-        # Track history
-        history.append({
-            'start_idx': start_idx,
-            'method': method,
-            'seed': seed,
-            'initial_obj': obj_init,
-            'final_obj': obj_final,
-            'improvement': obj_final - obj_init,
-            'num_moves': num_moves,
-            'facilities': K_final
+    if allocation not in ('fixed', 'adaptive'):
+        raise ValueError(f"Unknown allocation: {allocation}")
+    
+    archive = SolutionArchive(ZobristTable(instance.I)) if dedupe else None
+    
+    # Everything the sequence of starts depends on
+    settings = {
+        'n_starts': n_starts, 'max_moves': max_moves, 'base_seed': base_seed,
+        'dedupe': dedupe, 'allocation': allocation,
+        'workers': max(1, workers) if allocation == 'adaptive' else None
+    }
+    finished = False
+    if resume and checkpoint_path:
+        data = load_checkpoint(checkpoint_path, 'multistart', instance.fingerprint)
+        if data is not None:
+            if data['settings'] != settings:
+                raise ValueError(f"Checkpoint settings {data['settings']} differ from {settings}")
+            history = data['history']
+            finished = data['finished']
+            if allocation == 'adaptive' and not finished:
+                history = history[:len(history) - len(history) % max(1, workers)]
+            if data['archive'] is not None:
+                archive = data['archive']
+            elif archive is not None:
+                # Parallel modes only archive start solutions: replay them
+                for record in history:
+                    archive.check(archive.zobrist.hash(record['initial_facilities']))
+            if verbose:
+                print(f"Resuming after {len(history)} completed starts")
+    
+    for record in history:
+        termination.update(record['final_obj'], record['facilities'])
+        if record['final_obj'] > global_best_obj:
+            global_best_obj = record['final_obj']
+            global_best_K = record['facilities']
+    
+    def checkpoint(done: bool):
+        save_checkpoint(checkpoint_path, 'multistart', instance.fingerprint, {
+            'settings': settings,
+            'history': history,
+            'archive': archive if workers <= 1 else None,
+            'finished': done
         })
-        
-        # Update global best
-        if obj_final > global_best_obj:
-            global_best_obj = obj_final
-            global_best_K = K_final
+    
+    if finished:
+        records = iter(())
+    elif allocation == 'adaptive':
+        records = _iter_adaptive_starts(
+            instance, n_starts, max_moves, base_seed, termination, max(1, workers), archive,
+            completed=history
+        )
+    elif workers > 1:
+        records = _iter_parallel_starts(
+            instance, n_starts, max_moves, base_seed, termination, workers, archive,
+            first_start=len(history)
+        )
+    else:
+        records = (
+            run_start(instance, start_idx, n_starts, max_moves, base_seed, termination, archive)
+            for start_idx in range(len(history), n_starts)
+        )
+    
+    with termination.handle_sigint():
+        for record in records:
+            if termination.reason in ('interrupted', 'cancelled'):
+                # Possibly cut short: keep its solution, but rerun it on resume
+                if record['final_obj'] > global_best_obj:
+                    global_best_obj = record['final_obj']
+                    global_best_K = record['facilities']
+                break
+            
+            history.append(record)
+            termination.update(record['final_obj'], record['facilities'])
+            
             if verbose:
-                print(f"  [*] New global best!")
+                _print_start(record, n_starts)
+            
+            # Update global best
+            if record['final_obj'] > global_best_obj:
+                global_best_obj = record['final_obj']
+                global_best_K = record['facilities']
+                if verbose:
+                    print(f"  [*] New global best!")
+            
+            if termination.should_stop():
+                if verbose and len(history) < n_starts:
+                    print(f"\n[Stopped ({termination.reason}) after {len(history)} starts]")
+                break
+            
+            if checkpoint_path and len(history) % checkpoint_every == 0:
+                checkpoint(done=False)
+        
+        if hasattr(records, 'close'):
+            records.close()
+    
+    if checkpoint_path and termination.reason not in ('interrupted', 'cancelled'):
+        checkpoint(done=True)
     
     if verbose:
         print("\n" + "="*70)
         print(f"Best solution found: obj={global_best_obj:.2f}")
         print(f"Open facilities: {sorted(global_best_K)}")
+        if archive is not None:
+            skipped = sum(1 for h in history if h['archive_hit'] == 'start')
+            terminated = sum(1 for h in history if h['archive_hit'] == 'descent')
+            print(f"Archive: {len(archive)} states, {archive.hits} hits "
+                  f"({skipped} starts skipped, {terminated} descents terminated)")
+        if allocation == 'adaptive':
+            counts = {m: sum(1 for h in history if h['allocation'] and h['allocation']['method'] == m)
+                      for m in RANDOMIZED_METHODS}
+            print("Allocation: " + ", ".join(f"{m}={c}" for m, c in counts.items()))
     
     return global_best_K, global_best_obj, history
 
@@ -161,6 +725,12 @@ if __name__ == "__main__":
     parser.add_argument("--n-starts", type=int, default=10)
     parser.add_argument("--max-moves", type=int, default=200)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--dedupe", action="store_true",
+                        help="Skip duplicate starts and terminate descents at explored states")
+    parser.add_argument("--allocation", choices=["fixed", "adaptive"], default="fixed",
+                        help="Split starts by a fixed rule or race initialization methods")
     args = parser.parse_args()
     
     # Load instance
@@ -176,7 +746,11 @@ if __name__ == "__main__":
         n_starts=args.n_starts,
         max_moves=args.max_moves,
         base_seed=args.seed,
-        verbose=True
+        verbose=True,
+        time_limit=args.time_limit,
+        workers=args.workers,
+        dedupe=args.dedupe,
+        allocation=args.allocation
     )
     
     runtime = time.time() - start_time
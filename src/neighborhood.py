@@ -0,0 +1,167 @@
+"""
+Vectorized (and optionally multi-threaded) neighborhood evaluation for
+Tabu Search. All close/open/swap deltas of an iteration are computed with
+sparse matrix kernels over the coverage matrix, which release the GIL, so
+the swap neighborhood can be partitioned across threads; per-partition
+top-k candidates are merged under a total order, so the chosen move does
+not depend on the number of threads.
+"""
+
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+import numpy as np
+import scipy.sparse as sp
+from instance_loader import MCLPInstance
+
+# Sparse 0/1 coverage matrix (n_I x n_J), built once per loaded instance
+_matrix_cache: "weakref.WeakKeyDictionary[MCLPInstance, sp.csr_matrix]" = weakref.WeakKeyDictionary()
+
+# Deltas are rounded before ranking so that summation-order noise between
+# differently shaped partitions cannot reorder tied moves
+_DECIMALS = 9
+
+
+def coverage_matrix(instance: MCLPInstance) -> sp.csr_matrix:
+    """CSR coverage matrix A[i, j] = 1 if facility position i covers customer position j."""
+    A = _matrix_cache.get(instance)
+    if A is None:
+        arr = instance.arrays
+        A = sp.csr_matrix(
+            (np.ones(len(arr.fac_cust)), arr.fac_cust, arr.fac_ptr),
+            shape=(len(arr.facility_ids), len(arr.customer_ids))
+        )
+        _matrix_cache[instance] = A
+    return A
+
+
+def _top_k(delta: np.ndarray, k: int) -> np.ndarray:
+    """
+    Flat indices of the k best finite entries of a row-major (i, j) block,
+    ordered by (-delta, i, j). Ties at the cut-off are all considered, so
+    the result is exact.
+    """
+    flat = delta.ravel()
+    finite = np.flatnonzero(np.isfinite(flat))
+    if len(finite) > k:
+        threshold = np.partition(flat[finite], len(finite) - k)[len(finite) - k]
+        finite = finite[flat[finite] >= threshold]
+    # Row-major flat index encodes (i, j), so it breaks ties in that order
+    order = np.lexsort((finite, -flat[finite]))
+    return finite[order[:k]]
+
+
+class VectorizedNeighborhood:
+    def __init__(self, instance: MCLPInstance, workers: int = 1):
+        """
+        Args:
+            instance: Problem instance (its sparse coverage matrix is cached)
+            workers: Threads sharing the swap neighborhood (rows = open facility)
+        """
+        self.instance = instance
+        self.arrays = instance.arrays
+        self.A = coverage_matrix(instance)
+        self.workers = max(1, workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        
+        ids = self.arrays.facility_ids.tolist()
+        self._fac_pos = {i: p for p, i in enumerate(ids)}
+        self._customer_ids = self.arrays.customer_ids.tolist()
+    
+    def close(self):
+        """Release worker threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    def _swap_block(self, rows, closed, closed_w1, gain_closed, loss, budget_used, k):
+        """
+        Top-k swaps (i_out in rows, j_in in closed) as (delta, i_pos, j_pos)
+        arrays; closed_w1 is the coverage of the closed facilities weighted by
+        singly-covered demand (len(closed) x n_J, CSR).
+        """
+        arr = self.arrays
+        # Customers covered only by i_out stay covered if j_in covers them
+        interaction = (closed_w1 @ self.A[rows].toarray().T).T
+        delta = gain_closed[None, :] + interaction - loss[rows][:, None]
+        cost_diff = arr.f[closed][None, :] - arr.f[rows][:, None]
+        delta[budget_used + cost_diff > self.instance.B] = -np.inf
+        delta = np.round(delta, _DECIMALS)
+        
+        best = _top_k(delta, k)
+        r, c = np.divmod(best, len(closed))
+        return delta.ravel()[best], rows[r], closed[c]
+    
+    def candidate_moves(self, ts, k: int) -> List[Tuple[str, object, float, bool]]:
+        """
+        The k best moves of the current TabuSearch state, in the candidate
+        format of TabuSearch.generate_candidate_moves, sorted by
+        (-delta, move type, facility IDs).
+        """
+        arr = self.arrays
+        fac_ids = arr.facility_ids
+        count = np.fromiter(
+            (ts.covered_by_count[j] for j in self._customer_ids),
+            dtype=np.float64, count=len(self._customer_ids)
+        )
+        w0 = arr.d * (count == 0)
+        w1 = arr.d * (count == 1)
+        
+        is_open = np.zeros(len(fac_ids), dtype=bool)
+        is_open[[self._fac_pos[i] for i in ts.K]] = True
+        open_pos = np.flatnonzero(is_open)
+        closed_pos = np.flatnonzero(~is_open)
+        
+        gain = self.A @ w0   # demand newly covered by opening each facility
+        loss = self.A @ w1   # demand lost by closing each facility
+        budget_used = ts.budget_used
+        
+        # (delta, type rank, i_pos, j_pos); j_pos = -1 for flips
+        parts = []
+        
+        close_delta = np.round(-loss[open_pos], _DECIMALS)
+        parts.append((close_delta, np.full(len(open_pos), 0), open_pos, np.full(len(open_pos), -1)))
+        
+        feasible = budget_used + arr.f[closed_pos] <= self.instance.B
+        open_delta = np.round(gain[closed_pos[feasible]], _DECIMALS)
+        parts.append((open_delta, np.full(len(open_delta), 1), closed_pos[feasible], np.full(len(open_delta), -1)))
+        
+        if len(open_pos) and len(closed_pos):
+            gain_closed = gain[closed_pos]
+            # Only the closed facilities enter the swap product
+            closed_A = self.A[closed_pos]
+            closed_w1 = sp.csr_matrix(
+                (closed_A.data * w1[closed_A.indices], closed_A.indices, closed_A.indptr),
+                shape=closed_A.shape
+            )
+            blocks = np.array_split(open_pos, min(self.workers, len(open_pos)))
+            if self._pool is None:
+                results = [
+                    self._swap_block(b, closed_pos, closed_w1, gain_closed, loss, budget_used, k) for b in blocks
+                ]
+            else:
+                results = list(self._pool.map(
+                    lambda b: self._swap_block(b, closed_pos, closed_w1, gain_closed, loss, budget_used, k),
+                    blocks
+                ))
+            for delta, i_pos, j_pos in results:
+                parts.append((delta, np.full(len(delta), 2), i_pos, j_pos))
+        
+        delta = np.concatenate([p[0] for p in parts])
+        rank = np.concatenate([p[1] for p in parts])
+        i_pos = np.concatenate([p[2] for p in parts])
+        j_pos = np.concatenate([p[3] for p in parts])
+        
+        order = np.lexsort((j_pos, i_pos, rank, -delta))[:k]
+        
+        candidates = []
+        for idx in order.tolist():
+            i = int(fac_ids[i_pos[idx]])
+            if rank[idx] == 0:
+                candidates.append(('close', i, float(delta[idx]), ts.is_tabu(i)))
+            elif rank[idx] == 1:
+                candidates.append(('open', i, float(delta[idx]), ts.is_tabu(i)))
+            else:
+                j = int(fac_ids[j_pos[idx]])
+                candidates.append(('swap', (i, j), float(delta[idx]), ts.is_tabu(i) or ts.is_tabu(j)))
+        return candidates
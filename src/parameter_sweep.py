@@ -60,7 +60,7 @@ def parameter_sweep(
                     'objective': best_obj,
                     'coverage_pct': best_obj / instance.total_demand * 100,
                     'runtime': runtime,
-                    'num_iterations': len(history),
+                    'num_iterations': history.iterations,
                     'facilities': ','.join(map(str, sorted(best_K)))
                 })
                 
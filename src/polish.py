@@ -0,0 +1,225 @@
+"""
+MIP-based polishing of heuristic MCLP solutions.
+
+Each round frees a small kernel of facilities (the open ones plus the
+closed ones covering the most uncovered demand or the most demand that
+only one open facility covers, i.e. candidate replacements, with a few
+random picks for diversity), fixes every other facility at its
+incumbent value, and
+solves the restricted compact model with CBC under a short time limit.
+A local-branching constraint limits the number of changed facilities; it
+is widened when a round fails to improve.
+"""
+
+import random
+import time
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+import pulp
+from instance_loader import MCLPInstance
+from compact_model import available_solver, solver_backend
+from termination import Termination
+
+
+def _restricted_model(
+    instance: MCLPInstance,
+    is_open: np.ndarray,
+    free: np.ndarray,
+    max_changes: Optional[int]
+) -> Tuple[pulp.LpProblem, Dict[int, pulp.LpVariable]]:
+    """
+    Compact model over the free facility positions with all other
+    facilities fixed at is_open. Customers covered by fixed open
+    facilities (or by no free one) are left out. Returns the problem and
+    the x variables by facility position.
+    """
+    arr = instance.arrays
+    fixed_open = is_open & ~free
+    budget = instance.B - float(arr.f[fixed_open].sum())
+    
+    nz_cust = np.repeat(np.arange(len(arr.customer_ids)), np.diff(arr.cust_ptr))
+    covered_fixed = np.bincount(nz_cust, weights=fixed_open[arr.cust_fac], minlength=len(arr.customer_ids)) > 0
+    coverable = np.bincount(nz_cust, weights=free[arr.cust_fac], minlength=len(arr.customer_ids)) > 0
+    customers = np.flatnonzero(coverable & ~covered_fixed)
+    
+    problem = pulp.LpProblem(f"MCLP_polish_{instance.name}", pulp.LpMaximize)
+    x = {p: pulp.LpVariable(f"x_{p}", cat='Binary') for p in np.flatnonzero(free).tolist()}
+    y = [pulp.LpVariable(f"y_{q}", lowBound=0, upBound=1) for q in customers.tolist()]
+    
+    problem += pulp.LpAffineExpression(zip(y, arr.d[customers].tolist())), "covered_demand"
+    problem += pulp.LpAffineExpression((x[p], float(arr.f[p])) for p in x) <= budget, "budget"
+    
+    ptr = arr.cust_ptr
+    for y_q, q in zip(y, customers.tolist()):
+        row = [(y_q, 1)] + [(x[p], -1) for p in arr.cust_fac[ptr[q]:ptr[q + 1]].tolist() if p in x]
+        problem += pulp.LpAffineExpression(row) <= 0, f"cover_{q}"
+    
+    if max_changes is not None:
+        # Local branching: Hamming distance to the incumbent on the kernel
+        changes = pulp.LpAffineExpression(
+            (x[p], -1 if is_open[p] else 1) for p in x
+        )
+        problem += changes <= max_changes - int(is_open[free].sum()), "local_branching"
+    
+    # MIP start: the incumbent
+    for p, v in x.items():
+        v.setInitialValue(1 if is_open[p] else 0)
+    covered_open = np.bincount(nz_cust, weights=(is_open & free)[arr.cust_fac], minlength=len(arr.customer_ids)) > 0
+    for y_q, q in zip(y, customers.tolist()):
+        y_q.setInitialValue(1 if covered_open[q] else 0)
+    return problem, x
+
+
+def polish(
+    instance: MCLPInstance,
+    K: Set[int],
+    rounds: int = 20,
+    kernel_size: int = 60,
+    random_picks: int = 5,
+    max_changes: int = 4,
+    patience: int = 5,
+    mip_time_limit: float = 10.0,
+    time_limit: Optional[float] = None,
+    seed: int = 42,
+    solver: str = 'auto',
+    threads: Optional[int] = None,
+    verbose: bool = False,
+    termination: Optional[Termination] = None
+) -> Tuple[Set[int], float, Dict]:
+    """
+    Improve a feasible solution by solving restricted MIPs around it.
+    
+    Args:
+        instance: Problem instance
+        K: Feasible incumbent (e.g. from TS or multi-start LS)
+        rounds: Maximum restricted MIPs
+        kernel_size: Closed facilities freed per round (besides the open ones)
+        random_picks: Of those, how many are drawn at random from the rest
+        max_changes: Initial local-branching radius (facilities opened or
+            closed); +2 after a round without improvement
+        patience: Stop after this many rounds without improvement
+        mip_time_limit: CBC time limit per restricted MIP (seconds)
+        time_limit: Wall-clock seconds (ignored if termination is given)
+        seed: Random seed for the random kernel picks
+        solver: 'cbc', 'gurobi' or 'auto'
+        threads: Solver threads (None = solver default)
+        verbose: Print one line per round
+        termination: Shared termination criteria
+    
+    Returns:
+        best_facilities: Polished solution (never worse than K)
+        best_objective: Its covered demand
+        info: rounds, improvements, initial_obj, runtime
+    """
+    start_time = time.time()
+    if termination is None:
+        termination = Termination(time_limit)
+    if solver == 'auto':
+        solver = available_solver()
+    
+    rng = random.Random(seed)
+    arr = instance.arrays
+    fac_pos = {i: p for p, i in enumerate(arr.facility_ids.tolist())}
+    nz_fac = np.repeat(np.arange(len(arr.facility_ids)), np.diff(arr.fac_ptr))
+    cost = np.maximum(arr.f, 1e-12)
+    
+    best_K = set(K)
+    best_obj = instance.compute_coverage(best_K)[0]
+    initial_obj = best_obj
+    termination.update(best_obj, best_K)
+    
+    radius = max_changes
+    stale = 0
+    improvements = 0
+    n_rounds = 0
+    
+    with termination.handle_sigint():
+        for n_rounds in range(1, rounds + 1):
+            if termination.should_stop() or stale >= patience:
+                n_rounds -= 1
+                break
+            
+            is_open = np.zeros(len(arr.facility_ids), dtype=bool)
+            is_open[[fac_pos[i] for i in best_K]] = True
+            
+            # Closed facilities ranked by uncovered demand they would cover
+            # and by singly-covered demand they could take over (per cost)
+            count = np.bincount(arr.fac_cust, weights=is_open[nz_fac], minlength=len(arr.customer_ids))
+            closed = np.flatnonzero(~is_open)
+            kernel = []
+            for weights in (arr.d * (count == 0), arr.d * (count == 1)):
+                gain = np.bincount(nz_fac, weights=weights[arr.fac_cust], minlength=len(arr.facility_ids))
+                ranked = closed[np.lexsort((closed, -gain[closed] / cost[closed]))]
+                ranked = ranked[gain[ranked] > 0].tolist()
+                kernel += [p for p in ranked if p not in kernel][:(kernel_size - random_picks + 1) // 2]
+            rest = sorted(set(closed.tolist()) - set(kernel))
+            kernel += rng.sample(rest, min(random_picks, len(rest)))
+            
+            free = is_open.copy()
+            free[kernel] = True
+            
+            remaining = termination.deadline - time.time() if termination.deadline is not None else None
+            limit = mip_time_limit if remaining is None else max(1.0, min(mip_time_limit, remaining))
+            
+            problem, x = _restricted_model(instance, is_open, free, radius)
+            problem.solve(solver_backend(solver, limit, warm_start=True, threads=threads))
+            
+            improved = False
+            if problem.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible):
+                chosen = {p for p, v in x.items() if v.varValue is not None and v.varValue > 0.5}
+                new_open = (is_open & ~free)
+                new_open[list(chosen)] = True
+                K_new = set(arr.facility_ids[new_open].tolist())
+                obj_new = instance.compute_coverage(K_new)[0]
+                if instance.is_feasible(K_new) and obj_new > best_obj + 1e-9:
+                    best_K, best_obj = K_new, obj_new
+                    termination.update(best_obj, best_K)
+                    improved = True
+            
+            if improved:
+                improvements += 1
+                stale = 0
+                radius = max_changes
+            else:
+                stale += 1
+                radius += 2
+            
+            if verbose:
+                print(f"  Round {n_rounds}: kernel={int(free.sum())}, radius={radius}, "
+                      f"best={best_obj:.2f}{' (improved)' if improved else ''}")
+    
+    info = {
+        'rounds': n_rounds,
+        'improvements': improvements,
+        'initial_obj': initial_obj,
+        'runtime': time.time() - start_time
+    }
+    return best_K, best_obj, info
+
+
+if __name__ == "__main__":
+    import argparse
+    from tabu_search import run_tabu_search
+    
+    parser = argparse.ArgumentParser(description="MIP polishing of a Tabu Search solution")
+    parser.add_argument("--instance", type=str, default="data/test_tiny.json")
+    parser.add_argument("--ts-iterations", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--kernel-size", type=int, default=60)
+    parser.add_argument("--mip-time-limit", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    print(f"Loading instance: {args.instance}\n")
+    instance = MCLPInstance(args.instance)
+    
+    K, obj, _ = run_tabu_search(instance, max_iterations=args.ts_iterations, seed=args.seed, verbose=False)
+    print(f"Tabu Search: {obj:.2f}")
+    
+    K, obj, info = polish(
+        instance, K, rounds=args.rounds, kernel_size=args.kernel_size,
+        mip_time_limit=args.mip_time_limit, seed=args.seed, verbose=True
+    )
+    print(f"\nPolished: {obj:.2f} (+{obj - info['initial_obj']:.2f}, "
+          f"{info['improvements']}/{info['rounds']} rounds improved, {info['runtime']:.2f}s)")
+    print(f"Facilities: {sorted(K)}")
@@ -0,0 +1,163 @@
+"""
+Persistent memoization of deterministic runs.
+
+greedy, cn, lagrangian and bnb do not depend on the seed, and ls/ts are
+deterministic given seed and parameters, as long as no wall-clock criterion
+(time or no-improvement limit, MIP polishing under CBC time limits) can cut
+a run short. Such runs are cached in a SQLite file keyed by (instance
+fingerprint, algorithm, hash of the config sections the algorithm reads,
+seed, code version), where the code version hashes the solver sources so
+any code change invalidates the cache. Entries are evicted least recently
+used beyond max_entries. A hit is re-verified against the instance (the
+stored facilities must be feasible and reproduce the stored objective)
+before it is returned.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from instance_loader import MCLPInstance
+from results_store import ALGORITHM_SECTIONS, config_hash
+
+# Algorithms whose result does not depend on the seed
+SEED_INDEPENDENT = ('greedy', 'cn', 'lagrangian', 'bnb')
+# Algorithms that are deterministic for a fixed seed (ts_islands depends on
+# process timing through migration; compact/benders on solver timing)
+DETERMINISTIC = SEED_INDEPENDENT + ('ls', 'ts')
+TIME_CRITERIA = ('time_limit', 'no_improvement_time')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    objective REAL,
+    result BLOB NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_last_used ON cache (last_used);
+"""
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """Hash of the source files in this directory (computed once per process)."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+            with open(path, 'rb') as f:
+                digest.update(os.path.basename(path).encode() + b'\0' + f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def is_cacheable(algorithm: str, config: dict) -> bool:
+    """Whether a run of algorithm under config is reproducible (see module docstring)."""
+    if algorithm not in DETERMINISTIC:
+        return False
+    sections = ('termination',) + ALGORITHM_SECTIONS.get(algorithm, ())
+    for name in sections:
+        params = config.get(name) or {}
+        if any(params.get(key) is not None for key in TIME_CRITERIA):
+            return False
+    return not (config.get('polish_params') or {}).get('enabled', False)
+
+
+class ResultCache:
+    def __init__(self, path: str, max_entries: int = 10000):
+        """
+        Args:
+            path: SQLite file (created if missing; safe to share between
+                processes, and between threads of one process)
+            max_entries: Least recently used entries beyond this are evicted
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        # One connection per process, serialized by the lock across threads
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        self.stats = {'hits': 0, 'misses': 0, 'invalid': 0}
+    
+    def key(self, instance: MCLPInstance, algorithm: str, config: dict, seed: int) -> str:
+        """Cache key of a run."""
+        payload = json.dumps([
+            instance.fingerprint, algorithm, config_hash(config, algorithm),
+            None if algorithm in SEED_INDEPENDENT else int(seed), code_version()
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str, instance: MCLPInstance) -> Optional[dict]:
+        """Stored result for key, or None on a miss or a failed re-verification."""
+        with self._lock:
+            row = self.conn.execute("SELECT result FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+        
+        result = pickle.loads(row[0])
+        K = set(result['facilities'])
+        valid = instance.is_feasible(K) and abs(instance.compute_coverage(K)[0] - result['objective']) <= 1e-6
+        
+        with self._lock, self.conn:
+            if not valid:
+                self.stats['invalid'] += 1
+                self.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self.stats['hits'] += 1
+            self.conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        return result
+    
+    def put(self, key: str, algorithm: str, result: dict):
+        """Store a result and evict the least recently used entries beyond max_entries."""
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, algorithm, objective, result, created, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, algorithm, result.get('objective'), pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL), now, now)
+            )
+            self.conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+    
+    def clear(self):
+        """Remove all entries."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM cache")
+
+
+# Open caches by (path, process): SQLite connections must not cross a fork
+_caches: Dict[tuple, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def open_cache(config: dict) -> Optional[ResultCache]:
+    """The cache configured in config['result_cache'], or None if disabled."""
+    settings = config.get('result_cache') or {}
+    if not settings.get('enabled', False):
+        return None
+    path = settings.get('path', 'results/cache.db')
+    with _caches_lock:
+        cache = _caches.get((path, os.getpid()))
+        if cache is None:
+            cache = _caches[(path, os.getpid())] = ResultCache(path, settings.get('max_entries', 10000))
+    return cache
@@ -0,0 +1,272 @@
+"""
+SQLite store for experiment results.
+
+Rows are keyed by (instance fingerprint, algorithm, seed, config hash), so
+rerunning a run replaces its row instead of appending a duplicate, and an
+interrupted grid resumes by skipping the keys already stored. Writes are
+buffered and committed in batches. The columns are those of the results
+CSV (facilities as a JSON list); read_results() returns either format as
+the same DataFrame for the analysis scripts.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from instance_loader import MCLPInstance
+
+# Config sections each algorithm reads (besides the shared ones below)
+ALGORITHM_SECTIONS = {
+    'greedy': (),
+    'cn': (),
+    'ls': ('ls_params',),
+    'ts': ('ts_params',),
+    'ts_islands': ('ts_params', 'island_params'),
+    'compact': ('compact_params', 'ls_params'),
+    'benders': ('benders_params', 'ts_params'),
+    'bnb': ('bnb_params',),
+    'lagrangian': ('lagrangian_params',)
+}
+SHARED_SECTIONS = ('termination', 'polish_params')
+
+# CSV columns (run_mclp.result_row) in order
+COLUMNS = (
+    'instance', 'seed', 'algorithm', 'objective', 'coverage_pct', 'runtime_sec',
+    'num_facilities', 'budget_used', 'num_moves', 'num_iterations', 'facilities',
+    'stop_reason', 'upper_bound', 'gap', 'cache_hit'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT NOT NULL,
+    method TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    config_hash TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    objective REAL,
+    coverage_pct REAL,
+    runtime_sec REAL,
+    num_facilities INTEGER,
+    budget_used REAL,
+    num_moves INTEGER,
+    num_iterations INTEGER,
+    facilities TEXT,
+    stop_reason TEXT,
+    upper_bound REAL,
+    gap REAL,
+    cache_hit INTEGER,
+    created REAL,
+    PRIMARY KEY (fingerprint, method, seed, config_hash)
+);
+CREATE INDEX IF NOT EXISTS results_instance_algorithm ON results (instance, algorithm);
+CREATE TABLE IF NOT EXISTS configs (
+    config_hash TEXT PRIMARY KEY,
+    config TEXT NOT NULL
+);
+"""
+
+# Columns added after the first schema: (name, SQL type), added to older stores on open
+ADDED_COLUMNS = (('cache_hit', 'INTEGER'),)
+
+Key = Tuple[str, str, int, str]
+
+
+def config_subset(config: dict, algorithm: str) -> dict:
+    """The parts of a run configuration that can change an algorithm's result."""
+    sections = ALGORITHM_SECTIONS.get(algorithm, tuple(config))
+    subset = {name: config.get(name) for name in sections + SHARED_SECTIONS}
+    subset['gap_bound'] = (config.get('results') or {}).get('gap_bound')
+    return subset
+
+
+def config_hash(config: dict, algorithm: str) -> str:
+    """Short stable hash of config_subset."""
+    payload = json.dumps(config_subset(config, algorithm), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def result_key(instance: MCLPInstance, algorithm: str, seed: int, config: dict) -> Key:
+    """Store key of one run (algorithm is the run_mclp name, e.g. 'ls')."""
+    return (instance.fingerprint, algorithm, int(seed), config_hash(config, algorithm))
+
+
+class ResultsStore:
+    def __init__(self, path: str, batch_size: int = 50):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            batch_size: Buffered rows per commit
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(results)")}
+        with self.conn:
+            for name, sql_type in ADDED_COLUMNS:
+                if name not in existing:
+                    self.conn.execute(f"ALTER TABLE results ADD COLUMN {name} {sql_type}")
+        self._pending: List[tuple] = []
+        self._configs: Dict[str, str] = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __contains__(self, key: Key) -> bool:
+        if any(row[:4] == tuple(key) for row in self._pending):
+            return True
+        cursor = self.conn.execute(
+            "SELECT 1 FROM results WHERE fingerprint=? AND method=? AND seed=? AND config_hash=?", key
+        )
+        return cursor.fetchone() is not None
+    
+    def completed_keys(self) -> Set[Key]:
+        """Keys of all stored runs."""
+        self.flush()
+        cursor = self.conn.execute("SELECT fingerprint, method, seed, config_hash FROM results")
+        return {tuple(row) for row in cursor}
+    
+    def add(self, key: Key, row: dict, config: Optional[dict] = None):
+        """
+        Buffer a run's CSV row (run_mclp.result_row) under its key; an
+        existing row with the same key is replaced. config (the run
+        configuration) is kept once per config hash for reference.
+        """
+        values = []
+        for column in COLUMNS:
+            value = row.get(column, '')
+            if column == 'facilities':
+                if isinstance(value, str):
+                    value = [int(i) for i in value.split(',') if i]
+                value = json.dumps(sorted(value))
+            elif hasattr(value, 'item'):
+                value = value.item()  # NumPy scalar
+            values.append(None if value == '' else value)
+        self._pending.append(tuple(key) + tuple(values) + (time.time(),))
+        if config is not None and key[3] not in self._configs:
+            self._configs[key[3]] = json.dumps(config_subset(config, key[1]), sort_keys=True, default=str)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Commit buffered rows in one transaction."""
+        if not self._pending and not self._configs:
+            return
+        placeholders = ', '.join('?' * (4 + len(COLUMNS) + 1))
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO results (fingerprint, method, seed, config_hash, "
+                f"{', '.join(COLUMNS)}, created) VALUES ({placeholders})",
+                self._pending
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO configs (config_hash, config) VALUES (?, ?)",
+                self._configs.items()
+            )
+        self._pending = []
+        self._configs = {}
+    
+    def close(self):
+        """Flush and close the database."""
+        self.flush()
+        self.conn.close()
+    
+    def query(
+        self,
+        instance: Optional[str] = None,
+        algorithm: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> List[dict]:
+        """Stored rows in CSV format (facilities comma-joined), optionally filtered."""
+        self.flush()
+        sql, params = _select(instance, algorithm, seed)
+        rows = []
+        for values in self.conn.execute(sql, params):
+            row = dict(zip(COLUMNS, values))
+            row['facilities'] = ','.join(map(str, json.loads(row['facilities'] or '[]')))
+            row['cache_hit'] = bool(row['cache_hit'])
+            rows.append(row)
+        return rows
+    
+    def export_csv(self, output_path: str, **filters) -> int:
+        """Write stored rows as a results CSV; returns the number of rows."""
+        rows = self.query(**filters)
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows({k: ('' if v is None else v) for k, v in row.items()} for row in rows)
+        return len(rows)
+
+
+def _select(instance: Optional[str], algorithm: Optional[str], seed: Optional[int]) -> Tuple[str, list]:
+    """SELECT of the CSV columns with the given filters (uses the instance/algorithm index)."""
+    conditions, params = [], []
+    for column, value in (('instance', instance), ('algorithm', algorithm), ('seed', seed)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+    return f"SELECT {', '.join(COLUMNS)} FROM results{where} ORDER BY instance, algorithm, seed", params
+
+
+def is_store(path: str) -> bool:
+    """Whether a results path names a SQLite store rather than a CSV."""
+    return os.path.splitext(path)[1].lower() in ('.db', '.sqlite', '.sqlite3')
+
+
+def read_results(path: str, instance: Optional[str] = None, algorithm: Optional[str] = None):
+    """
+    Load results as a pandas DataFrame with the CSV columns, from a CSV or
+    a results store (filters are applied in SQL for a store). cache_hit
+    marks rows replayed from the result cache, whose runtime_sec is that of
+    the original run (False for rows written before the column existed).
+    """
+    import pandas as pd
+    
+    if not is_store(path):
+        df = pd.read_csv(path)
+        df['cache_hit'] = df['cache_hit'].fillna(False).astype(bool) if 'cache_hit' in df else False
+        if instance is not None:
+            df = df[df['instance'] == instance]
+        if algorithm is not None:
+            df = df[df['algorithm'] == algorithm]
+        return df
+    
+    with ResultsStore(path) as store:
+        return pd.DataFrame(store.query(instance, algorithm), columns=list(COLUMNS))
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Inspect or export a results store")
+    parser.add_argument("--db", type=str, default="results/results.db")
+    parser.add_argument("--export", type=str, default=None, help="Write the rows to this CSV")
+    parser.add_argument("--instance", type=str, default=None)
+    parser.add_argument("--algorithm", type=str, default=None)
+    args = parser.parse_args()
+    
+    with ResultsStore(args.db) as store:
+        if args.export:
+            n = store.export_csv(args.export, instance=args.instance, algorithm=args.algorithm)
+            print(f"Exported {n} rows to {args.export}")
+        else:
+            rows = store.query(args.instance, args.algorithm)
+            print(f"{len(rows)} rows in {args.db}")
+            for row in rows:
+                print(f"  {row['instance']:<12} {row['algorithm']:<20} seed={row['seed']:<4} "
+                      f"objective={row['objective']}")
@@ -10,12 +10,24 @@ import time
 import os
 import sys
 from pathlib import Path
+from typing import Callable, List, Optional
 
 from instance_loader import MCLPInstance
 from greedy import greedy_heuristic
 from closest_neighbor import closest_neighbor_heuristic
 from multistart import multistart_local_search
 from tabu_search import run_tabu_search
+from island_tabu import run_island_tabu_search
+from compact_model import solve_compact
+from benders import solve_benders
+from lagrangian import solve_lagrangian, lagrangian_upper_bound
+from polish import polish
+from branch_and_bound import branch_and_bound
+from heuristic_cache import cached_greedy
+from results_store import ResultsStore, result_key, ALGORITHM_SECTIONS
+from result_cache import open_cache, is_cacheable
+from termination import Termination
+from bounds import upper_bound, optimality_gap
 
 def load_config(config_path: str) -> dict:
     """Load YAML configuration file."""
@@ -23,35 +35,251 @@ def load_config(config_path: str) -> dict:
         return yaml.safe_load(f)
 
 
-def run_compact(instance: MCLPInstance, config: dict, seed: int) -> dict:
+def termination_criteria(config: dict, params: dict) -> dict:
     """
-    Run compact model (placeholder - requires Mosel/PuLP integration).
-    Returns result dictionary.
+    Termination criteria for one run: keys in the algorithm's params
+    (ls_params/ts_params) override the global `termination` section.
     """
-    print("[WARNING]  Compact model solver not implemented yet")
-    print("    (Requires Mosel integration or PuLP/Gurobi setup)")
+    criteria = dict(config.get('termination') or {})
+    for key in ('time_limit', 'target_objective', 'no_improvement_time'):
+        if params.get(key) is not None:
+            criteria[key] = params[key]
+    return criteria
+
+
+def build_termination(
+    config: dict,
+    params: dict,
+    instance: MCLPInstance,
+    cancel_event=None,
+    on_improvement: Optional[Callable[[float, Optional[List[int]]], None]] = None,
+    deadline: Optional[float] = None
+) -> Termination:
+    """
+    Build termination criteria for one run (see termination_criteria).
+    The instance's cheap upper bound is always attached so proven-optimal
+    incumbents stop the search. cancel_event, on_improvement and an
+    absolute deadline are passed through to Termination.
+    """
+    criteria = termination_criteria(config, params)
+    
+    return Termination(
+        time_limit=criteria.get('time_limit'),
+        target_objective=criteria.get('target_objective'),
+        no_improvement_time=criteria.get('no_improvement_time'),
+        deadline=deadline,
+        upper_bound=upper_bound(instance),
+        cancel_event=cancel_event,
+        on_improvement=on_improvement
+    )
+
+
+def run_compact(
+    instance: MCLPInstance,
+    config: dict,
+    seed: int,
+    cancel_event=None,
+    on_improvement: Optional[Callable[[float, Optional[List[int]]], None]] = None
+) -> dict:
+    """
+    Solve the compact MILP (CBC, or Gurobi if available) with a heuristic
+    MIP start. Returns result dictionary including the solver's bound.
+    """
+    start_time = time.time()
+    compact_params = config.get('compact_params', {})
+    termination = build_termination(config, compact_params, instance, cancel_event, on_improvement)
+    
+    warm_start = None
+    if compact_params.get('warm_start', 'greedy') == 'greedy':
+        warm_start = cached_greedy(instance)[0]
+    elif compact_params.get('warm_start') == 'ls':
+        warm_start, _, _ = multistart_local_search(
+            instance,
+            n_starts=config.get('ls_params', {}).get('multistart_count', 10),
+            base_seed=seed,
+            verbose=False
+        )
+    
+    time_limit = None
+    if termination.deadline is not None:
+        time_limit = max(1.0, termination.deadline - time.time())
+    
+    K, obj, info = solve_compact(
+        instance,
+        time_limit=time_limit,
+        warm_start=warm_start,
+        solver=compact_params.get('solver', 'auto'),
+        threads=compact_params.get('threads')
+    )
+    
+    if obj is None:
+        return {
+            'algorithm': 'compact',
+            'objective': None,
+            'runtime': time.time() - start_time,
+            'facilities': [],
+            'stop_reason': info['status']
+        }
+    
     return {
         'algorithm': 'compact',
-        'objective': None,
-        'runtime': 0.0,
-        'facilities': [],
-        'status': 'not_implemented'
+        'objective': obj,
+        'coverage_pct': obj / instance.total_demand * 100,
+        'runtime': time.time() - start_time,
+        'facilities': sorted(K),
+        'num_facilities': len(K),
+        'budget_used': sum(instance.f[i] for i in K),
+        'num_moves': 0,
+        'num_iterations': 0,
+        'stop_reason': 'completed' if info['status'] == 'optimal' else info['status'],
+        'upper_bound': info['upper_bound']
     }
 
 
+def run_benders(
+    instance: MCLPInstance,
+    config: dict,
+    seed: int,
+    cancel_event=None,
+    on_improvement: Optional[Callable[[float, Optional[List[int]]], None]] = None
+) -> dict:
+    """
+    Solve with the Benders cut loop, seeded with a greedy or TS incumbent.
+    Returns result dictionary including the proven bound.
+    """
+    start_time = time.time()
+    benders_params = config.get('benders_params', {})
+    termination = build_termination(config, benders_params, instance, cancel_event, on_improvement)
+    
+    warm_start = None
+    if benders_params.get('warm_start', 'greedy') == 'greedy':
+        warm_start = cached_greedy(instance)[0]
+    elif benders_params.get('warm_start') == 'ts':
+        warm_start, _, _ = run_tabu_search(
+            instance,
+            max_iterations=benders_params.get('ts_iterations', 500),
+            seed=seed,
+            verbose=False,
+            termination=termination
+        )
+    
+    K, obj, info = solve_benders(
+        instance,
+        warm_start=warm_start,
+        cut_groups=benders_params.get('cut_groups'),
+        lp_rounds=benders_params.get('lp_rounds', 50),
+        solver=benders_params.get('solver', 'auto'),
+        threads=benders_params.get('threads'),
+        termination=termination
+    )
+    
+    return {
+        'algorithm': 'benders',
+        'objective': obj,
+        'coverage_pct': obj / instance.total_demand * 100,
+        'runtime': time.time() - start_time,
+        'facilities': sorted(K),
+        'num_facilities': len(K),
+        'budget_used': sum(instance.f[i] for i in K),
+        'num_moves': info['cuts'],
+        'num_iterations': info['rounds'],
+        'stop_reason': 'completed' if info['status'] == 'optimal' else info['status'],
+        'upper_bound': info['upper_bound']
+    }
+
+
+# Algorithms run_algorithm accepts
+ALGORITHMS = ('compact', 'benders', 'bnb', 'lagrangian', 'greedy', 'cn', 'ls', 'ts', 'ts_islands')
+
+# Heuristics whose solutions the MIP polishing stage can improve
+POLISHABLE = ('greedy', 'cn', 'ls', 'ts', 'ts_islands', 'lagrangian')
+
+
 def run_algorithm(
     algorithm: str,
     instance: MCLPInstance,
     config: dict,
-    seed: int
+    seed: int,
+    checkpoint_path: str = None,
+    resume: bool = False,
+    cancel_event=None,
+    on_improvement: Optional[Callable[[float, Optional[List[int]]], None]] = None
 ) -> dict:
     """
     Run specified algorithm and return standardized results.
+    With checkpoint_path, ls/ts save their progress there; resume=True
+    continues from an existing checkpoint. With result_cache enabled,
+    reproducible runs are looked up in (and added to) the persistent cache.
+    Setting cancel_event (threading Event) stops the run with its
+    best-so-far; on_improvement(objective, facilities) is called on every
+    new best.
     """
+    cache = open_cache(config)
+    cache_key = None
+    if cache is not None and is_cacheable(algorithm, config):
+        cache_key = cache.key(instance, algorithm, config, seed)
+        result = cache.get(cache_key, instance)
+        if result is not None:
+            return dict(result, cache_hit=True)
+    
     start_time = time.time()
     
     if algorithm == 'compact':
-        result = run_compact(instance, config, seed)
+        result = run_compact(instance, config, seed, cancel_event, on_improvement)
+    
+    elif algorithm == 'benders':
+        result = run_benders(instance, config, seed, cancel_event, on_improvement)
+    
+    elif algorithm == 'bnb':
+        bnb_params = config.get('bnb_params', {})
+        termination = build_termination(config, bnb_params, instance, cancel_event, on_improvement)
+        
+        K, obj, info = branch_and_bound(
+            instance,
+            incumbent=cached_greedy(instance)[0],
+            node_limit=bnb_params.get('node_limit'),
+            termination=termination
+        )
+        
+        result = {
+            'algorithm': 'branch_and_bound',
+            'objective': obj,
+            'coverage_pct': obj / instance.total_demand * 100,
+            'runtime': time.time() - start_time,
+            'facilities': sorted(K),
+            'num_facilities': len(K),
+            'budget_used': sum(instance.f[i] for i in K),
+            'num_moves': 0,
+            'num_iterations': info['nodes'],
+            'stop_reason': 'completed' if info['status'] == 'optimal' else info['status'],
+            'upper_bound': info['upper_bound']
+        }
+    
+    elif algorithm == 'lagrangian':
+        lagrangian_params = config.get('lagrangian_params', {})
+        termination = build_termination(config, lagrangian_params, instance, cancel_event, on_improvement)
+        
+        K, obj, info = solve_lagrangian(
+            instance,
+            max_iterations=lagrangian_params.get('max_iterations', 1000),
+            stagnation=lagrangian_params.get('stagnation', 20),
+            heuristic_every=lagrangian_params.get('heuristic_every', 10),
+            termination=termination
+        )
+        
+        result = {
+            'algorithm': 'lagrangian',
+            'objective': obj,
+            'coverage_pct': obj / instance.total_demand * 100,
+            'runtime': time.time() - start_time,
+            'facilities': sorted(K),
+            'num_facilities': len(K),
+            'budget_used': sum(instance.f[i] for i in K),
+            'num_moves': 0,
+            'num_iterations': info['iterations'],
+            'stop_reason': 'completed' if info['status'] == 'optimal' else info['status'],
+            'upper_bound': info['upper_bound']
+        }
     
     elif algorithm == 'greedy':
         K, obj, covered = greedy_heuristic(instance, seed=seed)
@@ -64,7 +292,8 @@ def run_algorithm(
             'num_facilities': len(K),
             'budget_used': sum(instance.f[i] for i in K),
             'num_moves': 0,
-            'num_iterations': 0
+            'num_iterations': 0,
+            'stop_reason': 'completed'
         }
     
     elif algorithm == 'cn':
@@ -78,20 +307,29 @@ def run_algorithm(
             'num_facilities': len(K),
             'budget_used': sum(instance.f[i] for i in K),
             'num_moves': 0,
-            'num_iterations': 0
+            'num_iterations': 0,
+            'stop_reason': 'completed'
         }
     
     elif algorithm == 'ls':
         ls_params = config.get('ls_params', {})
         n_starts = ls_params.get('multistart_count', 10)
         max_moves = ls_params.get('max_moves', 200)
+        termination = build_termination(config, ls_params, instance, cancel_event, on_improvement)
         
         K, obj, history = multistart_local_search(
             instance,
             n_starts=n_starts,
             max_moves=max_moves,
             base_seed=seed,
-            verbose=False
+            verbose=False,
+            termination=termination,
+            workers=ls_params.get('workers', 1),
+            dedupe=ls_params.get('dedupe', False),
+            allocation=ls_params.get('start_allocation', 'fixed'),
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=ls_params.get('checkpoint_every', 1),
+            resume=resume
         )
         
         total_moves = sum(h['num_moves'] for h in history)
@@ -105,21 +343,34 @@ def run_algorithm(
             'num_facilities': len(K),
             'budget_used': sum(instance.f[i] for i in K),
             'num_moves': total_moves,
-            'num_iterations': n_starts
+            'num_iterations': len(history),
+            'stop_reason': termination.reason or 'completed'
         }
     
     elif algorithm == 'ts':
         ts_params = config.get('ts_params', {})
+        termination = build_termination(config, ts_params, instance, cancel_event, on_improvement)
         
         K, obj, history = run_tabu_search(
             instance,
             tenure=ts_params.get('tenure', 10),
+            add_tenure=ts_params.get('add_tenure'),
+            drop_tenure=ts_params.get('drop_tenure'),
             candidate_list_size=ts_params.get('candidate_list_size', 20),
             max_iterations=ts_params.get('max_iterations', 500),
             stagnation_limit=ts_params.get('stagnation_limit', 100),
             intensification_freq=ts_params.get('intensification_freq', 50),
+            trace_sample_every=ts_params.get('trace_sample_every', 1),
+            neighborhood_workers=ts_params.get('neighborhood_workers'),
+            elite_size=ts_params.get('elite_size', 0),
+            visited_size=ts_params.get('visited_size', 0),
+            frequency_shake=ts_params.get('frequency_shake', False),
             seed=seed,
-            verbose=False
+            verbose=False,
+            termination=termination,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every=ts_params.get('checkpoint_every', 1000),
+            resume=resume
         )
         
         result = {
@@ -130,18 +381,137 @@ def run_algorithm(
             'facilities': sorted(K),
             'num_facilities': len(K),
             'budget_used': sum(instance.f[i] for i in K),
-            'num_moves': len(history),
-            'num_iterations': len(history)
+            'num_moves': history.iterations,
+            'num_iterations': history.iterations,
+            'stop_reason': termination.reason or 'completed',
+            'trace': history
+        }
+    
+    elif algorithm == 'ts_islands':
+        # Island TS shares ts_params; island_params adds the island layout
+        ts_params = dict(config.get('ts_params', {}), **config.get('island_params', {}))
+        termination = build_termination(config, ts_params, instance, cancel_event, on_improvement)
+        
+        K, obj, islands = run_island_tabu_search(
+            instance,
+            n_islands=ts_params.get('islands', 4),
+            migration_interval=ts_params.get('migration_interval', 100),
+            tenure=ts_params.get('tenure', 10),
+            tenures=ts_params.get('tenures'),
+            candidate_list_size=ts_params.get('candidate_list_size', 20),
+            max_iterations=ts_params.get('max_iterations', 500),
+            stagnation_limit=ts_params.get('stagnation_limit', 100),
+            intensification_freq=ts_params.get('intensification_freq', 50),
+            trace_sample_every=ts_params.get('trace_sample_every', 1),
+            neighborhood_workers=ts_params.get('neighborhood_workers'),
+            elite_size=ts_params.get('elite_size', 0),
+            visited_size=ts_params.get('visited_size', 0),
+            frequency_shake=ts_params.get('frequency_shake', False),
+            seed=seed,
+            verbose=False,
+            termination=termination
+        )
+        
+        best_island = max(islands, key=lambda h: (h['best_obj'], -h['island']))
+        total_iterations = sum(h['iterations'] for h in islands)
+        island_reasons = [h['stop_reason'] for h in islands if h['stop_reason'] != 'completed']
+        
+        result = {
+            'algorithm': 'island_tabu_search',
+            'objective': obj,
+            'coverage_pct': obj / instance.total_demand * 100,
+            'runtime': time.time() - start_time,
+            'facilities': sorted(K),
+            'num_facilities': len(K),
+            'budget_used': sum(instance.f[i] for i in K),
+            'num_moves': total_iterations,
+            'num_iterations': total_iterations,
+            'stop_reason': termination.reason or (island_reasons[0] if island_reasons else 'completed'),
+            'trace': best_island['trace']
         }
     
     else:
         raise ValueError(f"Unknown algorithm: {algorithm}")
     
+    # Optional MIP polishing of heuristic solutions
+    polish_params = config.get('polish_params', {})
+    if polish_params.get('enabled', False) and algorithm in POLISHABLE and result.get('objective') is not None:
+        # The run's time limit covers polishing: polish within what is left of it
+        sections = ALGORITHM_SECTIONS.get(algorithm, ())
+        run_limit = termination_criteria(config, config.get(sections[0], {}) if sections else {}).get('time_limit')
+        termination = build_termination(
+            config, polish_params, instance, cancel_event, on_improvement,
+            deadline=start_time + run_limit if run_limit is not None else None
+        )
+        K, obj, info = polish(
+            instance,
+            set(result['facilities']),
+            rounds=polish_params.get('rounds', 20),
+            kernel_size=polish_params.get('kernel_size', 60),
+            random_picks=polish_params.get('random_picks', 5),
+            max_changes=polish_params.get('max_changes', 4),
+            patience=polish_params.get('patience', 5),
+            mip_time_limit=polish_params.get('mip_time_limit', 10.0),
+            seed=seed,
+            solver=polish_params.get('solver', 'auto'),
+            termination=termination
+        )
+        result.update({
+            'algorithm': result['algorithm'] + '+polish',
+            'objective': obj,
+            'coverage_pct': obj / instance.total_demand * 100,
+            'runtime': time.time() - start_time,
+            'facilities': sorted(K),
+            'num_facilities': len(K),
+            'budget_used': sum(instance.f[i] for i in K),
+            'polish_gain': obj - info['initial_obj']
+        })
+    
+    # Report the proven gap against the best available upper bound
+    if result.get('objective') is not None:
+        bound = upper_bound(instance)
+        if config.get('results', {}).get('gap_bound', 'cheap') == 'lagrangian':
+            bound = min(bound, lagrangian_upper_bound(instance))
+        if result.get('upper_bound') is not None:  # Solver-specific bound
+            bound = min(bound, result['upper_bound'])
+        result['upper_bound'] = bound
+        result['gap'] = optimality_gap(result['objective'], result['upper_bound'])
+    
+    if cache_key is not None and result.get('objective') is not None and \
+            result.get('stop_reason', 'completed') not in ('interrupted', 'cancelled'):
+        cache.put(cache_key, algorithm, result)
+    
     return result
 
 
+def result_row(result: dict, instance_name: str, seed: int) -> dict:
+    """CSV row of one run's result."""
+    return {
+        'instance': instance_name,
+        'seed': seed,
+        'algorithm': result['algorithm'],
+        'objective': result.get('objective', ''),
+        'coverage_pct': result.get('coverage_pct', ''),
+        'runtime_sec': result.get('runtime', ''),
+        'num_facilities': result.get('num_facilities', ''),
+        'budget_used': result.get('budget_used', ''),
+        'num_moves': result.get('num_moves', ''),
+        'num_iterations': result.get('num_iterations', ''),
+        'facilities': ','.join(map(str, result.get('facilities', []))),
+        'stop_reason': result.get('stop_reason', ''),
+        'upper_bound': result.get('upper_bound', ''),
+        'gap': result.get('gap', ''),
+        'cache_hit': bool(result.get('cache_hit', False))  # runtime_sec is the original run's
+    }
+
+
 def write_result(result: dict, instance_name: str, seed: int, output_path: str):
     """Append result to CSV file."""
+    write_rows([result_row(result, instance_name, seed)], output_path)
+
+
+def write_rows(rows: list, output_path: str):
+    """Append result rows (from result_row) to a CSV file in one write."""
     import csv
     
     output_dir = os.path.dirname(output_path)
@@ -153,30 +523,39 @@ def write_result(result: dict, instance_name: str, seed: int, output_path: str):
     fieldnames = [
         'instance', 'seed', 'algorithm', 'objective', 'coverage_pct',
         'runtime_sec', 'num_facilities', 'budget_used', 'num_moves',
-        'num_iterations', 'facilities'
+        'num_iterations', 'facilities', 'stop_reason', 'upper_bound', 'gap',
+        'cache_hit'
     ]
     
+    # Keep appending with the existing header so older files stay aligned;
+    # a file missing newer columns is first rewritten with them (left empty)
+    if file_exists:
+        with open(output_path, 'r', newline='') as f:
+            reader = csv.DictReader(f)
+            existing_header = reader.fieldnames
+            missing = [name for name in fieldnames if existing_header and name not in existing_header]
+            existing_rows = list(reader) if missing else None
+        if missing:
+            fieldnames = existing_header + missing
+            temp_path = output_path + '.tmp'
+            with open(temp_path, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+                writer.writeheader()
+                writer.writerows(existing_rows)
+            os.replace(temp_path, output_path)
+            print(f"[INFO] Added columns {', '.join(missing)} to {output_path}")
+        elif existing_header:
+            fieldnames = existing_header
+        else:
+            file_exists = False  # Empty file: write the header
+    
     with open(output_path, 'a', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         
         if not file_exists:
             writer.writeheader()
         
-        row = {
-            'instance': instance_name,
-            'seed': seed,
-            'algorithm': result['algorithm'],
-            'objective': result.get('objective', ''),
-            'coverage_pct': result.get('coverage_pct', ''),
-            'runtime_sec': result.get('runtime', ''),
-            'num_facilities': result.get('num_facilities', ''),
-            'budget_used': result.get('budget_used', ''),
-            'num_moves': result.get('num_moves', ''),
-            'num_iterations': result.get('num_iterations', ''),
-            'facilities': ','.join(map(str, result.get('facilities', [])))
-        }
-        
-        writer.writerow(row)
+        writer.writerows(rows)
 
 
 def main():
@@ -199,12 +578,32 @@ Examples:
     parser.add_argument('--config', type=str, help='Path to config YAML file')
     parser.add_argument('--instance', type=str, help='Path to instance file')
     parser.add_argument('--algorithm', type=str, 
-                       choices=['compact', 'greedy', 'cn', 'ls', 'ts'],
+                       choices=ALGORITHMS,
                        help='Algorithm to run')
     parser.add_argument('--seed', type=int, default=42, help='Random seed')
     parser.add_argument('--seeds', type=int, nargs='+', help='Multiple seeds for batch mode')
     parser.add_argument('--output', type=str, default='results/results.csv',
                        help='Output CSV path')
+    parser.add_argument('--store', type=str, default=None,
+                       help='SQLite results store used instead of the CSV; runs already stored are skipped')
+    parser.add_argument('--time-limit', type=float, default=None,
+                       help='Wall-clock limit per run in seconds (ls, ts)')
+    parser.add_argument('--target-objective', type=float, default=None,
+                       help='Stop as soon as this objective is reached (ls, ts)')
+    parser.add_argument('--no-improvement-time', type=float, default=None,
+                       help='Stop after this many seconds without a new best (ls, ts)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for multi-start LS (overrides ls_params.workers)')
+    parser.add_argument('--trace-dir', type=str, default=None,
+                       help='Directory for per-run iteration traces (TS only)')
+    parser.add_argument('--checkpoint-dir', type=str, default=None,
+                       help='Directory for ls/ts checkpoints (overrides results.checkpoint_dir)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue ls/ts runs from their checkpoints')
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse results of reproducible runs from the result cache (enables result_cache)')
+    parser.add_argument('--polish', action='store_true',
+                       help='Polish heuristic solutions with restricted MIPs (enables polish_params)')
     parser.add_argument('--log-level', type=str, default='INFO',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'])
     
@@ -253,6 +652,26 @@ Examples:
         seed = args.seed
         output_path = args.output
     
+    trace_dir = args.trace_dir or config.get('results', {}).get('trace_dir')
+    store_path = args.store or config.get('results', {}).get('store')
+    checkpoint_dir = args.checkpoint_dir or config.get('results', {}).get('checkpoint_dir')
+    if args.resume and not checkpoint_dir:
+        checkpoint_dir = 'results/checkpoints'
+    
+    # Command-line termination criteria override the config
+    termination_config = dict(config.get('termination') or {})
+    for key in ('time_limit', 'target_objective', 'no_improvement_time'):
+        if getattr(args, key) is not None:
+            termination_config[key] = getattr(args, key)
+    config['termination'] = termination_config
+    
+    if args.workers is not None:
+        config['ls_params'] = dict(config.get('ls_params') or {}, workers=args.workers)
+    if args.polish:
+        config['polish_params'] = dict(config.get('polish_params') or {}, enabled=True)
+    if args.cache:
+        config['result_cache'] = dict(config.get('result_cache') or {}, enabled=True)
+    
     # Handle multiple seeds
     if args.seeds:
         seeds = args.seeds
@@ -271,23 +690,54 @@ Examples:
     print(f"Running {total_runs} experiments")
     print("="*70)
     
+    store = ResultsStore(store_path) if store_path else None
+    
     for algorithm in algorithms:
         for seed_val in seeds:
             run_count += 1
             
             print(f"\n[Run {run_count}/{total_runs}] Algorithm={algorithm}, Seed={seed_val}")
             
+            key = result_key(instance, algorithm, seed_val, config) if store else None
+            if store and key in store:
+                print(f"  [SKIP] Already in {store_path}")
+                continue
+            
             try:
-                result = run_algorithm(algorithm, instance, config, seed_val)
+                checkpoint_path = None
+                if checkpoint_dir:
+                    checkpoint_path = os.path.join(
+                        checkpoint_dir, f"{instance.name}_{algorithm}_seed{seed_val}.pkl"
+                    )
+                result = run_algorithm(
+                    algorithm, instance, config, seed_val,
+                    checkpoint_path=checkpoint_path, resume=args.resume
+                )
                 
-                # Write to CSV
-                write_result(result, instance.name, seed_val, output_path)
+                # Write to the store or CSV
+                if store:
+                    store.add(key, result_row(result, instance.name, seed_val), config)
+                    store.flush()
+                else:
+                    write_result(result, instance.name, seed_val, output_path)
+                
+                # Write iteration trace
+                if trace_dir and result.get('trace') is not None:
+                    os.makedirs(trace_dir, exist_ok=True)
+                    trace_path = os.path.join(
+                        trace_dir, f"{instance.name}_{algorithm}_seed{seed_val}.csv"
+                    )
+                    result['trace'].save(trace_path)
                 
                 # Print summary
                 if result.get('objective') is not None:
-                    print(f"  [OK] Objective: {result['objective']:.2f}")
+                    print(f"  [OK] Objective: {result['objective']:.2f}{' (cached)' if result.get('cache_hit') else ''}")
                     print(f"    Coverage: {result['coverage_pct']:.1f}%")
                     print(f"    Runtime: {result['runtime']:.4f}s")
+                    if result.get('gap') is not None:
+                        print(f"    Gap: {result['gap']:.2%} (upper bound {result['upper_bound']:.2f})")
+                    if result.get('stop_reason', 'completed') != 'completed':
+                        print(f"    Stopped early: {result['stop_reason']}")
                     print(f"    Facilities: {result['facilities']}")
                 
             except Exception as e:
@@ -295,8 +745,11 @@ Examples:
                 import traceback
                 traceback.print_exc()
     
+    if store:
+        store.close()
+    
     print("\n" + "="*70)
-    print(f"Results saved to: {output_path}")
+    print(f"Results saved to: {store_path or output_path}")
     print("[DONE] Pipeline complete!")
 
 
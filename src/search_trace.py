@@ -0,0 +1,109 @@
+"""
+Compact iteration trace for metaheuristics.
+Stores per-iteration statistics in a preallocated NumPy structured array
+with configurable sampling; new-best events are always recorded.
+"""
+
+import numpy as np
+from typing import Dict, Iterator
+
+# Move types are stored as small integer codes ('intensify' and 'relink'
+# rows log new bests found by intensification and path relinking)
+MOVE_TYPES = ('none', 'close', 'open', 'swap', 'intensify', 'relink')
+MOVE_CODES = {name: code for code, name in enumerate(MOVE_TYPES)}
+
+TRACE_DTYPE = np.dtype([
+    ('iteration', np.int32),
+    ('elapsed', np.float64),
+    ('current_obj', np.float64),
+    ('best_obj', np.float64),
+    ('delta', np.float64),
+    ('move_type', np.uint8),
+    ('tabu_list_size', np.int32),
+    ('stagnation', np.int32),
+    ('new_best', np.bool_),
+])
+
+
+class SearchTrace:
+    def __init__(self, capacity: int = 1024, sample_every: int = 1):
+        """
+        Args:
+            capacity: Initial number of rows to preallocate (grows on demand)
+            sample_every: Record every k-th iteration (new-best events always kept)
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        
+        self.sample_every = sample_every
+        self._data = np.zeros(max(1, capacity), dtype=TRACE_DTYPE)
+        self._size = 0
+        self.iterations = 0  # Iterations seen, including unsampled ones
+    
+    def record(
+        self,
+        iteration: int,
+        current_obj: float,
+        best_obj: float,
+        delta: float,
+        move_type: str,
+        tabu_list_size: int,
+        stagnation: int,
+        new_best: bool,
+        elapsed: float = 0.0
+    ):
+        """Record one iteration (skipped unless sampled or a new best)."""
+        self.iterations = iteration + 1
+        if not new_best and iteration % self.sample_every != 0:
+            return
+        
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, 2 * len(self._data))
+        
+        self._data[self._size] = (
+            iteration, elapsed, current_obj, best_obj, delta,
+            MOVE_CODES[move_type], tabu_list_size, stagnation, new_best
+        )
+        self._size += 1
+    
+    @property
+    def data(self) -> np.ndarray:
+        """Recorded rows as a structured array view."""
+        return self._data[:self._size]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Column access, e.g. trace['best_obj']."""
+        return self.data[column]
+    
+    def __iter__(self) -> Iterator[Dict]:
+        """Iterate rows as dicts (same keys as the former list-of-dicts history)."""
+        for row in self.data:
+            record = {name: row[name].item() for name in TRACE_DTYPE.names}
+            record['move_type'] = MOVE_TYPES[record['move_type']]
+            yield record
+    
+    def to_dataframe(self):
+        """Convert to a pandas DataFrame with decoded move types."""
+        import pandas as pd
+        
+        df = pd.DataFrame(self.data)
+        df['move_type'] = pd.Categorical.from_codes(df['move_type'], categories=list(MOVE_TYPES))
+        return df
+    
+    def to_csv(self, path: str):
+        """Export trace to CSV."""
+        self.to_dataframe().to_csv(path, index=False)
+    
+    def to_parquet(self, path: str):
+        """Export trace to Parquet (requires pyarrow or fastparquet)."""
+        self.to_dataframe().to_parquet(path, index=False)
+    
+    def save(self, path: str):
+        """Export trace, choosing the format from the file extension."""
+        if path.endswith('.parquet'):
+            self.to_parquet(path)
+        else:
+            self.to_csv(path)
@@ -0,0 +1,59 @@
+"""
+Zobrist hashing of facility sets and a bounded archive of visited solutions.
+A solution's hash is the XOR of random 64-bit keys of its open facilities,
+so opening or closing a facility updates it in O(1).
+"""
+
+import random
+from collections import OrderedDict
+from typing import Iterable
+
+
+class ZobristTable:
+    def __init__(self, facilities: Iterable[int], seed: int = 0):
+        """Draw one random 64-bit key per facility (fixed seed: stable hashes)."""
+        facilities = list(facilities)
+        rng = random.Random(seed)
+        self.keys = [0] * (max(facilities) + 1)
+        for i in sorted(facilities):
+            self.keys[i] = rng.getrandbits(64)
+    
+    def hash(self, K: Iterable[int]) -> int:
+        """Hash of a facility set from scratch."""
+        h = 0
+        for i in K:
+            h ^= self.keys[i]
+        return h
+    
+    def toggle(self, h: int, i: int) -> int:
+        """Hash after opening or closing facility i."""
+        return h ^ self.keys[i]
+
+
+class SolutionArchive:
+    def __init__(self, zobrist: ZobristTable, max_size: int = 100000):
+        """
+        Visited solution hashes with visit counts and FIFO eviction beyond
+        max_size. Counts lookups that hit an already-archived solution.
+        """
+        self.zobrist = zobrist
+        self.max_size = max_size
+        self._seen: "OrderedDict[int, int]" = OrderedDict()
+        self.hits = 0
+    
+    def __len__(self) -> int:
+        return len(self._seen)
+    
+    def visit(self, h: int) -> int:
+        """Record a visit of h and return its visit count (1 = first visit)."""
+        count = self._seen.get(h, 0) + 1
+        self._seen[h] = count
+        if count > 1:
+            self.hits += 1
+        elif len(self._seen) > self.max_size:
+            self._seen.popitem(last=False)
+        return count
+    
+    def check(self, h: int) -> bool:
+        """Return True (and count a hit) if h was archived; otherwise archive it."""
+        return self.visit(h) > 1
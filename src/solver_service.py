@@ -0,0 +1,332 @@
+"""
+Local HTTP solver service.
+
+A long-lived process that answers solve requests without paying interpreter
+start-up, imports and instance loading each time. Requests are JSON:
+
+    POST /solve  {"instance": "data/M1.json", "algorithm": "ts", "seed": 42,
+                  "time_limit": 10, "params": {"ts_params": {"tenure": 7}}}
+    GET  /metrics
+    GET  /health
+
+Solves run on a process pool (the solvers are CPU-bound Python). Each worker
+keeps an LRU cache of loaded instances with their derived data (CSR arrays,
+fingerprint, and the bounds memoized per instance), keyed by path and file
+modification time. The response is run_algorithm's result (without trace)
+plus timings; /metrics reports throughput, latency percentiles and instance
+cache hits.
+"""
+
+import collections
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+import numpy as np
+
+from instance_loader import MCLPInstance
+from run_mclp import ALGORITHMS, run_algorithm
+from experiment_runner import merge_config
+
+
+class InstanceCache:
+    def __init__(self, max_size: int = 8):
+        """LRU cache of loaded instances by (absolute path, modification time)."""
+        self.max_size = max_size
+        self._instances: "collections.OrderedDict[tuple, MCLPInstance]" = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, path: str) -> MCLPInstance:
+        """Loaded instance for path; raises OSError/ValueError if it cannot be loaded."""
+        path = os.path.abspath(path)
+        key = (path, os.path.getmtime(path))
+        instance = self._instances.get(key)
+        if instance is not None:
+            self._instances.move_to_end(key)
+            self.hits += 1
+            return instance
+        
+        self.misses += 1
+        instance = MCLPInstance(path)
+        # Build the derived data now rather than inside the first timed solve
+        instance.arrays
+        instance.fingerprint
+        self._instances[key] = instance
+        while len(self._instances) > self.max_size:
+            self._instances.popitem(last=False)
+        return instance
+
+
+# Worker-process state
+_worker_cache: Optional[InstanceCache] = None
+
+
+def _init_worker(cache_size: int):
+    """Pool initializer: own instance cache, silent solvers, Ctrl+C left to the service."""
+    global _worker_cache
+    _worker_cache = InstanceCache(cache_size)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    sys.stdout = open(os.devnull, 'w')
+
+
+def _json_value(value):
+    """NumPy scalars/arrays and sets as plain JSON values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (np.ndarray, set, frozenset)):
+        return sorted(value.tolist() if isinstance(value, np.ndarray) else value)
+    return str(value)
+
+
+def _solve_in_worker(request: dict, config: dict, submitted: float) -> dict:
+    """Run one request on the worker's cached instance."""
+    start = time.time()
+    hits = _worker_cache.hits
+    instance = _worker_cache.get(request['instance'])
+    cache_hit = _worker_cache.hits > hits
+    
+    run_config = merge_config(config, request.get('params') or {})
+    if request.get('time_limit') is not None:
+        run_config['termination'] = dict(run_config.get('termination') or {}, time_limit=request['time_limit'])
+    
+    result = run_algorithm(request['algorithm'], instance, run_config, request.get('seed', config.get('seed', 42)))
+    result = {k: v for k, v in result.items() if k != 'trace'}
+    result.update({
+        'instance': instance.name,
+        'instance_cache': 'hit' if cache_hit else 'miss',
+        'queue_time': start - submitted,
+        'solve_time': time.time() - start
+    })
+    return json.loads(json.dumps(result, default=_json_value))
+
+
+def _worker_pid(_) -> int:
+    """Trivial task used to start all workers."""
+    return os.getpid()
+
+
+class Metrics:
+    def __init__(self, window: int = 1000):
+        """Counters and the latencies of the last `window` solves (thread-safe)."""
+        self.start_time = time.time()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.completed = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.instance_hits = 0
+        self.instance_misses = 0
+        self._latencies = collections.deque(maxlen=window)  # (finish time, latency, solve time)
+    
+    def started(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+    
+    def finished(self, latency: float, result: Optional[dict]):
+        with self._lock:
+            self.in_flight -= 1
+            if result is None:
+                self.errors += 1
+                return
+            self.completed += 1
+            if result.get('instance_cache') == 'hit':
+                self.instance_hits += 1
+            else:
+                self.instance_misses += 1
+            self._latencies.append((time.time(), latency, result.get('solve_time', latency)))
+    
+    def snapshot(self) -> dict:
+        """Current metrics (latencies in seconds, throughput in solves per second)."""
+        with self._lock:
+            now = time.time()
+            uptime = now - self.start_time
+            latencies = np.array([entry[1] for entry in self._latencies])
+            solve_times = np.array([entry[2] for entry in self._latencies])
+            last_minute = sum(1 for entry in self._latencies if now - entry[0] <= 60)
+            snapshot = {
+                'uptime': uptime,
+                'requests': self.requests,
+                'completed': self.completed,
+                'errors': self.errors,
+                'in_flight': self.in_flight,
+                'throughput': self.completed / uptime if uptime > 0 else 0.0,
+                'throughput_last_minute': last_minute / min(60.0, uptime) if uptime > 0 else 0.0,
+                'instance_cache': {'hits': self.instance_hits, 'misses': self.instance_misses}
+            }
+        if len(latencies):
+            snapshot['latency'] = {
+                'p50': float(np.percentile(latencies, 50)),
+                'p95': float(np.percentile(latencies, 95)),
+                'max': float(latencies.max()),
+                'mean_solve_time': float(solve_times.mean())
+            }
+        return snapshot
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "MCLPSolver/1.0"
+    
+    def _send(self, status: int, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            self._send(200, self.server.service.metrics.snapshot())
+        else:
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+    
+    def do_POST(self):
+        if self.path != '/solve':
+            self._send(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self._send(400, {'error': f"Invalid JSON: {e}"})
+            return
+        
+        status, body = self.server.service.solve(request)
+        self._send(status, body)
+    
+    def log_message(self, format, *args):
+        if self.server.service.verbose:
+            super().log_message(format, *args)
+
+
+class SolverService:
+    def __init__(
+        self,
+        config: dict,
+        host: str = '127.0.0.1',
+        port: int = 8765,
+        workers: Optional[int] = None,
+        cache_size: int = 8,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            config: Base configuration (config.yaml); requests merge their
+                params over it
+            host, port: Listening address (port 0 = any free port)
+            workers: Solver processes (None = CPU count)
+            cache_size: Instances kept per worker
+            verbose: Log every HTTP request
+        """
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+        self.verbose = verbose
+        self.metrics = Metrics()
+        
+        ctx = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() \
+            else multiprocessing.get_context()
+        self.pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=ctx,
+            initializer=_init_worker, initargs=(cache_size,)
+        )
+        # Start the workers now, before the server threads exist
+        list(self.pool.map(_worker_pid, range(self.workers)))
+        
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.service = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def address(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def solve(self, request: dict) -> tuple:
+        """Validate and run a solve request; returns (HTTP status, body)."""
+        if not isinstance(request, dict):
+            return 400, {'error': "Request must be a JSON object"}
+        if request.get('algorithm') not in ALGORITHMS:
+            return 400, {'error': f"algorithm must be one of {', '.join(ALGORITHMS)}"}
+        if not isinstance(request.get('instance'), str) or not os.path.isfile(request['instance']):
+            return 400, {'error': f"Instance file not found: {request.get('instance')}"}
+        if not isinstance(request.get('params') or {}, dict):
+            return 400, {'error': "params must be an object of config sections"}
+        
+        submitted = time.time()
+        self.metrics.started()
+        result = None
+        try:
+            result = self.pool.submit(_solve_in_worker, request, self.config, submitted).result()
+            return 200, result
+        except Exception as e:
+            return 500, {'error': str(e), 'traceback': traceback.format_exc()}
+        finally:
+            self.metrics.finished(time.time() - submitted, result)
+    
+    def start(self) -> 'SolverService':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def serve_forever(self):
+        """Serve in this thread until Ctrl+C."""
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+    
+    def stop(self):
+        """Stop serving and shut the worker pool down."""
+        if self._thread is not None:
+            self.server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server.server_close()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    import argparse
+    from run_mclp import load_config
+    
+    parser = argparse.ArgumentParser(description="Local HTTP solver service for MCLP")
+    parser.add_argument('--config', type=str, default='config.yaml', help='Base configuration')
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help='Solver processes (default: CPU count)')
+    parser.add_argument('--cache-size', type=int, default=8, help='Instances cached per worker')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+    
+    config = load_config(args.config) if os.path.exists(args.config) else {}
+    service = SolverService(
+        config, args.host, args.port, args.workers, args.cache_size, args.verbose
+    )
+    print(f"Serving on {service.address} with {service.workers} workers (Ctrl+C to stop)")
+    service.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
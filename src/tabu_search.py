@@ -8,8 +8,25 @@ import time
 from typing import Set, Tuple, List, Dict, Optional
 from collections import deque
 from instance_loader import MCLPInstance
-from greedy import greedy_heuristic
-from local_search import run_local_search
+from heuristic_cache import cached_greedy
+from search_trace import SearchTrace
+from neighborhood import VectorizedNeighborhood
+from elite_pool import ElitePool
+from solution_hash import ZobristTable, SolutionArchive
+from checkpoint import save_checkpoint, load_checkpoint
+from termination import Termination
+from bounds import upper_bound
+
+# Attributes rebuilt from the constructor rather than checkpointed
+_TRANSIENT_STATE = ('instance', 'termination', 'neighborhood', 'checkpoint_path', 'checkpoint_every')
+
+# Settings a checkpoint must agree on to be resumed (everything that shapes
+# the trajectory or the trace; set_state would otherwise restore them silently)
+_CHECKPOINT_SETTINGS = (
+    'seed', 'max_iterations', 'add_tenure', 'drop_tenure', 'candidate_list_size',
+    'stagnation_limit', 'intensification_freq', 'max_restarts', 'elite_size',
+    'visited_size', 'cycle_threshold', 'frequency_shake', 'trace_sample_every'
+)
 
 
 class TabuSearch:
@@ -21,16 +38,76 @@ class TabuSearch:
         max_iterations: int = 500,
         stagnation_limit: int = 100,
         intensification_freq: int = 50,
-        seed: int = 42
+        seed: int = 42,
+        add_tenure: Optional[int] = None,
+        drop_tenure: Optional[int] = None,
+        trace_sample_every: int = 1,
+        time_limit: Optional[float] = None,
+        target_objective: Optional[float] = None,
+        no_improvement_time: Optional[float] = None,
+        termination: Optional[Termination] = None,
+        neighborhood_workers: Optional[int] = None,
+        elite_size: int = 0,
+        visited_size: int = 0,
+        cycle_threshold: int = 3,
+        frequency_shake: bool = False,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 1000
     ):
         self.instance = instance
         self.tenure = tenure
+        # Attribute-based tenures: a closed facility may not be re-opened for
+        # add_tenure iterations, an opened one may not be closed for drop_tenure.
+        self.add_tenure = tenure if add_tenure is None else add_tenure
+        self.drop_tenure = tenure if drop_tenure is None else drop_tenure
         self.candidate_list_size = candidate_list_size
         self.max_iterations = max_iterations
         self.stagnation_limit = stagnation_limit
         self.intensification_freq = intensification_freq
         self.seed = seed
-        random.seed(seed)
+        self.rng = random.Random(seed)  # Own RNG, never the global random module
+        
+        # Anytime termination (wall clock / target / no-improvement / SIGINT);
+        # a shared `termination` takes precedence over the individual criteria
+        if termination is None:
+            termination = Termination(
+                time_limit, target_objective, no_improvement_time,
+                upper_bound=upper_bound(instance)
+            )
+        self.termination = termination
+        self.stop_reason: Optional[str] = None
+        self._start_time: Optional[float] = None  # Set by the first run_segment()
+        
+        # Progress for checkpoint/resume: run() continues at next_iteration
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.next_iteration = 0
+        self.finished = False  # Search over (not just interrupted)
+        
+        # None: reference per-move evaluator. An int selects the NumPy
+        # evaluator with the swap neighborhood split over that many threads
+        # (deterministic for any thread count; ties are broken by facility ID).
+        self.neighborhood = None
+        if neighborhood_workers is not None:
+            self.neighborhood = VectorizedNeighborhood(instance, workers=neighborhood_workers)
+        
+        # Elite pool for path relinking on stagnation (0 = random shake only)
+        self.elite_size = elite_size
+        self.elite = ElitePool(capacity=elite_size) if elite_size > 0 else None
+        self.relink_min_distance = 4  # Guides closer than this leave no room for a path
+        
+        # Long-term memory. The Zobrist hash of K is updated in O(1) per move;
+        # with visited_size > 0 a bounded table of visited hashes detects
+        # cycling (a solution visited cycle_threshold times or more) and diversifies
+        # before the stagnation limit. With frequency_shake, open_frequency counts
+        # the iterations each facility spent open and drives the shake.
+        self.zobrist = ZobristTable(instance.I, seed=seed)
+        self.solution_hash = 0
+        self.visited_size = visited_size
+        self.visited = SolutionArchive(self.zobrist, max_size=visited_size) if visited_size > 0 else None
+        self.cycle_threshold = cycle_threshold
+        self.frequency_shake = frequency_shake
+        self.open_frequency: List[int] = [0] * (max(instance.I) + 1)
         
         # Current solution state
         self.K: Set[int] = set()  # Open facilities
@@ -45,8 +122,12 @@ class TabuSearch:
         self.best_K: Set[int] = set()
         self.best_obj: float = -float('inf')
         
-        # Tabu list: {facility_id: iteration_when_tabu_expires}
-        self.tabu_list: Dict[int, int] = {}
+        # Tabu memory: dense array {facility_id: iteration_when_tabu_expires}.
+        # Expiries are bucketed in a ring indexed by iteration so the number of
+        # active entries is maintained in O(1) per move/iteration.
+        self.tabu_until: List[int] = [0] * (max(instance.I) + 1)
+        self.tabu_active = 0
+        self._expiry_ring: List[int] = [0] * (max(self.add_tenure, self.drop_tenure) + 1)
         
         # Statistics
         self.iteration = 0
@@ -54,10 +135,16 @@ class TabuSearch:
         self.aspiration_hits = 0
         self.intensification_count = 0
         self.restart_count = 0
+        self.relink_count = 0
+        self.cycle_count = 0
         self.max_restarts = 100
         
-        # History tracking
-        self.history = []
+        # History tracking: columnar trace, every k-th iteration plus new bests
+        self.trace_sample_every = trace_sample_every
+        self.history = SearchTrace(
+            capacity=max_iterations // trace_sample_every + 64,
+            sample_every=trace_sample_every
+        )
     
     def initialize_solution(self, initial_facilities: Set[int], reset_best: bool = True):
         """Initialize from a given facility set."""
@@ -75,6 +162,7 @@ class TabuSearch:
                     self.covered.add(j)
         
         self.objective = sum(self.instance.d[j] for j in self.covered)
+        self.solution_hash = self.zobrist.hash(self.K)
         
         # Only initialize global best on first call
         if reset_best:
@@ -93,7 +181,32 @@ class TabuSearch:
     
     def is_tabu(self, facility: int) -> bool:
         """Check if facility is tabu."""
-        return facility in self.tabu_list and self.tabu_list[facility] > self.iteration
+        return self.tabu_until[facility] > self.iteration
+    
+    def make_tabu(self, facility: int, tenure: int):
+        """Forbid flipping facility back for the next `tenure` iterations."""
+        ring = self._expiry_ring
+        previous = self.tabu_until[facility]
+        if previous > self.iteration:
+            ring[previous % len(ring)] -= 1
+            self.tabu_active -= 1
+        
+        if tenure > 0:
+            expiry = self.iteration + tenure
+            self.tabu_until[facility] = expiry
+            ring[expiry % len(ring)] += 1
+            self.tabu_active += 1
+        else:
+            self.tabu_until[facility] = self.iteration
+    
+    def advance_iteration(self, iteration: int):
+        """Move the iteration counter forward, expiring tabu entries."""
+        ring = self._expiry_ring
+        for t in range(max(self.iteration + 1, iteration - len(ring) + 1), iteration + 1):
+            slot = t % len(ring)
+            self.tabu_active -= ring[slot]
+            ring[slot] = 0
+        self.iteration = iteration
     
     def aspiration_criterion(self, delta_obj: float) -> bool:
         """Override tabu if move improves global best."""
@@ -149,7 +262,7 @@ class TabuSearch:
         
         return gain - loss, True
     
-    def apply_close(self, i: int):
+    def apply_close(self, i: int, mark_tabu: bool = True):
         """Close facility i."""
         if i not in self.K:
             return
@@ -163,10 +276,13 @@ class TabuSearch:
                 self.covered.discard(j)
                 self.objective -= self.instance.d[j]
         
-        # Add to tabu list
-        self.tabu_list[i] = self.iteration + self.tenure
+        self.solution_hash ^= self.zobrist.keys[i]
+        
+        # Closed facility may not be re-opened for add_tenure iterations
+        if mark_tabu:
+            self.make_tabu(i, self.add_tenure)
     
-    def apply_open(self, i: int):
+    def apply_open(self, i: int, mark_tabu: bool = True):
         """Open facility i."""
         if i in self.K:
             return
@@ -180,19 +296,26 @@ class TabuSearch:
                 self.objective += self.instance.d[j]
             self.covered_by_count[j] += 1
         
-        # Add to tabu list
-        self.tabu_list[i] = self.iteration + self.tenure
+        self.solution_hash ^= self.zobrist.keys[i]
+        
+        # Opened facility may not be closed for drop_tenure iterations
+        if mark_tabu:
+            self.make_tabu(i, self.drop_tenure)
     
-    def apply_swap(self, i_out: int, j_in: int):
+    def apply_swap(self, i_out: int, j_in: int, mark_tabu: bool = True):
         """Execute swap."""
-        self.apply_close(i_out)
-        self.apply_open(j_in)
+        self.apply_close(i_out, mark_tabu)
+        self.apply_open(j_in, mark_tabu)
     
     def generate_candidate_moves(self) -> List[Tuple[str, any, float, bool]]:
         """
         Generate candidate moves (flip + swap).
         Returns list of: (move_type, move_data, delta_obj, is_tabu)
         """
+        if self.neighborhood is not None:
+            # Only the candidate list is needed, so only the top moves are built
+            return self.neighborhood.candidate_moves(self, self.candidate_list_size)
+        
         candidates = []
         
         # 1-flip: Close moves
@@ -251,18 +374,22 @@ class TabuSearch:
         """
         Diversification: randomly flip 2-3 facilities to escape local optimum.
         """
-        num_flips = random.randint(2, 3)
+        if self.frequency_shake:
+            self.frequency_guided_shake()
+            return
+        
+        num_flips = self.rng.randint(2, 3)
         
         # Randomly close some open facilities
         if len(self.K) >= num_flips:
-            to_close = random.sample(list(self.K), min(num_flips, len(self.K)))
+            to_close = self.rng.sample(list(self.K), min(num_flips, len(self.K)))
             for i in to_close:
                 if i in self.K:  # Check again as we might close in loop
                     self.apply_close(i)
         
         # Try to open random facilities within budget
         candidates = list(set(self.instance.I) - self.K)
-        random.shuffle(candidates)
+        self.rng.shuffle(candidates)
         
         for i in candidates[:num_flips]:
             if self.budget_used + self.instance.f[i] <= self.instance.B:
@@ -270,27 +397,163 @@ class TabuSearch:
         
         self.restart_count += 1
     
-    def intensify(self, verbose: bool = False):
+    def frequency_guided_shake(self):
+        """
+        Diversification from long-term memory: close the 2-3 open facilities
+        that have been open longest over the search and open the least-used
+        closed ones that fit the budget (random tie-break).
+        """
+        num_flips = self.rng.randint(2, 3)
+        freq = self.open_frequency
+        
+        to_close = sorted(self.K, key=lambda i: (-freq[i], self.rng.random()))[:num_flips]
+        for i in to_close:
+            self.apply_close(i)
+        
+        candidates = sorted(set(self.instance.I) - self.K - set(to_close),
+                            key=lambda i: (freq[i], self.rng.random()))
+        opened = 0
+        for i in candidates:
+            if opened == num_flips:
+                break
+            if self.budget_used + self.instance.f[i] <= self.instance.B:
+                self.apply_open(i)
+                opened += 1
+        
+        self.restart_count += 1
+    
+    def path_relink(self, guide: Set[int]) -> bool:
+        """
+        Walk from the current solution towards `guide`. Each step applies
+        the best move (by delta evaluation) that shrinks the symmetric
+        difference: swap i in K - guide for j in guide - K, open j, or
+        close i. Path moves are made tabu so the search does not walk
+        straight back. The search resumes from the best intermediate
+        solution (endpoints excluded).
+        Returns False if the path had no intermediate solution.
+        """
+        best_point = None
+        best_point_obj = -float('inf')
+        
+        while True:
+            to_open = sorted(guide - self.K)
+            to_close = sorted(self.K - guide)
+            
+            best_move = None
+            best_delta = -float('inf')
+            for i in to_close:
+                for j in to_open:
+                    delta, feasible = self.delta_eval_swap(i, j)
+                    if feasible and delta > best_delta:
+                        best_delta, best_move = delta, ('swap', i, j)
+            for j in to_open:
+                delta, feasible = self.delta_eval_open(j)
+                if feasible and delta > best_delta:
+                    best_delta, best_move = delta, ('open', j)
+            for i in to_close:
+                delta = self.delta_eval_close(i)
+                if delta > best_delta:
+                    best_delta, best_move = delta, ('close', i)
+            
+            if best_move is None:
+                break
+            
+            if best_move[0] == 'swap':
+                self.apply_swap(best_move[1], best_move[2])
+            elif best_move[0] == 'open':
+                self.apply_open(best_move[1])
+            else:
+                self.apply_close(best_move[1])
+            
+            if self.K != guide and self.objective > best_point_obj:
+                best_point = self.K.copy()
+                best_point_obj = self.objective
+        
+        if best_point is None:
+            return False
+        
+        self.initialize_solution(best_point, reset_best=False)
+        return True
+    
+    def diversify(self) -> bool:
         """
-        Intensification: run local search from current solution.
+        Escape stagnation: relink towards a distant elite solution if the
+        pool has one, otherwise shake randomly. Returns True if relinking
+        reached a new best.
+        """
+        if self.elite is not None:
+            self.elite.add(self.K, self.objective)
+            guide = self.elite.select_guide(self.K, self.rng, self.relink_min_distance)
+            if guide is not None and self.path_relink(guide):
+                self.relink_count += 1
+                self.restart_count += 1
+                if self.update_best():
+                    self.termination.update(self.best_obj, self.best_K)
+                    return True
+                return False
+        
+        self.shake()
+        return False
+    
+    def local_search_step(self, rng: random.Random) -> bool:
+        """
+        One best-improvement step (1-flip + swap) on the live coverage state.
+        Moves are not marked tabu. Returns True if an improving move was applied.
+        """
+        # Randomize exploration order to diversify tie-breaking
+        facilities_open = list(self.K)
+        facilities_closed = list(set(self.instance.I) - self.K)
+        rng.shuffle(facilities_open)
+        rng.shuffle(facilities_closed)
+        
+        best_move = None
+        best_delta = 0.0
+        
+        for i in facilities_open:
+            delta = self.delta_eval_close(i)
+            if delta > best_delta:
+                best_delta = delta
+                best_move = ('close', i)
+        
+        for j in facilities_closed:
+            delta, feasible = self.delta_eval_open(j)
+            if feasible and delta > best_delta:
+                best_delta = delta
+                best_move = ('open', j)
+        
+        for i_out in facilities_open:
+            for j_in in facilities_closed:
+                delta, feasible = self.delta_eval_swap(i_out, j_in)
+                if feasible and delta > best_delta:
+                    best_delta = delta
+                    best_move = ('swap', i_out, j_in)
+        
+        if best_move is None or best_delta <= 1e-6:
+            return False
+        
+        if best_move[0] == 'close':
+            self.apply_close(best_move[1], mark_tabu=False)
+        elif best_move[0] == 'open':
+            self.apply_open(best_move[1], mark_tabu=False)
+        else:
+            self.apply_swap(best_move[1], best_move[2], mark_tabu=False)
+        
+        return True
+    
+    def intensify(self, max_moves: int = 50, verbose: bool = False):
+        """
+        Intensification: short local search run in place on the current
+        coverage state, so its cost is only the moves it evaluates.
         """
         if verbose:
             print(f"    [Intensification at iter {self.iteration}]")
         
-        K_before = self.K.copy()
         obj_before = self.objective
+        rng = random.Random(self.seed + self.iteration)
         
-        # Run short local search
-        K_improved, obj_improved, _ = run_local_search(
-            self.instance,
-            self.K,
-            max_moves=50,
-            seed=self.seed + self.iteration,
-            verbose=False
-        )
-        
-        # Update state
-        self.initialize_solution(K_improved, reset_best=False)
+        for _ in range(max_moves):
+            if not self.local_search_step(rng):
+                break
         
         if verbose:
             improvement = self.objective - obj_before
@@ -298,32 +561,49 @@ class TabuSearch:
         
         self.intensification_count += 1
     
-    def update_best(self):
-        """Update global best if current solution is better."""
+    def update_best(self) -> bool:
+        """Update global best if current solution is better. Returns True on a new best."""
         if self.objective > self.best_obj:
             self.best_obj = self.objective
             self.best_K = self.K.copy()
             self.stagnation_counter = 0
-        else:
-            self.stagnation_counter += 1
+            return True
+        
+        self.stagnation_counter += 1
+        return False
     
-    def run(self, verbose: bool = True) -> Tuple[Set[int], float]:
+    def _record_new_best(self, iteration: int, delta: float, move_type: str):
+        """Trace row of a new best found outside the move (always recorded)."""
+        self.history.record(
+            iteration, self.objective, self.best_obj, delta, move_type,
+            self.tabu_active, self.stagnation_counter, True,
+            elapsed=time.time() - self._start_time
+        )
+    
+    def run_segment(self, first: int, last: int, verbose: bool = False) -> bool:
         """
-        Execute Tabu Search.
-        Returns: (best_facilities, best_objective)
+        Run iterations first..last-1 (segments must be consecutive, starting
+        at 0). Lets a driver interleave search with other work, e.g. island
+        migration, with the same trajectory as one uninterrupted run().
+        Returns False once the search is over (termination criterion, no
+        admissible move, or restart limit).
         """
-        if verbose:
-            print(f"Tabu Search Configuration:")
-            print(f"  Tenure: {self.tenure}")
-            print(f"  Candidate list size: {self.candidate_list_size}")
-            print(f"  Max iterations: {self.max_iterations}")
-            print(f"  Stagnation limit: {self.stagnation_limit}")
-            print(f"  Intensification frequency: {self.intensification_freq}")
-            print(f"\nInitial objective: {self.objective:.2f}")
-            print("="*70)
+        termination = self.termination
+        if self._start_time is None:
+            self._start_time = time.time()
+            termination.update(self.best_obj, self.best_K)
         
-        for iteration in range(self.max_iterations):
-            self.iteration = iteration
+        for iteration in range(first, last):
+            if termination.should_stop():
+                if verbose:
+                    print(f"Iteration {iteration}: stopped ({termination.reason}), "
+                          f"returning best-so-far")
+                # An interrupted search can be resumed from this iteration
+                self.next_iteration = iteration
+                self.finished = termination.reason not in ('interrupted', 'cancelled')
+                return False
+            
+            self.advance_iteration(iteration)
             
             # Generate candidate moves
             candidates = self.generate_candidate_moves()
@@ -331,7 +611,8 @@ class TabuSearch:
             if not candidates:
                 if verbose:
                     print(f"Iteration {iteration}: No valid moves, terminating")
-                break
+                self.finished = True
+                return False
             
             # Select best move
             best_move = self.select_best_move(candidates)
@@ -339,7 +620,8 @@ class TabuSearch:
             if best_move is None:
                 if verbose:
                     print(f"Iteration {iteration}: No admissible move, terminating")
-                break
+                self.finished = True
+                return False
             
             move_type, move_data, delta = best_move
             
@@ -352,52 +634,159 @@ class TabuSearch:
                 self.apply_swap(move_data[0], move_data[1])
             
             # Update global best
-            self.update_best()
+            new_best = self.update_best()
+            if new_best:
+                termination.update(self.best_obj, self.best_K)
+                if self.elite is not None:
+                    self.elite.add(self.K, self.objective)
+            
+            # Long-term memory
+            if self.frequency_shake:
+                for i in self.K:
+                    self.open_frequency[i] += 1
+            cycling = (
+                self.visited is not None and
+                self.visited.visit(self.solution_hash) >= self.cycle_threshold
+            )
             
             # Log iteration
-            self.history.append({
-                'iteration': iteration,
-                'current_obj': self.objective,
-                'best_obj': self.best_obj,
-                'delta': delta,
-                'move_type': move_type,
-                'tabu_list_size': len([v for v in self.tabu_list.values() if v > iteration]),
-                'stagnation': self.stagnation_counter
-            })
+            self.history.record(
+                iteration, self.objective, self.best_obj, delta, move_type,
+                self.tabu_active, self.stagnation_counter, new_best,
+                elapsed=time.time() - self._start_time
+            )
             
             # Verbose logging
             if verbose and (iteration + 1) % 50 == 0:
                 print(f"Iter {iteration + 1:4d}: current={self.objective:.2f}, "
                       f"best={self.best_obj:.2f}, stagnation={self.stagnation_counter}, "
-                      f"tabu_size={len([v for v in self.tabu_list.values() if v > iteration])}")
+                      f"tabu_size={self.tabu_active}")
             
             # Intensification
             if (iteration + 1) % self.intensification_freq == 0:
+                obj_before = self.objective
                 self.intensify(verbose=verbose)
-                self.update_best()
+                if self.update_best():
+                    termination.update(self.best_obj, self.best_K)
+                    self._record_new_best(iteration, self.objective - obj_before, 'intensify')
+                if self.elite is not None:
+                    self.elite.add(self.K, self.objective)  # Intensified local optimum
             
-            # Restart on stagnation
-            if self.stagnation_counter >= self.stagnation_limit:
+            # Restart on stagnation, or early when the search is cycling
+            if cycling or self.stagnation_counter >= self.stagnation_limit:
+                if cycling:
+                    self.cycle_count += 1
                 if verbose:
-                    print(f"  [Restart due to stagnation at iter {iteration}]")
+                    reason = "cycling" if cycling else "stagnation"
+                    print(f"  [Restart due to {reason} at iter {iteration}]")
                 
-                # Shake current solution
-                self.shake()
+                # Path relinking to an elite, or a random shake
+                obj_before = self.objective
+                if self.diversify():
+                    self._record_new_best(iteration, self.objective - obj_before, 'relink')
                 self._validate_state()  # <--- SNAP BACK TO REALITY
                 self.stagnation_counter = 0
                 
-                if self.restart_count >= self.max_restarts:
+                # Early restarts on cycle detection do not use up the restart limit
+                if self.restart_count - self.cycle_count >= self.max_restarts:
                     if verbose:
                         print(f"  [Max restarts reached, terminating]")
+                    self.finished = True
+                    return False
+        
+        self.next_iteration = last
+        self.finished = last >= self.max_iterations
+        return True
+    
+    def accept_migrant(self, K: Set[int], obj: float) -> bool:
+        """
+        Adopt a solution received from another search as the current and
+        best solution if it beats this search's best. Tabu memory is kept.
+        """
+        if obj <= self.best_obj:
+            return False
+        
+        self.initialize_solution(K)
+        self.stagnation_counter = 0
+        self.termination.update(self.best_obj, self.best_K)
+        return True
+    
+    def get_state(self) -> dict:
+        """
+        Complete search state (solutions, coverage counts, tabu memory,
+        RNG state, long-term memory, counters, trace) as a picklable dict.
+        """
+        state = {k: v for k, v in self.__dict__.items() if k not in _TRANSIENT_STATE}
+        state['_start_time'] = None
+        state['elapsed'] = 0.0 if self._start_time is None else time.time() - self._start_time
+        return state
+    
+    def set_state(self, state: dict):
+        """Restore a state from get_state(); elapsed time continues from the checkpoint."""
+        for key in _CHECKPOINT_SETTINGS:
+            if key not in state:
+                raise ValueError(f"Checkpoint has no {key} setting (written by an older version)")
+            if state[key] != getattr(self, key):
+                raise ValueError(f"Checkpoint has {key}={state[key]!r}, run has {getattr(self, key)!r}")
+        
+        state = dict(state)
+        elapsed = state.pop('elapsed')
+        self.__dict__.update(state)
+        if self.next_iteration > 0:
+            self._start_time = time.time() - elapsed
+            self.termination.update(self.best_obj, self.best_K)
+    
+    def save_checkpoint(self, path: str):
+        """Write the current state to a checkpoint file."""
+        save_checkpoint(path, 'tabu_search', self.instance.fingerprint, {'state': self.get_state()})
+    
+    def load_checkpoint(self, path: str) -> bool:
+        """Restore state from a checkpoint file. Returns False if there is none."""
+        data = load_checkpoint(path, 'tabu_search', self.instance.fingerprint)
+        if data is None:
+            return False
+        self.set_state(data['state'])
+        return True
+    
+    def run(self, verbose: bool = True) -> Tuple[Set[int], float]:
+        """
+        Execute Tabu Search until max_iterations/max_restarts or a
+        termination criterion fires; the best-so-far solution is returned.
+        Returns: (best_facilities, best_objective)
+        """
+        if verbose:
+            print(f"Tabu Search Configuration:")
+            print(f"  Tenure: {self.tenure} (add={self.add_tenure}, drop={self.drop_tenure})")
+            print(f"  Candidate list size: {self.candidate_list_size}")
+            print(f"  Max iterations: {self.max_iterations}")
+            print(f"  Stagnation limit: {self.stagnation_limit}")
+            print(f"  Intensification frequency: {self.intensification_freq}")
+            if self.termination.deadline is not None:
+                print(f"  Time limit: {self.termination.deadline - self.termination.start_time:.1f}s")
+            print(f"\nInitial objective: {self.objective:.2f}")
+            print("="*70)
+        
+        termination = self.termination
+        if verbose and self.next_iteration > 0:
+            print(f"Resuming at iteration {self.next_iteration}")
+        
+        with termination.handle_sigint():
+            # With a checkpoint path, run in chunks and save after each one
+            step = self.checkpoint_every if self.checkpoint_path else self.max_iterations
+            while not self.finished:
+                first = self.next_iteration
+                if not self.run_segment(first, min(first + step, self.max_iterations), verbose=verbose):
                     break
-                if self.restart_count >= self.max_restarts:
-                        print(f"  [RESTART LIMIT] {self.restart_count}/{self.max_restarts} restarts")
-                        print(f"  [RESTART LIMIT] Terminating at iteration {iteration}/{self.max_iterations}")
-                        print(f"  [RESTART LIMIT] Best obj: {self.best_obj}, Current obj: {self.objective}")
-                        break
-
-
-                
+                if self.checkpoint_path and not self.finished:
+                    self.save_checkpoint(self.checkpoint_path)
+        
+        if self.checkpoint_path:
+            self.save_checkpoint(self.checkpoint_path)
+        
+        if self.neighborhood is not None:
+            self.neighborhood.close()
+        
+        self.stop_reason = termination.reason or 'completed'
         
         if verbose:
             print("="*70)
@@ -407,7 +796,9 @@ class TabuSearch:
             print(f"  Total iterations: {self.iteration + 1}")
             print(f"  Aspiration hits: {self.aspiration_hits}")
             print(f"  Intensifications: {self.intensification_count}")
-            print(f"  Restarts: {self.restart_count}")
+            print(f"  Restarts: {self.restart_count} ({self.relink_count} by path relinking, "
+                  f"{self.cycle_count} on cycle detection)")
+            print(f"  Stop reason: {self.stop_reason}")
         
         return self.best_K, self.best_obj
 
@@ -419,32 +810,88 @@ def run_tabu_search(
     stagnation_limit: int = 100,
     intensification_freq: int = 50,
     seed: int = 42,
-    verbose: bool = True
-) -> Tuple[Set[int], float, List[dict]]:
+    verbose: bool = True,
+    add_tenure: Optional[int] = None,
+    drop_tenure: Optional[int] = None,
+    trace_sample_every: int = 1,
+    time_limit: Optional[float] = None,
+    target_objective: Optional[float] = None,
+    no_improvement_time: Optional[float] = None,
+    termination: Optional[Termination] = None,
+    neighborhood_workers: Optional[int] = None,
+    elite_size: int = 0,
+    visited_size: int = 0,
+    frequency_shake: bool = False,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = 1000,
+    resume: bool = False
+) -> Tuple[Set[int], float, SearchTrace]:
     """
     Convenience wrapper for Tabu Search.
     Initializes with Greedy heuristic + randomization.
+    The time limit covers initialization as well as the search; the search
+    stops as soon as the incumbent matches a cheap upper bound.
+    
+    With checkpoint_path, the state is saved every checkpoint_every
+    iterations and when the run stops. resume=True continues from an
+    existing checkpoint with the same trajectory as an uninterrupted run
+    (termination clocks restart on resume).
     
-    Returns: (best_facilities, best_objective, history)
+    Returns: (best_facilities, best_objective, history trace)
     """
-    import random
-    random.seed(seed)
+    if termination is None:
+        termination = Termination(
+            time_limit, target_objective, no_improvement_time,
+            upper_bound=upper_bound(instance)
+        )
+    
+    # Run Tabu Search
+    ts = TabuSearch(
+        instance,
+        tenure=tenure,
+        candidate_list_size=candidate_list_size,
+        max_iterations=max_iterations,
+        stagnation_limit=stagnation_limit,
+        intensification_freq=intensification_freq,
+        seed=seed,
+        add_tenure=add_tenure,
+        drop_tenure=drop_tenure,
+        trace_sample_every=trace_sample_every,
+        termination=termination,
+        neighborhood_workers=neighborhood_workers,
+        elite_size=elite_size,
+        visited_size=visited_size,
+        frequency_shake=frequency_shake,
+        checkpoint_path=checkpoint_path,
+        checkpoint_every=checkpoint_every
+    )
     
-    # Get initial solution from Greedy
-    if verbose:
-        print("Initializing with Greedy heuristic...")
-    K_init, _, _ = greedy_heuristic(instance, seed=seed)
+    if not (resume and checkpoint_path and ts.load_checkpoint(checkpoint_path)):
+        # Get initial solution from Greedy
+        if verbose:
+            print("Initializing with Greedy heuristic...")
+        ts.initialize_solution(initial_solution(instance, seed))
+    
+    best_K, best_obj = ts.run(verbose=verbose)
+    
+    return best_K, best_obj, ts.history
+
+
+def initial_solution(instance: MCLPInstance, seed: int) -> Set[int]:
+    """Greedy solution with 1-3 facilities randomly replaced (seeded)."""
+    rng = random.Random(seed)
+    K_init, _, _ = cached_greedy(instance)
     
     # ADD RANDOMIZATION: Remove 1-3 random facilities and add different ones
     if len(K_init) > 3:
-        num_perturb = random.randint(1, min(3, len(K_init) // 2))
-        to_remove = random.sample(list(K_init), num_perturb)
+        num_perturb = rng.randint(1, min(3, len(K_init) // 2))
+        to_remove = rng.sample(list(K_init), num_perturb)
         for i in to_remove:
             K_init.remove(i)
         
         # Try to add random facilities
         candidates = list(set(instance.I) - K_init)
-        random.shuffle(candidates)
+        rng.shuffle(candidates)
         budget_used = sum(instance.f[i] for i in K_init)
         
         for i in candidates:
@@ -454,21 +901,7 @@ def run_tabu_search(
                 if len(K_init) >= len(to_remove) + len(K_init):
                     break
     
-    # Run Tabu Search
-    ts = TabuSearch(
-        instance,
-        tenure=tenure,
-        candidate_list_size=candidate_list_size,
-        max_iterations=max_iterations,
-        stagnation_limit=stagnation_limit,
-        intensification_freq=intensification_freq,
-        seed=seed
-    )
-    
-    ts.initialize_solution(K_init)
-    best_K, best_obj = ts.run(verbose=verbose)
-    
-    return best_K, best_obj, ts.history
+    return K_init
 
 
 if __name__ == "__main__":
@@ -477,11 +910,27 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Tabu Search for MCLP")
     parser.add_argument("--instance", type=str, default="data/test_tiny.json")
     parser.add_argument("--tenure", type=int, default=10)
+    parser.add_argument("--add-tenure", type=int, default=None)
+    parser.add_argument("--drop-tenure", type=int, default=None)
     parser.add_argument("--candidate-list-size", type=int, default=20)
     parser.add_argument("--max-iterations", type=int, default=500)
     parser.add_argument("--stagnation-limit", type=int, default=100)
     parser.add_argument("--intensification-freq", type=int, default=50)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trace-sample-every", type=int, default=1)
+    parser.add_argument("--time-limit", type=float, default=None)
+    parser.add_argument("--target-objective", type=float, default=None)
+    parser.add_argument("--no-improvement-time", type=float, default=None)
+    parser.add_argument("--neighborhood-workers", type=int, default=None,
+                        help="Use the NumPy neighborhood evaluator with this many threads")
+    parser.add_argument("--elite-size", type=int, default=0,
+                        help="Elite pool size for path relinking (0 = random shake)")
+    parser.add_argument("--visited-size", type=int, default=0,
+                        help="Visited-solution table size for cycle detection (0 = off)")
+    parser.add_argument("--frequency-shake", action="store_true",
+                        help="Shake by long-term open frequency instead of at random")
+    parser.add_argument("--trace-output", type=str, default=None,
+                        help="Write iteration trace to CSV/Parquet")
     args = parser.parse_args()
     
     # Load instance
@@ -499,7 +948,17 @@ if __name__ == "__main__":
         stagnation_limit=args.stagnation_limit,
         intensification_freq=args.intensification_freq,
         seed=args.seed,
-        verbose=True
+        verbose=True,
+        add_tenure=args.add_tenure,
+        drop_tenure=args.drop_tenure,
+        trace_sample_every=args.trace_sample_every,
+        time_limit=args.time_limit,
+        target_objective=args.target_objective,
+        no_improvement_time=args.no_improvement_time,
+        neighborhood_workers=args.neighborhood_workers,
+        elite_size=args.elite_size,
+        visited_size=args.visited_size,
+        frequency_shake=args.frequency_shake
     )
     
     runtime = time.time() - start_time
@@ -507,4 +966,8 @@ if __name__ == "__main__":
     # Final summary
     print(f"\nTotal runtime: {runtime:.2f} seconds")
     print(f"Budget used: {sum(instance.f[i] for i in best_K):.2f} / {instance.B:.2f}")
-    print(f"Coverage: {best_obj / instance.total_demand:.1%} of total demand")
\ No newline at end of file
+    print(f"Coverage: {best_obj / instance.total_demand:.1%} of total demand")
+    
+    if args.trace_output:
+        history.save(args.trace_output)
+        print(f"Trace ({len(history)} rows) saved to: {args.trace_output}")
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Termination criteria shared by the search algorithms.
+Supports wall-clock limit, target objective, no-improvement time, proven
+optimality against an upper bound, and cooperative cancellation (SIGINT or
+cancel()). Solvers poll should_stop() and return their best-so-far solution
+when it fires.
+"""
+
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, Optional
+
+
+class Termination:
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        target_objective: Optional[float] = None,
+        no_improvement_time: Optional[float] = None,
+        deadline: Optional[float] = None,
+        upper_bound: Optional[float] = None,
+        cancel_event=None,
+        on_improvement: Optional[Callable[[float, Optional[List[int]]], None]] = None
+    ):
+        """
+        Args:
+            time_limit: Wall-clock seconds from construction
+            target_objective: Stop once an objective >= target is reported
+            no_improvement_time: Stop after this many seconds without a new best
+            deadline: Absolute time.time() deadline (combined with time_limit)
+            upper_bound: Valid upper bound; reaching it proves optimality
+            cancel_event: Optional threading/multiprocessing Event; once set the
+                search stops with reason 'cancelled'
+            on_improvement: Called with every new best objective and its
+                sorted facilities (None if the solver did not report them),
+                from the solver's thread
+        """
+        self.time_limit = time_limit
+        self.target_objective = target_objective
+        self.no_improvement_time = no_improvement_time
+        self.upper_bound = upper_bound
+        self.cancel_event = cancel_event
+        self.on_improvement = on_improvement
+        
+        self.start_time = time.time()
+        self.deadline = deadline
+        if time_limit is not None:
+            limit_deadline = self.start_time + time_limit
+            self.deadline = limit_deadline if deadline is None else min(deadline, limit_deadline)
+        
+        self.best_objective = -float('inf')
+        self.last_improvement_time = self.start_time
+        self.reason: Optional[str] = None  # Why the search stopped (None = still running)
+    
+    def update(self, objective: float, solution: Optional[Iterable[int]] = None):
+        """
+        Report an objective value (and optionally the facilities achieving
+        it); resets the no-improvement clock on a new best and stops
+        immediately if the new best matches the upper bound.
+        """
+        if objective > self.best_objective:
+            self.best_objective = objective
+            self.last_improvement_time = time.time()
+            if self.on_improvement is not None:
+                self.on_improvement(objective, None if solution is None else sorted(solution))
+            if self.upper_bound is not None and objective >= self.upper_bound - 1e-6:
+                self.cancel('proven_optimal')
+    
+    def cancel(self, reason: str = 'cancelled'):
+        """Request cooperative termination (safe to call from another thread)."""
+        if self.reason is None:
+            self.reason = reason
+    
+    def should_stop(self) -> bool:
+        """Check all criteria. Sets self.reason when one fires."""
+        if self.reason is not None:
+            return True
+        
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            self.reason = 'cancelled'
+            return True
+        
+        if self.target_objective is not None and self.best_objective >= self.target_objective - 1e-9:
+            self.reason = 'target_objective'
+        elif self.deadline is not None or self.no_improvement_time is not None:
+            now = time.time()
+            if self.deadline is not None and now >= self.deadline:
+                self.reason = 'time_limit'
+            elif self.no_improvement_time is not None and \
+                    now - self.last_improvement_time >= self.no_improvement_time:
+                self.reason = 'no_improvement_time'
+        
+        return self.reason is not None
+    
+    def elapsed(self) -> float:
+        """Seconds since construction."""
+        return time.time() - self.start_time
+    
+    @contextmanager
+    def handle_sigint(self):
+        """
+        Turn the first Ctrl+C into a cooperative stop ('interrupted') so the
+        solver returns its best-so-far; a second Ctrl+C raises KeyboardInterrupt.
+        Only active in the main thread (signal handlers cannot be set elsewhere).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            yield self
+            return
+        
+        def handler(signum, frame):
+            if self.reason == 'interrupted':
+                raise KeyboardInterrupt
+            self.cancel('interrupted')
+        
+        previous = signal.signal(signal.SIGINT, handler)
+        try:
+            yield self
+        finally:
+            signal.signal(signal.SIGINT, previous)
@@ -3,12 +3,16 @@ Unit tests for Phase 2: Local Search and Multi-Start.
 """
 
 import sys
+import os
+import tempfile
 sys.path.insert(0, 'src')
 
 from instance_loader import MCLPInstance
 from greedy import greedy_heuristic
 from local_search import LocalSearch, run_local_search
 from multistart import multistart_local_search
+from termination import Termination
+import heuristic_cache
 
 
 def test_local_search_non_degradation():
@@ -108,10 +112,162 @@ def test_multistart_diversity():
     print(f"[OK] Multi-start diversity test passed ({unique_solutions} unique solutions from {len(history)} starts)")
 
 
+def test_multistart_parallel_determinism():
+    """Test that parallel multi-start matches serial mode exactly."""
+    instance = MCLPInstance("data/S2.json")
+    
+    K_serial, obj_serial, hist_serial = multistart_local_search(
+        instance, n_starts=8, base_seed=42, verbose=False
+    )
+    K_par, obj_par, hist_par = multistart_local_search(
+        instance, n_starts=8, base_seed=42, verbose=False, workers=3
+    )
+    
+    assert obj_par == obj_serial and K_par == K_serial, "Parallel result differs from serial"
+    assert [h['final_obj'] for h in hist_par] == [h['final_obj'] for h in hist_serial]
+    assert [h['facilities'] for h in hist_par] == [h['facilities'] for h in hist_serial]
+    
+    print(f"[OK] Parallel multi-start determinism test passed (obj={obj_par:.1f})")
+
+
+def test_multistart_parallel_time_limit():
+    """Test that parallel multi-start returns the workers' incumbents when the deadline fires."""
+    instance = MCLPInstance("data/XXL1.json")
+    
+    for options in ({}, {'allocation': 'adaptive'}):
+        K, obj, history = multistart_local_search(
+            instance, n_starts=10, base_seed=42, verbose=False, workers=2, time_limit=0.5, **options
+        )
+        
+        assert K is not None and obj > 0, f"No solution returned ({options})"
+        assert instance.is_feasible(K), "Returned solution is infeasible"
+        assert abs(instance.compute_coverage(K)[0] - obj) < 1e-6, "Objective does not match facilities"
+        assert 1 <= len(history) < 10, "Time limit did not stop the starts"
+    
+    print(f"[OK] Parallel multi-start time limit test passed (obj={obj:.1f})")
+
+
+def test_constructive_heuristic_cache():
+    """Test that greedy runs once per instance and callers get independent copies."""
+    instance = MCLPInstance("data/S1.json")
+    heuristic_cache.clear_cache()
+    
+    K1, obj1, _ = heuristic_cache.cached_greedy(instance)
+    K1.clear()  # Mutating a returned copy must not affect the cache
+    K2, obj2, _ = heuristic_cache.cached_greedy(instance)
+    K_ref, obj_ref, _ = greedy_heuristic(instance)
+    
+    assert K2 == K_ref and obj1 == obj2 == obj_ref
+    assert heuristic_cache.stats == {'hits': 1, 'misses': 1}
+    
+    # Multi-start with many perturbed starts reuses the cached greedy solution
+    multistart_local_search(instance, n_starts=8, base_seed=42, verbose=False)
+    assert heuristic_cache.stats['misses'] == 2  # + closest-neighbor
+    
+    print(f"[OK] Heuristic cache test passed (stats={heuristic_cache.stats})")
+
+
+def test_multistart_dedupe():
+    """Test that the solution archive skips duplicate starts without losing quality."""
+    instance = MCLPInstance("data/S1.json")
+    
+    K_ref, obj_ref, plain = multistart_local_search(
+        instance, n_starts=20, base_seed=42, verbose=False
+    )
+    K, obj, history = multistart_local_search(
+        instance, n_starts=20, base_seed=42, verbose=False, dedupe=True
+    )
+    
+    skipped = [h for h in history if h['archive_hit'] == 'start']
+    assert len(history) == 20 and all(h['archive_hit'] is None for h in plain)
+    assert skipped, "S1 has repeated perturbed starts that should be skipped"
+    assert all(h['num_moves'] == 0 and h['final_obj'] == h['initial_obj'] for h in skipped)
+    assert sum(h['num_moves'] for h in history) < sum(h['num_moves'] for h in plain)
+    assert obj == obj_ref and instance.is_feasible(K)
+    
+    print(f"[OK] Multi-start dedupe test passed ({len(skipped)} starts skipped)")
+
+
+def test_multistart_adaptive_allocation():
+    """Test that adaptive allocation logs its decisions and favours better methods."""
+    instance = MCLPInstance("data/L1.json")
+    
+    _, obj_fixed, fixed = multistart_local_search(
+        instance, n_starts=20, base_seed=42, verbose=False
+    )
+    K, obj, history = multistart_local_search(
+        instance, n_starts=20, base_seed=42, verbose=False, allocation='adaptive'
+    )
+    
+    assert all(h['allocation'] is None for h in fixed + history[:2])
+    decisions = [h['allocation'] for h in history[2:]]
+    assert all(d['method'] in d['scores'] for d in decisions)
+    assert history[2]['method'].startswith('Perturbed-Greedy') and history[3]['method'].startswith('Random')
+    
+    # Random starts rarely win on L1, so the race shifts starts to perturbed greedy
+    n_perturbed = sum(1 for d in decisions if d['method'] == 'Perturbed-Greedy')
+    assert n_perturbed > len(decisions) // 2
+    assert obj >= obj_fixed and instance.is_feasible(K)
+    
+    # Serial and batched-parallel decisions use only completed results
+    _, obj_par, parallel = multistart_local_search(
+        instance, n_starts=20, base_seed=42, verbose=False, allocation='adaptive', workers=2
+    )
+    assert len(parallel) == 20 and obj_par >= obj_fixed
+    
+    print(f"[OK] Adaptive allocation test passed ({n_perturbed}/{len(decisions)} perturbed-greedy)")
+
+
+def test_multistart_checkpoint_resume():
+    """Test that an interrupted multi-start run resumes to the uninterrupted result."""
+    instance = MCLPInstance("data/S1.json")
+    
+    class InterruptAfter(Termination):
+        """Simulates Ctrl+C on the n-th objective update (possibly mid-descent)."""
+        def __init__(self, n):
+            super().__init__()
+            self.n = n
+        
+        def update(self, objective, solution=None):
+            super().update(objective, solution)
+            self.n -= 1
+            if self.n == 0:
+                self.cancel('interrupted')
+    
+    # Serial descents also report to the termination, so the serial run stops mid-start
+    for options, n_updates in (({'dedupe': True}, 20), ({'allocation': 'adaptive', 'workers': 2}, 7)):
+        ref = multistart_local_search(instance, n_starts=12, base_seed=42, verbose=False, **options)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'ms.pkl')
+            _, _, partial = multistart_local_search(
+                instance, n_starts=12, base_seed=42, verbose=False, termination=InterruptAfter(n_updates),
+                checkpoint_path=path, **options
+            )
+            assert 0 < len(partial) < 12
+            
+            K, obj, history = multistart_local_search(
+                instance, n_starts=12, base_seed=42, verbose=False,
+                checkpoint_path=path, resume=True, **options
+            )
+        
+        assert (K, obj) == ref[:2]
+        assert [h['final_obj'] for h in history] == [h['final_obj'] for h in ref[2]]
+        assert [h['archive_hit'] for h in history] == [h['archive_hit'] for h in ref[2]]
+    
+    print(f"[OK] Multi-start checkpoint resume test passed (obj={obj:.1f})")
+
+
 if __name__ == "__main__":
     print("Running Phase 2 Tests...\n")
     test_local_search_non_degradation()
     test_delta_evaluation()
     test_multistart_improvement()
     test_multistart_diversity()
+    test_multistart_parallel_determinism()
+    test_multistart_parallel_time_limit()
+    test_constructive_heuristic_cache()
+    test_multistart_dedupe()
+    test_multistart_adaptive_allocation()
+    test_multistart_checkpoint_resume()
     print("\n[DONE] All Phase 2 tests passed!")
\ No newline at end of file
@@ -3,11 +3,20 @@ Unit tests for Phase 3: Tabu Search.
 """
 
 import sys
+import os
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, 'src')
 
 from instance_loader import MCLPInstance
 from multistart import multistart_local_search
-from tabu_search import run_tabu_search
+from tabu_search import TabuSearch, run_tabu_search, initial_solution
+from island_tabu import run_island_tabu_search
+from neighborhood import VectorizedNeighborhood
+from elite_pool import ElitePool, to_mask, from_mask, distance
+from termination import Termination
+from bounds import upper_bound
 
 
 def test_tabu_search_improvement():
@@ -58,6 +67,59 @@ def test_tabu_list_functionality():
     print(f"[OK] Tabu list test passed (avg size={avg_tabu_size:.1f})")
 
 
+def test_tabu_memory_active_count():
+    """Test that the running tabu count matches the expiry array."""
+    instance = MCLPInstance("data/test_tiny.json")
+    
+    ts = TabuSearch(instance, add_tenure=3, drop_tenure=1, seed=42)
+    ts.initialize_solution({1, 3})
+    
+    ts.apply_close(1)  # re-opening 1 forbidden for 3 iterations
+    ts.apply_open(0)   # closing 0 forbidden for 1 iteration
+    assert ts.is_tabu(1) and ts.is_tabu(0)
+    assert ts.tabu_active == 2
+    
+    for iteration in range(1, 6):
+        ts.advance_iteration(iteration)
+        expected = sum(1 for v in ts.tabu_until if v > iteration)
+        assert ts.tabu_active == expected, \
+            f"Active count drift at iter {iteration}: {ts.tabu_active} vs {expected}"
+    
+    assert not ts.is_tabu(0) and not ts.is_tabu(1)
+    
+    print("[OK] Tabu memory test passed")
+
+
+def test_trace_sampling():
+    """Test that sampled traces keep every new-best event, including intensification."""
+    import numpy as np
+    from search_trace import MOVE_CODES
+    
+    # A single candidate per move leaves improvements for intensification to find
+    instance = MCLPInstance("data/M2.json")
+    options = dict(max_iterations=1000, seed=42, verbose=False, candidate_list_size=1,
+                   intensification_freq=10, stagnation_limit=100)
+    
+    _, obj_full, full = run_tabu_search(instance, **options)
+    _, obj_sampled, sampled = run_tabu_search(instance, trace_sample_every=10, **options)
+    
+    assert obj_full == obj_sampled, "Sampling changed the search trajectory"
+    assert full.iterations == sampled.iterations
+    assert len(sampled) < len(full)
+    
+    full_bests = full['iteration'][full['new_best']].tolist()
+    sampled_bests = sampled['iteration'][sampled['new_best']].tolist()
+    assert full_bests == sampled_bests, "New-best events missing from sampled trace"
+    assert (sampled['move_type'][sampled['new_best']] == MOVE_CODES['intensify']).any()
+    
+    for trace, obj in ((full, obj_full), (sampled, obj_sampled)):
+        increases = np.flatnonzero(np.diff(trace['best_obj']) > 0) + 1
+        assert trace['new_best'][increases].all(), "Best improved on a row not marked new_best"
+        assert trace['best_obj'].max() == obj
+    
+    print(f"[OK] Trace sampling test passed ({len(sampled)}/{len(full)} rows kept)")
+
+
 def test_aspiration_criterion():
     """Test that aspiration criterion allows tabu moves that improve best."""
     instance = MCLPInstance("data/test_tiny.json")
@@ -106,6 +168,280 @@ def test_intensification():
     print(f"[OK] Intensification test passed (no_intens={obj_no_intens:.1f}, intens={obj_intens:.1f})")
 
 
+def test_intensification_in_place():
+    """Test that in-place intensification keeps coverage state consistent."""
+    instance = MCLPInstance("data/test_tiny.json")
+    
+    ts = TabuSearch(instance, seed=42)
+    ts.initialize_solution({2})
+    obj_before = ts.objective
+    
+    ts.intensify()
+    
+    recomputed_obj, recomputed_covered = instance.compute_coverage(ts.K)
+    assert ts.objective >= obj_before, "Intensification degraded current solution"
+    assert abs(ts.objective - recomputed_obj) < 0.01, "Objective drift after intensification"
+    assert ts.covered == recomputed_covered, "Coverage set mismatch after intensification"
+    assert instance.is_feasible(ts.K), "Intensification produced infeasible solution"
+    assert ts.tabu_active == 0, "Intensification moves should not be tabu"
+    
+    print(f"[OK] In-place intensification test passed ({obj_before:.1f} -> {ts.objective:.1f})")
+
+
+def test_termination_criteria():
+    """Test that time limit and target objective stop TS and multi-start early."""
+    instance = MCLPInstance("data/S1.json")
+    
+    # Time limit: returns best-so-far well before the iteration cap
+    termination = Termination(time_limit=0.2)
+    K_ts, obj_ts, history = run_tabu_search(
+        instance, max_iterations=100000, seed=42, verbose=False,
+        termination=termination
+    )
+    assert termination.reason == 'time_limit'
+    assert history.iterations < 100000
+    assert instance.is_feasible(K_ts)
+    
+    # Target objective: multi-start stops after the start that reaches it
+    termination = Termination(target_objective=1.0)
+    _, obj_ms, starts = multistart_local_search(
+        instance, n_starts=10, base_seed=42, verbose=False, termination=termination
+    )
+    assert termination.reason == 'target_objective'
+    assert len(starts) == 1 and obj_ms >= 1.0
+    
+    print(f"[OK] Termination test passed (TS iters={history.iterations}, MS starts={len(starts)})")
+
+
+def test_upper_bound_early_stop():
+    """Test that TS and multi-start stop once the incumbent is proven optimal."""
+    data = {
+        "name": "coverable",
+        "I": [0, 1, 2], "J": [0, 1, 2, 3],
+        "f": {"0": 1.0, "1": 1.0, "2": 5.0},
+        "d": {"0": 10, "1": 20, "2": 30, "3": 40},
+        "I_j": {"0": [0], "1": [0, 2], "2": [1, 2], "3": [1]},
+        "B": 2.0
+    }
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(data, f)
+    try:
+        instance = MCLPInstance(f.name)
+    finally:
+        os.remove(f.name)
+    
+    assert upper_bound(instance) == instance.total_demand
+    
+    K_ts, obj_ts, history = run_tabu_search(
+        instance, max_iterations=1000, seed=42, verbose=False
+    )
+    assert obj_ts == instance.total_demand
+    assert history.iterations <= 1, f"TS kept searching after proving optimality ({history.iterations} iters)"
+    
+    _, obj_ms, starts = multistart_local_search(
+        instance, n_starts=10, base_seed=42, verbose=False
+    )
+    assert obj_ms == instance.total_demand and len(starts) == 1
+    
+    # Bounds must dominate any heuristic solution
+    instance = MCLPInstance("data/S1.json")
+    _, obj_s1, _ = run_tabu_search(instance, max_iterations=100, seed=42, verbose=False)
+    assert upper_bound(instance) >= obj_s1
+    
+    print(f"[OK] Upper bound early stop test passed (TS iters={history.iterations})")
+
+
+def test_concurrent_ts_determinism():
+    """Test that TS runs in parallel threads reproduce their sequential results."""
+    instance = MCLPInstance("data/S2.json")
+    seeds = [42, 43, 44, 45]
+    
+    def solve(seed):
+        K, obj, _ = run_tabu_search(instance, max_iterations=150, seed=seed, verbose=False)
+        return sorted(K), obj
+    
+    sequential = [solve(seed) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=len(seeds)) as pool:
+        concurrent = list(pool.map(solve, seeds))
+    
+    assert concurrent == sequential, "Concurrent solves interfered with each other"
+    
+    print(f"[OK] Concurrent TS determinism test passed ({len(seeds)} threads)")
+
+
+def test_segmented_run_matches_run():
+    """Test that running TS in segments reproduces an uninterrupted run."""
+    instance = MCLPInstance("data/S2.json")
+    
+    K_ref, obj_ref, ref = run_tabu_search(instance, max_iterations=300, seed=42, verbose=False)
+    
+    ts = TabuSearch(instance, max_iterations=300, seed=42)
+    ts.initialize_solution(initial_solution(instance, 42))
+    for first in range(0, 300, 70):
+        ts.run_segment(first, min(first + 70, 300))
+    
+    assert ts.best_K == K_ref and ts.best_obj == obj_ref
+    assert ts.history['current_obj'].tolist() == ref['current_obj'].tolist()
+    
+    print(f"[OK] Segmented run test passed (obj={obj_ref:.1f})")
+
+
+def test_checkpoint_resume():
+    """Test that TS resumed from a checkpoint matches an uninterrupted run."""
+    instance = MCLPInstance("data/S2.json")
+    params = dict(max_iterations=400, elite_size=5, visited_size=1000, frequency_shake=True, seed=42)
+    
+    K_ref, obj_ref, ref = run_tabu_search(instance, verbose=False, **params)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ts.pkl')
+        
+        # Run 250 iterations, checkpoint, then "crash"
+        ts = TabuSearch(instance, **params)
+        ts.initialize_solution(initial_solution(instance, 42))
+        ts.run_segment(0, 250)
+        ts.save_checkpoint(path)
+        
+        K, obj, history = run_tabu_search(
+            instance, verbose=False, checkpoint_path=path, resume=True, **params
+        )
+        
+        # A finished checkpoint resumes to the same result without searching
+        K2, obj2, _ = run_tabu_search(
+            instance, verbose=False, checkpoint_path=path, resume=True, **params
+        )
+        
+        # Settings that change the trajectory are rejected
+        for changed in ({'seed': 7}, {'stagnation_limit': 50}, {'intensification_freq': 25},
+                        {'elite_size': 10}, {'visited_size': 2000}, {'frequency_shake': False},
+                        {'trace_sample_every': 5}):
+            try:
+                run_tabu_search(instance, verbose=False, checkpoint_path=path, resume=True,
+                                **dict(params, **changed))
+                assert False, f"Expected ValueError for a checkpoint with other {changed}"
+            except ValueError:
+                pass
+    
+    assert K == K_ref and obj == obj_ref
+    assert history['current_obj'].tolist() == ref['current_obj'].tolist()
+    assert K2 == K_ref and obj2 == obj_ref
+    
+    print(f"[OK] Checkpoint resume test passed (obj={obj_ref:.1f})")
+
+
+def test_island_tabu_search():
+    """Test island TS: migration, determinism, and no worse than its islands alone."""
+    instance = MCLPInstance("data/S2.json")
+    
+    K, obj, islands = run_island_tabu_search(
+        instance, n_islands=3, migration_interval=50, max_iterations=200,
+        seed=42, verbose=False
+    )
+    assert [h['seed'] for h in islands] == [42, 43, 44]
+    assert obj == max(h['best_obj'] for h in islands)
+    assert instance.is_feasible(K)
+    assert abs(instance.compute_coverage(K)[0] - obj) < 0.01
+    
+    # Synchronous migration makes the run reproducible
+    K2, obj2, islands2 = run_island_tabu_search(
+        instance, n_islands=3, migration_interval=50, max_iterations=200,
+        seed=42, verbose=False
+    )
+    assert K2 == K and [h['best_obj'] for h in islands2] == [h['best_obj'] for h in islands]
+    
+    # Each island is at least as good as the same search without migration
+    for h in islands:
+        _, obj_alone, _ = run_tabu_search(
+            instance, tenure=h['tenure'], max_iterations=50, seed=h['seed'], verbose=False
+        )
+        assert h['best_obj'] >= obj_alone
+    
+    print(f"[OK] Island TS test passed (obj={obj:.1f}, "
+          f"migrations={sum(h['migrations_accepted'] for h in islands)})")
+
+
+def test_vectorized_neighborhood():
+    """Test that the NumPy evaluator ranks moves like the reference, for any thread count."""
+    instance = MCLPInstance("data/L1.json")
+    
+    ts = TabuSearch(instance, seed=42)
+    ts.initialize_solution(initial_solution(instance, 42))
+    ts.shake()  # Move away from the greedy local optimum
+    
+    reference = sorted(ts.generate_candidate_moves(), key=lambda c: c[2], reverse=True)[:20]
+    single = VectorizedNeighborhood(instance, workers=1).candidate_moves(ts, 20)
+    threaded = VectorizedNeighborhood(instance, workers=4)
+    multi = threaded.candidate_moves(ts, 20)
+    threaded.close()
+    
+    assert [c[2] for c in single] == [c[2] for c in reference]
+    assert multi == single, "Thread count changed the candidate list"
+    
+    # Full searches are identical for any thread count
+    runs = [
+        run_tabu_search(instance, max_iterations=100, seed=42, verbose=False, neighborhood_workers=w)
+        for w in (1, 3)
+    ]
+    assert runs[0][:2] == runs[1][:2]
+    assert runs[0][2]['current_obj'].tolist() == runs[1][2]['current_obj'].tolist()
+    
+    print(f"[OK] Vectorized neighborhood test passed (obj={runs[0][1]:.1f})")
+
+
+def test_elite_pool_path_relinking():
+    """Test the elite pool bitmask ops and path relinking on stagnation."""
+    pool = ElitePool(capacity=2, min_distance=2)
+    assert from_mask(to_mask({0, 3, 7})) == {0, 3, 7}
+    assert distance(to_mask({0, 3, 7}), to_mask({0, 4, 7})) == 2
+    
+    assert pool.add({1, 2}, 10.0) and pool.add({5, 6}, 20.0)
+    assert not pool.add({1, 2}, 5.0), "Worse duplicate entered the pool"
+    assert pool.add({1, 3}, 15.0) and len(pool) == 2  # Replaces its near-duplicate {1, 2}
+    assert sorted(obj for obj, _ in pool.entries) == [15.0, 20.0]
+    
+    instance = MCLPInstance("data/L2.json")
+    ts = TabuSearch(instance, max_iterations=1500, stagnation_limit=60, seed=44,
+                    elite_size=10, neighborhood_workers=1)
+    ts.initialize_solution(initial_solution(instance, 44))
+    K, obj = ts.run(verbose=False)
+    
+    assert ts.relink_count > 0, "Stagnation never triggered path relinking"
+    assert instance.is_feasible(K) and abs(instance.compute_coverage(K)[0] - obj) < 0.01
+    assert abs(instance.compute_coverage(ts.K)[0] - ts.objective) < 0.01
+    
+    _, obj_shake, _ = run_tabu_search(instance, max_iterations=1500, stagnation_limit=60,
+                                      seed=44, verbose=False, neighborhood_workers=1)
+    assert obj >= obj_shake
+    
+    print(f"[OK] Path relinking test passed ({ts.relink_count} relinks, obj={obj:.1f} vs shake {obj_shake:.1f})")
+
+
+def test_zobrist_cycle_detection():
+    """Test the incremental solution hash and early diversification on cycling."""
+    instance = MCLPInstance("data/L1.json")
+    
+    ts = TabuSearch(instance, max_iterations=600, stagnation_limit=100, seed=42,
+                    visited_size=20000, frequency_shake=True, neighborhood_workers=1)
+    ts.initialize_solution(initial_solution(instance, 42))
+    K, obj = ts.run(verbose=False)
+    
+    # Incremental hash matches a from-scratch hash after all moves/shakes
+    assert ts.solution_hash == ts.zobrist.hash(ts.K)
+    assert ts.cycle_count > 0, "No cycle detected on L1"
+    assert sum(ts.open_frequency) >= ts.history.iterations
+    assert instance.is_feasible(K) and abs(instance.compute_coverage(K)[0] - obj) < 0.01
+    
+    # Cycle restarts come before the stagnation limit would have fired
+    plain = TabuSearch(instance, max_iterations=600, stagnation_limit=100, seed=42,
+                       neighborhood_workers=1)
+    plain.initialize_solution(initial_solution(instance, 42))
+    plain.run(verbose=False)
+    assert ts.restart_count > plain.restart_count
+    assert sum(plain.open_frequency) == 0, "Frequency memory updated without frequency_shake"
+    
+    print(f"[OK] Cycle detection test passed ({ts.cycle_count} cycles, {ts.restart_count} restarts)")
+
+
 def test_ts_feasibility():
     """Test that all TS solutions are feasible."""
     instance = MCLPInstance("data/test_tiny.json")
@@ -132,7 +468,19 @@ if __name__ == "__main__":
     print("Running Phase 3 Tests...\n")
     test_tabu_search_improvement()
     test_tabu_list_functionality()
+    test_tabu_memory_active_count()
+    test_trace_sampling()
     test_aspiration_criterion()
     test_intensification()
+    test_intensification_in_place()
+    test_termination_criteria()
+    test_upper_bound_early_stop()
+    test_concurrent_ts_determinism()
+    test_segmented_run_matches_run()
+    test_checkpoint_resume()
+    test_island_tabu_search()
+    test_vectorized_neighborhood()
+    test_elite_pool_path_relinking()
+    test_zobrist_cycle_detection()
     test_ts_feasibility()
     print("\n[DONE] All Phase 3 tests passed!")
\ No newline at end of file
@@ -60,7 +60,7 @@ def test_all_algorithms_executable():
     if os.path.exists(output_file):
         os.remove(output_file)
     
-    algorithms = ['greedy', 'cn', 'ls', 'ts']
+    algorithms = ['greedy', 'cn', 'ls', 'ts', 'compact', 'benders', 'lagrangian', 'bnb']
     
     for algo in algorithms:
         print(f"Testing {algo}...")
@@ -114,15 +114,333 @@ def test_csv_schema():
     assert df['objective'].dtype in [float, int], "objective should be numeric"
     assert df['seed'].dtype == int, "seed should be integer"
     
+    # A file with the older, shorter header gains the new columns instead of dropping them
+    old_columns = required_columns[:8] + ['num_moves', 'num_iterations', 'facilities']
+    with open(output_file, 'w', newline='') as f:
+        f.write(','.join(old_columns) + '\n')
+        f.write('old,1,greedy,1.0,2.0,0.1,1,1.0,0,0,3\n')
+    from run_mclp import result_row, write_rows
+    row = dict(result_row({'algorithm': 'ts', 'objective': 5.0, 'facilities': [1, 2]}, 'new', 42),
+               stop_reason='time_limit', upper_bound=6.0, gap=0.2)
+    write_rows([row], output_file)
+    df = pd.read_csv(output_file)
+    assert list(df.columns[:len(old_columns)]) == old_columns
+    assert {'stop_reason', 'upper_bound', 'gap', 'cache_hit'} <= set(df.columns)
+    assert df['instance'].tolist() == ['old', 'new'] and df['gap'].iloc[1] == 0.2
+    assert pd.isna(df['gap'].iloc[0])
+    from results_store import read_results
+    assert read_results(output_file)['cache_hit'].tolist() == [False, False]
+    
     print("[OK] CSV schema test passed")
     
     # Cleanup
     os.remove(output_file)
 
 
+def test_compact_model():
+    """Test that the compact MILP certifies optima and keeps its MIP start."""
+    from instance_loader import MCLPInstance
+    from compact_model import solve_compact
+    from heuristic_cache import cached_greedy
+    from tabu_search import run_tabu_search
+    
+    instance = MCLPInstance("data/M1.json")
+    K_greedy, obj_greedy, _ = cached_greedy(instance)
+    
+    K, obj, info = solve_compact(instance, warm_start=K_greedy)
+    assert info['status'] == 'optimal' and info['upper_bound'] == obj
+    assert instance.is_feasible(K) and abs(instance.compute_coverage(K)[0] - obj) < 0.01
+    
+    # No heuristic beats a proven optimum
+    _, obj_ts, _ = run_tabu_search(instance, max_iterations=300, seed=42, verbose=False)
+    assert obj >= obj_ts >= obj_greedy
+    
+    # A time-limited solve returns a bounded solution no worse than its start
+    instance = MCLPInstance("data/L2.json")
+    K_greedy, obj_greedy, _ = cached_greedy(instance)
+    K, obj, info = solve_compact(instance, time_limit=2, warm_start=K_greedy)
+    assert info['status'] in ('optimal', 'time_limit')
+    assert obj >= obj_greedy and info['upper_bound'] >= obj - 1e-6
+    
+    print(f"[OK] Compact model test passed (L2 obj={obj:.1f}, bound={info['upper_bound']:.1f})")
+
+
+def test_benders_decomposition():
+    """Test that Benders (single- and multi-cut) proves the compact model's optimum."""
+    from instance_loader import MCLPInstance
+    from compact_model import solve_compact
+    from benders import solve_benders, BendersMaster
+    from heuristic_cache import cached_greedy
+    
+    instance = MCLPInstance("data/M1.json")
+    _, obj_compact, _ = solve_compact(instance)
+    
+    for cut_groups in (1, None):
+        K, obj, info = solve_benders(instance, warm_start=cached_greedy(instance)[0], cut_groups=cut_groups)
+        assert info['status'] == 'optimal' and obj == obj_compact
+        assert abs(info['upper_bound'] - obj) < 1e-6
+        assert instance.is_feasible(K) and instance.compute_coverage(K)[0] == obj
+    
+    # Closed-form subproblems: cuts are tight at integer points
+    master = BendersMaster(instance, cut_groups=7)
+    x_val = master.to_vector(K)
+    constant, coef, value = master.subproblem(x_val)
+    assert abs(value - obj) < 1e-6 and abs((constant + coef @ x_val).sum() - obj) < 1e-6
+    
+    print(f"[OK] Benders test passed (obj={obj:.1f}, {info['cuts']} cuts)")
+
+
+def test_lagrangian_bound():
+    """Test that the Lagrangian bound is valid and tighter than the cheap bounds."""
+    from instance_loader import MCLPInstance
+    from lagrangian import solve_lagrangian
+    from compact_model import solve_compact
+    from bounds import upper_bound
+    
+    instance = MCLPInstance("data/M1.json")
+    _, obj_opt, _ = solve_compact(instance)
+    
+    K, obj, info = solve_lagrangian(instance)
+    assert obj_opt <= info['upper_bound'] < upper_bound(instance)
+    assert obj <= obj_opt
+    assert instance.is_feasible(K) and instance.compute_coverage(K)[0] == obj
+    
+    print(f"[OK] Lagrangian test passed (LB={obj:.1f}, UB={info['upper_bound']:.1f}, opt={obj_opt:.1f})")
+
+
+def test_mip_polishing():
+    """Test that MIP polishing improves a plateaued TS solution and never worsens it."""
+    from instance_loader import MCLPInstance
+    from tabu_search import run_tabu_search
+    from polish import polish
+    
+    instance = MCLPInstance("data/XL1.json")
+    K_ts, obj_ts, _ = run_tabu_search(instance, max_iterations=300, seed=42, verbose=False)
+    
+    K, obj, info = polish(instance, K_ts, seed=42)
+    assert info['initial_obj'] == obj_ts
+    assert obj > obj_ts and info['improvements'] > 0
+    assert instance.is_feasible(K) and instance.compute_coverage(K)[0] == obj
+    
+    # Polishing in run_algorithm shares the run's time limit instead of restarting it
+    import yaml
+    from run_mclp import run_algorithm
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    config['termination'] = {'time_limit': 2.0}
+    config['polish_params'] = dict(config['polish_params'], enabled=True)
+    result = run_algorithm('ts', instance, config, 42)
+    assert result['algorithm'].endswith('+polish') and result['runtime'] < 3.0
+    
+    print(f"[OK] MIP polishing test passed ({obj_ts:.1f} -> {obj:.1f})")
+
+
+def test_branch_and_bound():
+    """Test that the bitset branch-and-bound certifies the same optima as the MIP."""
+    from itertools import combinations
+    from instance_loader import MCLPInstance
+    from branch_and_bound import branch_and_bound
+    from compact_model import solve_compact
+    from heuristic_cache import cached_greedy
+    
+    # Brute force on the tiny instance
+    instance = MCLPInstance("data/test_tiny.json")
+    brute = max(
+        instance.compute_coverage(set(K))[0]
+        for r in range(len(instance.I) + 1) for K in combinations(instance.I, r)
+        if instance.is_feasible(set(K))
+    )
+    _, obj, info = branch_and_bound(instance)
+    assert obj == brute and info['status'] == 'optimal'
+    
+    for name in ("S1", "S2", "M1"):
+        instance = MCLPInstance(f"data/{name}.json")
+        K, obj, info = branch_and_bound(instance, incumbent=cached_greedy(instance)[0])
+        _, obj_mip, _ = solve_compact(instance)
+        assert info['status'] == 'optimal' and info['upper_bound'] == obj
+        assert obj == obj_mip
+        assert instance.is_feasible(K) and instance.compute_coverage(K)[0] == obj
+    
+    # Stopped early: the bound still covers the optimum
+    _, obj_partial, info = branch_and_bound(instance, node_limit=20)
+    assert info['status'] == 'node_limit' and obj_partial <= obj_mip <= info['upper_bound']
+    
+    print(f"[OK] Branch-and-bound test passed (M1 optimum {obj:.1f}, {info['nodes']} nodes)")
+
+
+def test_result_cache():
+    """Test that reproducible runs are served from the cache and verified."""
+    import pickle
+    import tempfile
+    import yaml
+    from instance_loader import MCLPInstance
+    from run_mclp import run_algorithm
+    from result_cache import open_cache
+    
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    config['ts_params'] = dict(config['ts_params'], max_iterations=300)
+    config['result_cache'] = {'enabled': True, 'path': os.path.join(tempfile.mkdtemp(), 'cache.db'), 'max_entries': 3}
+    instance = MCLPInstance("data/S1.json")
+    cache = open_cache(config)
+    
+    first = run_algorithm('ts', instance, config, 42)
+    again = run_algorithm('ts', instance, config, 42)
+    assert again.get('cache_hit') and not first.get('cache_hit')
+    assert again['facilities'] == first['facilities'] and again['objective'] == first['objective']
+    # Replays are marked in the results (their runtime is the original run's)
+    from run_mclp import result_row
+    assert result_row(again, instance.name, 42)['cache_hit'] is True
+    assert result_row(first, instance.name, 42)['cache_hit'] is False
+    
+    # Greedy does not depend on the seed; other TS seeds are separate entries
+    run_algorithm('greedy', instance, config, 42)
+    assert run_algorithm('greedy', instance, config, 43).get('cache_hit')
+    assert not run_algorithm('ts', instance, config, 43).get('cache_hit')
+    assert cache.stats['hits'] == 2 and len(cache) == 3
+    
+    # Size bound: the least recently used entry (TS seed 42) is evicted
+    run_algorithm('ts', instance, config, 44)
+    assert len(cache) == 3
+    assert run_algorithm('greedy', instance, config, 42).get('cache_hit')
+    assert not run_algorithm('ts', instance, config, 42).get('cache_hit')
+    
+    # Time-limited runs are never cached
+    limited = dict(config, termination={'time_limit': 60})
+    run_algorithm('ls', instance, limited, 42)
+    assert not run_algorithm('ls', instance, limited, 42).get('cache_hit')
+    
+    # An entry that no longer matches the instance is dropped and recomputed
+    key = cache.key(instance, 'ts', config, 42)
+    tampered = dict(first, objective=first['objective'] + 1)
+    with cache.conn:
+        cache.conn.execute("UPDATE cache SET result = ? WHERE key = ?", (pickle.dumps(tampered), key))
+    result = run_algorithm('ts', instance, config, 42)
+    assert not result.get('cache_hit') and result['objective'] == first['objective']
+    assert cache.stats['invalid'] == 1
+    
+    # The per-process cache is shared by solver threads (async API, services)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        threaded = list(pool.map(lambda seed: run_algorithm('ts', instance, config, seed), (42, 45)))
+    assert threaded[0].get('cache_hit') and threaded[0]['objective'] == first['objective']
+    assert not threaded[1].get('cache_hit')
+    assert run_algorithm('ts', instance, config, 45).get('cache_hit')
+    
+    print(f"[OK] Result cache test passed ({cache.stats})")
+
+
+def test_solver_service():
+    """Test the HTTP solver service against a localhost client."""
+    import json
+    import urllib.error
+    import urllib.request
+    import yaml
+    from solver_service import SolverService
+    
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    
+    def request(url, body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, data=data), timeout=60) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+    
+    with SolverService(config, port=0, workers=1) as service:
+        assert request(service.address + '/health') == (200, {'status': 'ok'})
+        
+        solve = {'instance': 'data/test_tiny.json', 'algorithm': 'ls', 'seed': 42,
+                 'time_limit': 30, 'params': {'ls_params': {'multistart_count': 5}}}
+        status, first = request(service.address + '/solve', solve)
+        assert status == 200 and first['objective'] == 142.0, first
+        assert first['instance_cache'] == 'miss' and first['stop_reason'] in ('completed', 'proven_optimal')
+        status, second = request(service.address + '/solve', dict(solve, algorithm='greedy'))
+        assert status == 200 and second['instance_cache'] == 'hit'
+        assert second['facilities'] == first['facilities']
+        
+        assert request(service.address + '/solve', dict(solve, algorithm='simplex'))[0] == 400
+        assert request(service.address + '/solve', dict(solve, instance='data/missing.json'))[0] == 400
+        
+        status, metrics = request(service.address + '/metrics')
+        assert status == 200 and metrics['completed'] == 2 and metrics['errors'] == 0
+        assert metrics['instance_cache'] == {'hits': 1, 'misses': 1}
+        assert metrics['latency']['max'] >= metrics['latency']['p50'] > 0
+    
+    print(f"[OK] Solver service test passed (p50 latency {metrics['latency']['p50'] * 1000:.1f} ms)")
+
+
+def test_async_solve():
+    """Test progress streaming, cancellation and concurrent deadlines of the async API."""
+    import asyncio
+    import threading
+    import time
+    import yaml
+    from instance_loader import MCLPInstance
+    from async_solve import solve, solve_result
+    
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    instance = MCLPInstance("data/M1.json")
+    
+    async def cancelled_run():
+        cancel = threading.Event()
+        events = []
+        async for event in solve(instance, 'ts', config, 42, cancel=cancel):
+            events.append(event)
+            cancel.set()  # Stop after the first event
+        return events
+    
+    async def closed_run(executor):
+        events = solve(instance, 'ts', config, 42, executor=executor)
+        first = await events.__anext__()
+        await events.aclose()  # Returns once the solver thread has stopped
+        return first
+    
+    async def concurrent_runs(deadline):
+        return await asyncio.gather(*(
+            solve_result(instance, 'ts', config, seed, deadline=deadline) for seed in (42, 43, 44)
+        ))
+    
+    events = asyncio.run(cancelled_run())
+    improvements = [e['objective'] for e in events if e['type'] == 'improvement']
+    assert events[-1]['type'] == 'result' and improvements
+    result = events[-1]['result']
+    assert result['stop_reason'] == 'cancelled'
+    assert result['objective'] == max(improvements) == improvements[-1]
+    assert instance.compute_coverage(set(result['facilities']))[0] == result['objective']
+    for event in events[:-1]:
+        assert instance.compute_coverage(set(event['facilities']))[0] == event['objective']
+    assert events[-2]['facilities'] == result['facilities']
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first = asyncio.run(closed_run(executor))
+        assert first['type'] == 'improvement' and first['facilities']
+        # The only executor thread is free again: nothing kept running after close
+        assert executor.submit(lambda: True).result(timeout=0.5)
+    
+    start = time.time()
+    results = asyncio.run(concurrent_runs(start + 1.0))
+    assert time.time() - start < 5.0
+    assert all(r['stop_reason'] == 'time_limit' and r['objective'] > 0 for r in results)
+    
+    print(f"[OK] Async solve test passed ({len(improvements)} improvements before cancel)")
+
+
 if __name__ == "__main__":
     print("Running Phase 4 Integration Tests...\n")
     test_pipeline_determinism()
     test_all_algorithms_executable()
     test_csv_schema()
+    test_compact_model()
+    test_benders_decomposition()
+    test_lagrangian_bound()
+    test_mip_polishing()
+    test_branch_and_bound()
+    test_result_cache()
+    test_solver_service()
+    test_async_solve()
     print("\n[DONE] All integration tests passed!")
\ No newline at end of file
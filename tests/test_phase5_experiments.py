@@ -110,6 +110,93 @@ def test_analysis_scripts_exist():
     print(f"[OK] All {len(scripts)} analysis scripts exist")
 
 
+def test_grid_experiment_runner():
+    """Test that the grid runner produces the rows of individual runs."""
+    import yaml
+    from instance_loader import MCLPInstance
+    from run_mclp import run_algorithm, result_row
+    from experiment_runner import expand_grid, run_grid
+    
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    
+    spec = {'experiments': [{
+        'name': 'small',
+        'instances': ['data/test_tiny.json', 'data/S1.json'],
+        'algorithms': ['greedy', 'ls', 'ts'],
+        'seeds': [42, 43],
+        'params': [{'ts_params': {'max_iterations': 200, 'tenure': 7}}]
+    }]}
+    jobs = expand_grid(spec)
+    assert len(jobs) == 12, "Wrong number of jobs"
+    
+    rows = run_grid(jobs, config, workers=2, verbose=False)
+    assert len(rows) == len(jobs), "Missing rows"
+    
+    # Same rows (apart from timing) as running each job on its own, in grid order
+    config['ts_params'] = dict(config['ts_params'], max_iterations=200, tenure=7)
+    instances = {}
+    for job, row in zip(jobs, rows):
+        instance = instances.setdefault(job.instance_path, MCLPInstance(job.instance_path))
+        expected = result_row(run_algorithm(job.algorithm, instance, config, job.seed), instance.name, job.seed)
+        for key in ('instance', 'seed', 'algorithm', 'objective', 'facilities', 'num_iterations'):
+            assert row[key] == expected[key], f"{job}: {key} differs"
+    
+    print(f"[OK] Grid runner test passed ({len(rows)} rows)")
+
+
+def test_results_store():
+    """Test that the results store is keyed, resumable and reads back as the CSV."""
+    import tempfile
+    import yaml
+    from instance_loader import MCLPInstance
+    from run_mclp import run_algorithm, result_row
+    from results_store import ResultsStore, result_key, read_results, SCHEMA
+    
+    with open('config.yaml', 'r') as f:
+        config = yaml.safe_load(f)
+    instance = MCLPInstance('data/test_tiny.json')
+    path = os.path.join(tempfile.mkdtemp(), 'results.db')
+    
+    # The config hash only covers sections the algorithm reads
+    other = dict(config, ts_params=dict(config['ts_params'], tenure=7))
+    assert result_key(instance, 'greedy', 42, config) == result_key(instance, 'greedy', 42, other)
+    assert result_key(instance, 'ts', 42, config) != result_key(instance, 'ts', 42, other)
+    
+    rows = {}
+    with ResultsStore(path, batch_size=2) as store:
+        for algorithm in ('greedy', 'ls'):
+            for seed in (42, 43):
+                key = result_key(instance, algorithm, seed, config)
+                rows[key] = result_row(run_algorithm(algorithm, instance, config, seed), instance.name, seed)
+                store.add(key, rows[key], config)
+        # Rerunning a key replaces its row
+        store.add(key, rows[key], config)
+    
+    with ResultsStore(path) as store:
+        assert store.completed_keys() == set(rows), "Stored keys differ"
+        assert len(store.query()) == 4, "Duplicate rows stored"
+        ls_rows = store.query(algorithm='local_search')
+        assert [row['seed'] for row in ls_rows] == [42, 43]
+        assert ls_rows[0]['facilities'] == rows[result_key(instance, 'ls', 42, config)]['facilities']
+    
+    df = read_results(path, algorithm='greedy')
+    assert len(df) == 2 and list(df['objective']) == [142.0, 142.0]
+    assert not df['cache_hit'].any()
+    
+    # A store created before the cache_hit column gains it on open
+    import sqlite3
+    old_path = os.path.join(os.path.dirname(path), 'old.db')
+    with sqlite3.connect(old_path) as conn:
+        conn.executescript(SCHEMA.replace('    cache_hit INTEGER,\n', ''))
+    with ResultsStore(old_path) as store:
+        store.add(key, dict(rows[key], cache_hit=True), config)
+    with ResultsStore(old_path) as store:
+        assert store.query()[0]['cache_hit'] is True
+    
+    print(f"[OK] Results store test passed ({len(rows)} runs)")
+
+
 if __name__ == "__main__":
     print("Running Phase 5 Experiment Tests...\n")
     test_instance_generation()
@@ -117,4 +204,6 @@ if __name__ == "__main__":
     test_dataset_generation_script()
     test_experiment_runner_exists()
     test_analysis_scripts_exist()
+    test_grid_experiment_runner()
+    test_results_store()
     print("\n[DONE] All Phase 5 tests passed!")
\ No newline at end of file